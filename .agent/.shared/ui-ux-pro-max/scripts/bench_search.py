@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Benchmark - relevance and latency for search, search_stack
+and DesignSystemGenerator.generate over a fixed set of labelled queries.
+
+Usage: python bench_search.py [--runs 20] [--queries bench_queries.json] [--output result.json]
+       python bench_search.py --compare before.json [--output after.json]
+
+Reports:
+  - p50/p95 latency per operation, with the search-result cache cleared before
+    every call (parsed CSVs/indexes stay warm, as in a daemon or batch run)
+  - cold load time and peak traced memory for a fresh run over all queries
+  - MRR@10 and nDCG@3 against the labelled relevant rows (binary relevance)
+
+JSON output is stable (sorted keys) so results can be diffed across commits.
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import core
+from core import CSV_CONFIG, search, search_stack, clear_cache
+from design_system import DesignSystemGenerator
+
+DEFAULT_QUERIES = Path(__file__).parent / "bench_queries.json"
+RETRIEVAL_DEPTH = 10
+# Rows are identified by their first output column, except where that column is a category
+KEY_COLUMNS = {"ux": "Issue", "react": "Issue", "web": "Issue", "stack": "Guideline"}
+
+
+def _key_column(case: dict) -> str:
+    if "stack" in case:
+        return KEY_COLUMNS["stack"]
+    return KEY_COLUMNS.get(case["domain"], CSV_CONFIG[case["domain"]]["output_cols"][0])
+
+
+def _run_case(case: dict, max_results: int) -> dict:
+    if "stack" in case:
+        return search_stack(case["query"], case["stack"], max_results)
+    return search(case["query"], case["domain"], max_results)
+
+
+def _percentile(samples: list, pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def _summary(samples: list) -> dict:
+    return {"n": len(samples), "p50_ms": round(_percentile(samples, 50), 4), "p95_ms": round(_percentile(samples, 95), 4)}
+
+
+# ============ RELEVANCE ============
+def _relevance(cases: list) -> dict:
+    """MRR@10 and nDCG@3 per labelled query and averaged."""
+    per_query = []
+    for case in cases:
+        key = _key_column(case)
+        relevant = set(case["relevant"])
+        ranked = [row.get(key, "") for row in _run_case(case, RETRIEVAL_DEPTH).get("results", [])]
+
+        first_hit = next((rank for rank, row_id in enumerate(ranked, 1) if row_id in relevant), None)
+        dcg = sum(1 / math.log2(rank + 1) for rank, row_id in enumerate(ranked[:3], 1) if row_id in relevant)
+        ideal = sum(1 / math.log2(rank + 1) for rank in range(1, min(3, len(relevant)) + 1))
+        per_query.append({
+            "query": case["query"],
+            "corpus": case.get("stack") or case["domain"],
+            "top3": ranked[:3],
+            "rr": round(1 / first_hit if first_hit else 0.0, 4),
+            "ndcg@3": round(dcg / ideal if ideal else 0.0, 4)
+        })
+    n = len(per_query) or 1
+    return {
+        "mrr@10": round(sum(q["rr"] for q in per_query) / n, 4),
+        "ndcg@3": round(sum(q["ndcg@3"] for q in per_query) / n, 4),
+        "per_query": per_query
+    }
+
+
+# ============ LATENCY / MEMORY ============
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def _cold_pass(cases: list, ds_queries: list) -> dict:
+    """One fresh pass over everything: total time and peak traced memory."""
+    clear_cache()
+    tracemalloc.start()
+    start = time.perf_counter()
+    for case in cases:
+        _run_case(case, core.MAX_RESULTS)
+    generator = DesignSystemGenerator()
+    for query in ds_queries:
+        generator.generate(query)
+    elapsed = (time.perf_counter() - start) * 1000
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"cold_total_ms": round(elapsed, 3), "peak_memory_kib": round(peak / 1024, 1)}
+
+
+def _latency(cases: list, ds_queries: list, runs: int) -> dict:
+    """Per-call latency with the search-result cache cleared before each call."""
+    samples = {"search": [], "search_stack": [], "generate": []}
+    generator = DesignSystemGenerator()
+    for _ in range(runs):
+        for case in cases:
+            clear_cache(corpora=False)
+            samples["search_stack" if "stack" in case else "search"].append(
+                _timed(lambda: _run_case(case, core.MAX_RESULTS)))
+        for query in ds_queries:
+            clear_cache(corpora=False)
+            samples["generate"].append(_timed(lambda: generator.generate(query)))
+    return {op: _summary(values) for op, values in samples.items() if values}
+
+
+def run(queries_path: Path, runs: int) -> dict:
+    with open(queries_path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    cases, ds_queries = spec["queries"], spec.get("design_system", [])
+
+    memory = _cold_pass(cases, ds_queries)
+    return {
+        "queries_file": queries_path.name,
+        "runs": runs,
+        "python": sys.version.split()[0],
+        "bm25_backend": core._bm25_class().__name__,
+        "latency": _latency(cases, ds_queries, runs),
+        "cold": memory,
+        "relevance": _relevance(cases)
+    }
+
+
+def _compare(before: dict, after: dict) -> list:
+    """Human-readable deltas between two benchmark reports."""
+    lines = []
+    for op, stats in after["latency"].items():
+        old = before.get("latency", {}).get(op)
+        if old:
+            for field in ("p50_ms", "p95_ms"):
+                lines.append(f"{op:<13} {field:<7} {old[field]:>9.3f} -> {stats[field]:>9.3f} ({(stats[field] / old[field] - 1) if old[field] else 0:+.0%})")
+    for field in ("cold_total_ms", "peak_memory_kib"):
+        if field in before.get("cold", {}):
+            lines.append(f"{'cold':<13} {field:<7} {before['cold'][field]:>9.1f} -> {after['cold'][field]:>9.1f}")
+    for field in ("mrr@10", "ndcg@3"):
+        if field in before.get("relevance", {}):
+            lines.append(f"{'relevance':<13} {field:<7} {before['relevance'][field]:>9.4f} -> {after['relevance'][field]:>9.4f}")
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max search relevance/latency benchmark")
+    parser.add_argument("--queries", type=Path, default=DEFAULT_QUERIES, help="Labelled query file (default: bench_queries.json)")
+    parser.add_argument("--runs", type=int, default=20, help="Latency samples per query (default: 20)")
+    parser.add_argument("--output", "-o", type=Path, default=None, help="Write the JSON report to this file")
+    parser.add_argument("--compare", type=Path, default=None, help="Print deltas against an earlier JSON report")
+    args = parser.parse_args()
+
+    report = run(args.queries, args.runs)
+    text = json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    if args.compare:
+        before = json.loads(args.compare.read_text(encoding="utf-8"))
+        print("\n".join(_compare(before, report)))
+    elif not args.output:
+        print(text)
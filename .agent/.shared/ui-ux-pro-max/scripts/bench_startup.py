@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Startup Benchmark - guards the cold-start cost of search.py
+
+Usage: python bench_startup.py [--runs 7] [--max-import-ms 80] [--max-wall-ms 200] [--json]
+
+Runs a plain domain search in fresh interpreters:
+  - once under `python -X importtime`, totalling the import cost of every
+    module search.py pulls in beyond bare interpreter startup
+  - --runs times for wall-clock, reported as the median minus the median of
+    an empty `python -c pass` so the budget is about our code, not the host
+
+Exits 1 if either budget is exceeded or the plain search imports a module it
+should not need (design_system, server, numpy).
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from statistics import median
+
+SCRIPT_DIR = Path(__file__).parent
+SEARCH_ARGS = ["search.py", "dark mode admin", "--domain", "color"]
+FORBIDDEN_MODULES = {"design_system", "server", "numpy"}
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _imports(argv: list) -> dict:
+    """Top-level module -> cumulative import microseconds for one -X importtime run."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", *argv], cwd=SCRIPT_DIR,
+                          capture_output=True, text=True, check=True)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            level = (len(match.group(3)) - 1) // 2
+            modules[match.group(4)] = (level, int(match.group(2)))
+    return modules
+
+
+def _wall_ms(argv: list, runs: int) -> float:
+    """Median wall-clock milliseconds of running argv in a fresh interpreter."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *argv], cwd=SCRIPT_DIR, capture_output=True, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return median(samples)
+
+
+def run(runs: int) -> dict:
+    """Measure import cost and wall-clock for a plain domain search."""
+    baseline = _imports(["-c", "pass"])
+    loaded = _imports(SEARCH_ARGS)
+    extra = {name: us for name, (level, us) in loaded.items() if name not in baseline and level == 0}
+
+    interpreter_ms = _wall_ms(["-c", "pass"], runs)
+    search_ms = _wall_ms(SEARCH_ARGS, runs)
+
+    return {
+        "command": " ".join(SEARCH_ARGS),
+        "import_ms": sum(extra.values()) / 1000,
+        "top_imports_ms": {name: us / 1000 for name, us in sorted(extra.items(), key=lambda x: -x[1])[:10]},
+        "forbidden_imports": sorted(FORBIDDEN_MODULES & set(loaded)),
+        "interpreter_ms": interpreter_ms,
+        "wall_ms": search_ms - interpreter_ms,
+        "runs": runs
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max search.py startup benchmark")
+    parser.add_argument("--runs", type=int, default=7, help="Wall-clock samples (default: 7)")
+    parser.add_argument("--max-import-ms", type=float, default=80.0, help="Import-time budget beyond interpreter startup")
+    parser.add_argument("--max-wall-ms", type=float, default=200.0, help="Wall-clock budget beyond interpreter startup")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    report = run(args.runs)
+    failures = []
+    if report["import_ms"] > args.max_import_ms:
+        failures.append(f"import time {report['import_ms']:.1f} ms > {args.max_import_ms:.0f} ms")
+    if report["wall_ms"] > args.max_wall_ms:
+        failures.append(f"wall clock {report['wall_ms']:.1f} ms > {args.max_wall_ms:.0f} ms")
+    if report["forbidden_imports"]:
+        failures.append(f"plain search imported {', '.join(report['forbidden_imports'])}")
+    report["failures"] = failures
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"## search.py startup ({report['command']})")
+        print(f"- Imports: {report['import_ms']:.1f} ms (budget {args.max_import_ms:.0f} ms)")
+        for name, ms in report["top_imports_ms"].items():
+            print(f"    {name:<20} {ms:7.1f} ms")
+        print(f"- Wall clock: {report['wall_ms']:.1f} ms over a {report['interpreter_ms']:.1f} ms bare interpreter "
+              f"(budget {args.max_wall_ms:.0f} ms, median of {report['runs']})")
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        if not failures:
+            print("OK")
+
+    sys.exit(1 if failures else 0)
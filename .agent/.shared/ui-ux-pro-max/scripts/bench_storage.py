@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Storage Benchmark - row storage cost for the whole data directory
+
+Usage: python bench_storage.py [--runs 5] [--json]
+
+Compares the previous row format (list of csv.DictReader dicts) with the
+columnar core.Table for every CSV under data/: median load time and memory
+retained after loading (tracemalloc), per file and in total.
+"""
+
+import argparse
+import csv
+import io
+import json
+import time
+import tracemalloc
+from statistics import median
+
+from core import DATA_DIR, Table
+
+
+def _load_dict_rows(text: str) -> list:
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def _load_table(text: str) -> Table:
+    return Table.from_csv_text(text)
+
+
+LOADERS = {"dict_rows": _load_dict_rows, "table": _load_table}
+
+
+def _measure(loader, text: str, runs: int) -> dict:
+    """Median load milliseconds and bytes retained by the loaded structure."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        loader(text)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    loaded = loader(text)
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del loaded
+    return {"load_ms": median(samples), "bytes": retained}
+
+
+def run(runs: int) -> dict:
+    """Benchmark every loader on every CSV in the data directory."""
+    files = {}
+    totals = {name: {"load_ms": 0.0, "bytes": 0} for name in LOADERS}
+    for path in sorted(DATA_DIR.rglob("*.csv")):
+        text = path.read_text(encoding="utf-8")
+        entry = {}
+        for name, loader in LOADERS.items():
+            entry[name] = _measure(loader, text, runs)
+            totals[name]["load_ms"] += entry[name]["load_ms"]
+            totals[name]["bytes"] += entry[name]["bytes"]
+        files[str(path.relative_to(DATA_DIR))] = entry
+    return {"runs": runs, "files": files, "total": totals}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max row storage benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Timing samples per file (default: 5)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    report = run(args.runs)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{'File':<28} {'dict ms':>8} {'dict KiB':>9} {'table ms':>9} {'table KiB':>10}")
+        print("-" * 68)
+        for name, entry in report["files"].items():
+            d, t = entry["dict_rows"], entry["table"]
+            print(f"{name:<28} {d['load_ms']:>8.2f} {d['bytes'] / 1024:>9.1f} {t['load_ms']:>9.2f} {t['bytes'] / 1024:>10.1f}")
+        print("-" * 68)
+        d, t = report["total"]["dict_rows"], report["total"]["table"]
+        print(f"{'TOTAL':<28} {d['load_ms']:>8.2f} {d['bytes'] / 1024:>9.1f} {t['load_ms']:>9.2f} {t['bytes'] / 1024:>10.1f}")
+        print(f"Table uses {t['bytes'] / d['bytes']:.0%} of the dict-row memory, loads in {t['load_ms'] / d['load_ms']:.0%} of the time")
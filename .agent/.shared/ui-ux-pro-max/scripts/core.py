@@ -5,14 +5,27 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
 import csv
+import hashlib
+import heapq
+import io
+import json
+import os
 import re
+import sys
+import threading
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
+INDEX_DIR = Path(__file__).parent.parent / ".index"
+INDEX_VERSION = 3
 MAX_RESULTS = 3
+# "python" (default) or "numpy"; numpy falls back to python when NumPy is missing
+BM25_BACKEND = os.environ.get("UIPRO_BM25_BACKEND", "python")
+SEARCH_CACHE_SIZE = 512
+CORPUS_CACHE_SIZE = 64
 
 CSV_CONFIG = {
     "style": {
@@ -96,122 +109,698 @@ _STACK_COLS = {
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
 
+# ============ TEXT ANALYSIS ============
+# Two-letter words worth dropping; other 2-letter tokens ("ui", "ux", "3d") are kept
+STOPWORDS = frozenset(["an", "as", "at", "be", "by", "do", "eg", "ie", "if", "in", "is", "it",
+                       "no", "of", "on", "or", "so", "to", "up", "us", "vs", "we"])
+PREFIX_MIN_LENGTH = 3
+FUZZY_MIN_LENGTH = 4
+MAX_EXPANSIONS = 5
+EXPANSION_WEIGHT = 0.5
+
+
+def split_words(text):
+    """Lowercase and split on punctuation/whitespace"""
+    return re.sub(r'[^\w\s]', ' ', str(text).lower()).split()
+
+
+def drop_noise(tokens):
+    """Drop single characters and short stopwords"""
+    return [t for t in tokens if len(t) > 1 and t not in STOPWORDS]
+
+
+def light_stem(token):
+    """Strip common English inflections: animations -> animation, categories -> category, loading -> load"""
+    if len(token) <= 3 or not token.isalpha():
+        return token
+    if token.endswith("ies") and len(token) > 4:
+        return token[:-3] + "y"
+    if token.endswith("sses"):
+        return token[:-2]
+    if token.endswith("ing") and len(token) > 5:
+        return token[:-3]
+    if token.endswith("ed") and len(token) > 4:
+        return token[:-2]
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def stem(tokens):
+    return [light_stem(t) for t in tokens]
+
+
+class Analyzer:
+    """split_words followed by a chain of token filters; the same chain runs at index and query time"""
+
+    def __init__(self, filters=(drop_noise, stem)):
+        self.filters = tuple(filters)
+
+    @property
+    def name(self):
+        """Identifies the chain in the on-disk index key"""
+        return "+".join(f.__name__ for f in self.filters)
+
+    def __call__(self, text):
+        tokens = split_words(text)
+        for token_filter in self.filters:
+            tokens = token_filter(tokens)
+        return tokens
+
+
+DEFAULT_ANALYZER = Analyzer()
+
+
+def _deletions(term):
+    """Every string one deletion away from term"""
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
     """BM25 ranking algorithm for text search"""
 
-    def __init__(self, k1=1.5, b=0.75):
+    def __init__(self, k1=1.5, b=0.75, analyzer=DEFAULT_ANALYZER):
         self.k1 = k1
         self.b = b
-        self.corpus = []
+        self.analyzer = analyzer
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
+        self.postings = {}
+        self.doc_norms = []
         self.N = 0
+        self._prefix_index = None
+        self._deletion_index = None
 
     def tokenize(self, text):
-        """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
+        """Run text through the analyzer chain"""
+        return self.analyzer(text)
 
     def fit(self, documents):
         """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        corpus = [self.tokenize(doc) for doc in documents]
+        self.N = len(corpus)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
+        self.doc_lengths = [len(doc) for doc in corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
 
-        for doc in self.corpus:
-            seen = set()
+        postings = defaultdict(list)
+        for doc_id, doc in enumerate(corpus):
+            term_freqs = defaultdict(int)
             for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+                term_freqs[word] += 1
+            for word, tf in term_freqs.items():
+                postings[word].append((doc_id, tf))
+        self.postings = dict(postings)
 
+        for word, plist in self.postings.items():
+            self.doc_freqs[word] = len(plist)
         for word, freq in self.doc_freqs.items():
             self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
 
-    def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
+        self._prepare()
+
+    def _prepare(self):
+        """Precompute the length-normalization term of the BM25 denominator"""
+        self.doc_norms = [self.k1 * (1 - self.b + self.b * doc_len / self.avgdl) for doc_len in self.doc_lengths]
+        self._prefix_index = None
+        self._deletion_index = None
+
+    def _build_expansion_indexes(self):
+        """Prefix -> terms and deletion-variant -> terms maps, built once per index on first need"""
+        by_df = sorted(self.postings, key=lambda term: (-len(self.postings[term]), term))
+        prefix_index = defaultdict(list)
+        deletion_index = defaultdict(list)
+        for term in by_df:
+            for end in range(PREFIX_MIN_LENGTH, len(term)):
+                prefix_index[term[:end]].append(term)
+            if len(term) >= FUZZY_MIN_LENGTH:
+                for variant in _deletions(term):
+                    deletion_index[variant].append(term)
+        self._deletion_index = dict(deletion_index)
+        self._prefix_index = dict(prefix_index)
+
+    def expand(self, token):
+        """
+        Vocabulary terms standing in for a query token: the token itself, else terms it is a
+        prefix of, else terms within one edit (symmetric-deletion lookup); most frequent first.
+        """
+        if token in self.idf:
+            return [(token, 1.0)]
+        if self._prefix_index is None:
+            self._build_expansion_indexes()
+        candidates = self._prefix_index.get(token, []) if len(token) >= PREFIX_MIN_LENGTH else []
+        if not candidates and len(token) >= FUZZY_MIN_LENGTH:
+            found = set(self._deletion_index.get(token, []))
+            for variant in _deletions(token):
+                if variant in self.idf:
+                    found.add(variant)
+                found.update(self._deletion_index.get(variant, []))
+            candidates = sorted(found, key=lambda term: (-len(self.postings[term]), term))
+        return [(term, EXPANSION_WEIGHT) for term in candidates[:MAX_EXPANSIONS]]
+
+    def query_terms(self, query):
+        """Per query token, the weighted vocabulary terms it expands to (possibly none)"""
+        return [self.expand(token) for token in self.tokenize(query)]
+
+    def to_dict(self):
+        """Serialize the fitted index (postings, lengths, IDF)"""
+        return {
+            "k1": self.k1,
+            "b": self.b,
+            "N": self.N,
+            "avgdl": self.avgdl,
+            "doc_lengths": self.doc_lengths,
+            "idf": self.idf,
+            "postings": self.postings
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restore a fitted index produced by to_dict"""
+        bm25 = cls(k1=data["k1"], b=data["b"])
+        bm25.N = data["N"]
+        bm25.avgdl = data["avgdl"]
+        bm25.doc_lengths = data["doc_lengths"]
+        bm25.idf = data["idf"]
+        bm25.postings = {word: [tuple(p) for p in plist] for word, plist in data["postings"].items()}
+        for word, plist in bm25.postings.items():
+            bm25.doc_freqs[word] = len(plist)
+        bm25._prepare()
+        return bm25
+
+    def score(self, query, top_k=None):
+        """Score documents containing query terms, best first (top_k via heap)"""
+        scores = defaultdict(float)
+        numerator_scale = self.k1 + 1
+
+        for expansions in self.query_terms(query):
+            for term, weight in expansions:
+                idf = self.idf[term] * weight
+                for doc_id, tf in self.postings[term]:
+                    scores[doc_id] += idf * (tf * numerator_scale) / (tf + self.doc_norms[doc_id])
+
+        # Ties keep corpus order, as with a stable sort
+        rank_key = lambda x: (x[1], -x[0])
+        if top_k is None:
+            return sorted(scores.items(), key=rank_key, reverse=True)
+        return heapq.nlargest(top_k, scores.items(), key=rank_key)
+
+    def max_score(self, query):
+        """
+        Upper bound of score(query) in this corpus: every query term at saturating tf.
+        Tokens with no matching or expanded term count at the IDF they'd have if they matched
+        one document, so a corpus that lacks query terms scores lower after normalization.
+        """
+        unseen_idf = log((self.N - 1 + 0.5) / (1 + 0.5) + 1) if self.N else 0.0
+        bound = 0.0
+        for expansions in self.query_terms(query):
+            bound += sum(self.idf[term] * weight for term, weight in expansions) if expansions else unseen_idf
+        return bound * (self.k1 + 1)
+
+    def score_many(self, queries, top_k=None):
+        """Score several queries; one ranked list per query"""
+        return [self.score(query, top_k) for query in queries]
+
+
+class NumpyBM25(BM25):
+    """BM25 with a CSR doc-term matrix; queries are scored as sparse mat-vec products"""
+
+    def _prepare(self):
+        super()._prepare()
+        np = _import_numpy()
+        self.vocab = {word: col for col, word in enumerate(self.postings)}
+        self.idf_vector = np.array([self.idf[word] for word in self.postings], dtype=np.float64)
+
+        rows = [[] for _ in range(self.N)]
+        for word, plist in self.postings.items():
+            col = self.vocab[word]
+            for doc_id, tf in plist:
+                rows[doc_id].append((col, tf))
+        self.indptr = np.zeros(self.N + 1, dtype=np.int64)
+        self.indptr[1:] = np.cumsum([len(row) for row in rows])
+        indices = [col for row in rows for col, _ in row]
+        tfs = np.array([tf for row in rows for _, tf in row], dtype=np.float64)
+        self.indices = np.array(indices, dtype=np.int64)
+        norms = np.repeat(np.array(self.doc_norms, dtype=np.float64), np.diff(self.indptr))
+        # Per-entry BM25 weight tf*(k1+1) / (tf + k1*(1-b+b*dl/avgdl)); the query supplies idf
+        self.data = tfs * (self.k1 + 1) / (tfs + norms)
+        self._nonempty_rows = np.flatnonzero(np.diff(self.indptr))
+
+    def _query_matrix(self, queries):
+        """Dense (vocab x queries) matrix of (expansion-weighted) idf, counting repeated tokens"""
+        np = _import_numpy()
+        matrix = np.zeros((len(self.vocab), len(queries)), dtype=np.float64)
+        for q, query in enumerate(queries):
+            for expansions in self.query_terms(query):
+                for term, weight in expansions:
+                    col = self.vocab[term]
+                    matrix[col, q] += self.idf_vector[col] * weight
+        return matrix
+
+    def _matmul(self, query_matrix):
+        """CSR (docs x vocab) @ dense (vocab x queries) -> (docs x queries)"""
+        np = _import_numpy()
+        scores = np.zeros((self.N, query_matrix.shape[1]), dtype=np.float64)
+        if len(self.data):
+            contributions = self.data[:, None] * query_matrix[self.indices]
+            scores[self._nonempty_rows] = np.add.reduceat(contributions, self.indptr[self._nonempty_rows], axis=0)
+        return scores
+
+    def _rank(self, scores, top_k):
+        """Matching documents best first, ties in corpus order"""
+        np = _import_numpy()
+        candidates = np.flatnonzero(scores > 0)
+        if top_k is not None and len(candidates) > top_k:
+            # Keep everything tied with the k-th score so tie-breaking stays by doc id
+            threshold = np.partition(scores[candidates], len(candidates) - top_k)[len(candidates) - top_k]
+            candidates = candidates[scores[candidates] >= threshold]
+        order = candidates[np.lexsort((candidates, -scores[candidates]))]
+        if top_k is not None:
+            order = order[:top_k]
+        return [(int(idx), float(scores[idx])) for idx in order]
+
+    def score(self, query, top_k=None):
+        """Score documents against query in one vectorized pass"""
+        return self.score_many([query], top_k)[0]
+
+    def score_many(self, queries, top_k=None):
+        """Score a batch of queries as a single sparse matrix product"""
+        if self.N == 0:
+            return [[] for _ in queries]
+        scores = self._matmul(self._query_matrix(queries))
+        return [self._rank(scores[:, q], top_k) for q in range(len(queries))]
 
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+def _import_numpy():
+    """NumPy module, or None when it isn't installed"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
 
-            scores.append((idx, score))
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+def _bm25_class():
+    """Scoring engine for BM25_BACKEND, falling back to pure Python without NumPy"""
+    if BM25_BACKEND == "numpy" and _import_numpy() is not None:
+        return NumpyBM25
+    return BM25
 
 
-# ============ SEARCH FUNCTIONS ============
-def _load_csv(filepath):
-    """Load CSV and return list of dicts"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+# ============ ROW STORAGE ============
+class Table:
+    """Column-oriented CSV storage: interned column names, one tuple per column, deduplicated values"""
+
+    __slots__ = ("columns", "_positions", "_values", "n_rows")
+
+    def __init__(self, columns, rows):
+        self.columns = tuple(sys.intern(col) for col in columns)
+        self._positions = {col: i for i, col in enumerate(self.columns)}
+        width = len(self.columns)
+        # Blank lines are skipped and short rows read as None, like csv.DictReader
+        rows = [row if len(row) == width else (row + [None] * width)[:width] for row in rows if row]
+        self.n_rows = len(rows)
+        # Repeated cell values (categories, severities, platforms) share one string object
+        self._values = []
+        for column in zip(*rows) if rows else [()] * width:
+            seen = {}
+            self._values.append(tuple([seen.setdefault(value, value) for value in column]))
+
+    @classmethod
+    def from_csv_text(cls, text):
+        reader = csv.reader(io.StringIO(text))
+        header = next(reader, [])
+        return cls(header, reader)
+
+    def __len__(self):
+        return self.n_rows
+
+    def __getitem__(self, idx):
+        return RowView(self, idx)
+
+    def __contains__(self, col):
+        return col in self._positions
+
+    def value(self, idx, col, default=None):
+        position = self._positions.get(col)
+        return default if position is None else self._values[position][idx]
+
+    def materialize(self, idx, cols):
+        """Plain dict of the requested columns for one row (only built for returned hits)"""
+        return {col: self._values[self._positions[col]][idx] for col in cols if col in self._positions}
+
+
+class RowView:
+    """Read-only dict-like view of one Table row"""
+
+    __slots__ = ("_table", "_idx")
+
+    def __init__(self, table, idx):
+        self._table = table
+        self._idx = idx
+
+    def get(self, col, default=None):
+        return self._table.value(self._idx, col, default)
+
+    def __getitem__(self, col):
+        if col not in self._table:
+            raise KeyError(col)
+        return self._table.value(self._idx, col)
+
+    def __contains__(self, col):
+        return col in self._table
+
+    def keys(self):
+        return self._table.columns
+
+
+# ============ INDEX PERSISTENCE ============
+def _index_path(filepath):
+    """On-disk index location for a data file (stacks/x.csv -> stacks__x.json)"""
+    filepath = Path(filepath)
+    try:
+        relative = filepath.relative_to(DATA_DIR)
+    except ValueError:
+        relative = Path(filepath.name)
+    return INDEX_DIR / ("__".join(relative.with_suffix("").parts) + ".json")
+
+
+def _index_key(raw, search_cols):
+    """Hash of CSV bytes + indexed columns + analyzer chain + index format version"""
+    digest = hashlib.sha256(raw)
+    digest.update(json.dumps([INDEX_VERSION, search_cols, DEFAULT_ANALYZER.name]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _read_index(index_path, key):
+    """Load a persisted index if it matches key, else None"""
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if payload.get("key") != key:
+        return None
+    return _bm25_class().from_dict(payload["bm25"])
+
+
+def _write_index(index_path, key, bm25):
+    """Atomically persist an index; silently skipped if the directory is read-only"""
+    import tempfile
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"key": key, "bm25": bm25.to_dict()}, f, separators=(",", ":"))
+            os.replace(tmp_path, index_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _document_text(data, idx, search_cols):
+    """Text indexed for one row: its search columns joined"""
+    return " ".join(str(data.value(idx, col, "")) for col in search_cols)
+
+
+def _load_indexed(filepath, search_cols):
+    """Load CSV rows (as a Table) plus a BM25 index, reusing the on-disk index when the CSV is unchanged"""
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    data = Table.from_csv_text(raw.decode('utf-8'))
+
+    key = _index_key(raw, search_cols)
+    index_path = _index_path(filepath)
+    bm25 = _read_index(index_path, key)
+    if bm25 is None:
+        # Build documents from search columns
+        documents = [_document_text(data, idx, search_cols) for idx in range(len(data))]
+        bm25 = _bm25_class()()
+        bm25.fit(documents)
+        _write_index(index_path, key, bm25)
+    return data, bm25
+
+
+# ============ IN-PROCESS CACHES ============
+class LRUCache:
+    """Thread-safe LRU mapping with hit/miss counters"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._data), "maxsize": self.maxsize}
+
+
+# (filepath, search_cols) -> (stat signature, Table, BM25)
+_corpus_cache = LRUCache(CORPUS_CACHE_SIZE)
+# (kind, domain/stack, file signature, normalized query, max_results) -> [(score, row)]
+_search_cache = LRUCache(SEARCH_CACHE_SIZE)
+
+
+def _file_signature(filepath):
+    """(mtime_ns, size) of a data file, or None if it is missing"""
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _get_corpus(filepath, search_cols):
+    """Parsed rows + index for a data file, shared process-wide until the file changes"""
+    signature = _file_signature(filepath)
+    key = (str(filepath), tuple(search_cols))
+    cached = _corpus_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2]
+    data, bm25 = _load_indexed(filepath, search_cols)
+    _corpus_cache.put(key, (signature, data, bm25))
+    return data, bm25
+
+
+def _normalize_query(query):
+    """Cache-key form of a query; tokenization is case- and whitespace-insensitive"""
+    return " ".join(str(query).lower().split())
+
+
+def _cached_results(key, compute):
+    """Memoize a scored result list, handing out copies so callers can't mutate the cache"""
+    results = _search_cache.get(key)
+    if results is None:
+        results = compute()
+        _search_cache.put(key, results)
+    return [(score, dict(row)) for score, row in results]
+
+
+def cache_info():
+    """Hit/miss counters for the search-result and parsed-corpus caches"""
+    return {"search": _search_cache.info(), "corpus": _corpus_cache.info()}
+
+
+def clear_cache(corpora=True):
+    """Drop in-process cached results, and parsed corpora unless corpora=False"""
+    _search_cache.clear()
+    if corpora:
+        _corpus_cache.clear()
 
 
+# ============ SEARCH FUNCTIONS ============
 def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
+    """Core search function using BM25; returns (score, row) pairs, best first"""
     if not filepath.exists():
         return []
 
-    data = _load_csv(filepath)
-
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+    data, bm25 = _get_corpus(filepath, search_cols)
 
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
+    # BM25 search; "quoted phrases" additionally require the analyzed words in sequence
+    phrases = [p for p in (bm25.tokenize(phrase) for phrase in re.findall(r'"([^"]+)"', query)) if p]
+    if phrases:
+        ranked = _filter_phrases(bm25.score(query), phrases, data, search_cols, bm25, max_results)
+    else:
+        ranked = bm25.score(query, top_k=max_results)
 
     # Get top results with score > 0
     results = []
-    for idx, score in ranked[:max_results]:
+    for idx, score in ranked:
         if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
+            results.append((score, data.materialize(idx, output_cols)))
 
     return results
 
 
+def _filter_phrases(ranked, phrases, data, search_cols, bm25, max_results):
+    """Walk ranked hits (all of which contain query terms), keeping those containing every phrase"""
+    kept = []
+    for idx, score in ranked:
+        tokens = bm25.tokenize(_document_text(data, idx, search_cols))
+        if all(_contains_sequence(tokens, phrase) for phrase in phrases):
+            kept.append((idx, score))
+            if len(kept) == max_results:
+                break
+    return kept
+
+
+def _contains_sequence(tokens, phrase):
+    n = len(phrase)
+    return any(tokens[i:i + n] == phrase for i in range(len(tokens) - n + 1))
+
+
+def _corpus_config(kind, name):
+    """(filepath, search_cols, output_cols) for a domain or stack corpus"""
+    if kind == "stack":
+        return DATA_DIR / STACK_CONFIG[name]["file"], _STACK_COLS["search_cols"], _STACK_COLS["output_cols"]
+    config = CSV_CONFIG.get(name, CSV_CONFIG["style"])
+    return DATA_DIR / config["file"], config["search_cols"], config["output_cols"]
+
+
+def _search_scored(kind, name, query, max_results):
+    """Cached (score, row) results for one domain or stack corpus"""
+    filepath, search_cols, output_cols = _corpus_config(kind, name)
+    # The file signature in the key retires cached results when the CSV is edited
+    return _cached_results(
+        (kind, name, _file_signature(filepath), _normalize_query(query), max_results),
+        lambda: _search_csv(filepath, search_cols, output_cols, query, max_results)
+    )
+
+
+def _score_bound(kind, name, query):
+    """BM25 upper bound for query in a corpus, used to normalize scores across corpora"""
+    filepath, search_cols, _ = _corpus_config(kind, name)
+    if not filepath.exists():
+        return 0.0
+    return _get_corpus(filepath, search_cols)[1].max_score(query)
+
+
+# ============ DOMAIN DETECTION ============
+DOMAIN_KEYWORDS = {
+    "color": ["color", "palette", "hex", "#", "rgb"],
+    "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
+    "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
+    "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
+    "prompt": ["prompt", "css", "implementation", "variable", "checklist", "tailwind"],
+    "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora"],
+    "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
+    "typography": ["font", "typography", "heading", "serif", "sans"],
+    "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
+    "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
+    "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
+}
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton: finds every keyword occurring in a text (substring semantics) in one pass"""
+
+    def __init__(self, keywords):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [set()]
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(set())
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.output[state].add(keyword)
+
+        # Breadth-first failure links (depth-1 states fail to the root); each state
+        # inherits the outputs of its failure state
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] |= self.output[self.fail[child]]
+
+    def matches(self, text):
+        """Set of keywords that occur anywhere in text"""
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            if self.output[state]:
+                found |= self.output[state]
+        return found
+
+
+_domain_matcher = None
+_keyword_domains = {}
+_domain_matcher_lock = threading.Lock()
+
+
+def _get_domain_matcher():
+    """Compile DOMAIN_KEYWORDS into one automaton on first use (once, even with concurrent callers)"""
+    global _domain_matcher, _keyword_domains
+    if _domain_matcher is None:
+        with _domain_matcher_lock:
+            if _domain_matcher is None:
+                keyword_domains = {}
+                for domain, keywords in DOMAIN_KEYWORDS.items():
+                    for kw in keywords:
+                        keyword_domains.setdefault(kw, []).append(domain)
+                # Publish the table before the matcher that other threads check for
+                _keyword_domains = keyword_domains
+                _domain_matcher = KeywordMatcher(keyword_domains)
+    return _domain_matcher
+
+
+def domain_scores(query):
+    """Distribution over domains (share of matched keywords), best first; ties keep DOMAIN_KEYWORDS order"""
+    counts = dict.fromkeys(DOMAIN_KEYWORDS, 0)
+    for kw in _get_domain_matcher().matches(query.lower()):
+        for domain in _keyword_domains[kw]:
+            counts[domain] += 1
+    total = sum(counts.values())
+    ranked = sorted(counts.items(), key=lambda x: x[1], reverse=True)
+    return {domain: (count / total if total else 0.0) for domain, count in ranked}
+
+
 def detect_domain(query):
     """Auto-detect the most relevant domain from query"""
-    query_lower = query.lower()
-
-    domain_keywords = {
-        "color": ["color", "palette", "hex", "#", "rgb"],
-        "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
-        "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
-        "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
-        "prompt": ["prompt", "css", "implementation", "variable", "checklist", "tailwind"],
-        "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora"],
-        "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
-        "typography": ["font", "typography", "heading", "serif", "sans"],
-        "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
-        "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
-        "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
-    }
-
-    scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in domain_keywords.items()}
-    best = max(scores, key=scores.get)
-    return best if scores[best] > 0 else "style"
+    best, score = next(iter(domain_scores(query).items()))
+    return best if score > 0 else "style"
 
 
 def search(query, domain=None, max_results=MAX_RESULTS):
@@ -225,7 +814,7 @@ def search(query, domain=None, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"File not found: {filepath}", "domain": domain}
 
-    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
+    results = [row for _, row in _search_scored("domain", domain, query, max_results)]
 
     return {
         "domain": domain,
@@ -246,7 +835,7 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"Stack file not found: {filepath}", "stack": stack}
 
-    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results)
+    results = [row for _, row in _search_scored("stack", stack, query, max_results)]
 
     return {
         "domain": "stack",
@@ -256,3 +845,70 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def _merge_normalized(groups, max_results):
+    """
+    Merge per-corpus (score, row) lists by score normalized to each corpus's BM25 upper bound.
+    groups: [(provenance dict, [(score, row)], bound)] in priority order; priority breaks ties.
+    """
+    merged = []
+    for priority, (provenance, scored, bound) in enumerate(groups):
+        for rank, (score, row) in enumerate(scored):
+            normalized = score / bound if bound else 0.0
+            merged.append((normalized, priority, rank, {**provenance, "score": round(normalized, 4), "result": row}))
+    merged.sort(key=lambda x: (-x[0], x[1], x[2]))
+    return [entry for *_, entry in merged[:max_results]]
+
+
+def search_multi(query, top_n=3, max_results=MAX_RESULTS):
+    """Fan a query out to its top_n detected domains and merge by normalized BM25 score"""
+    distribution = domain_scores(query)
+    domains = [domain for domain, score in distribution.items() if score > 0][:top_n] or ["style"]
+
+    groups = [
+        ({"domain": domain, "file": CSV_CONFIG[domain]["file"], "domain_score": round(distribution[domain], 4)},
+         _search_scored("domain", domain, query, max_results),
+         _score_bound("domain", domain, query))
+        for domain in domains
+    ]
+    results = _merge_normalized(groups, max_results)
+
+    return {
+        "domain": "multi",
+        "domains": domains,
+        "query": query,
+        "file": ", ".join(CSV_CONFIG[domain]["file"] for domain in domains),
+        "count": len(results),
+        "results": results
+    }
+
+
+def search_all(query, max_results=MAX_RESULTS, domains=None, stacks=None, workers=None):
+    """
+    Federated search: query every domain CSV and every stack file concurrently against the
+    shared in-process indexes, normalize scores per corpus and return a merged top-k with
+    provenance (domain or stack, file, normalized score) on each hit.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    targets = [("domain", d) for d in (CSV_CONFIG if domains is None else domains) if d in CSV_CONFIG]
+    targets += [("stack", s) for s in (STACK_CONFIG if stacks is None else stacks) if s in STACK_CONFIG]
+    targets = [(kind, name) for kind, name in targets if _corpus_config(kind, name)[0].exists()]
+
+    def run(target):
+        kind, name = target
+        provenance = {kind: name, "file": (STACK_CONFIG[name] if kind == "stack" else CSV_CONFIG[name])["file"]}
+        return provenance, _search_scored(kind, name, query, max_results), _score_bound(kind, name, query)
+
+    with ThreadPoolExecutor(max_workers=workers or min(8, len(targets) or 1)) as pool:
+        groups = list(pool.map(run, targets))
+    results = _merge_normalized(groups, max_results)
+
+    return {
+        "domain": "all",
+        "query": query,
+        "file": f"{len(targets)} files",
+        "count": len(results),
+        "results": results
+    }
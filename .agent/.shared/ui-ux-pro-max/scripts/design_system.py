@@ -11,14 +11,19 @@ Usage:
     # With persistence (Master + Overrides pattern)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
+
+    # Batch: many projects/pages sharing one set of loaded indexes
+    report = generate_batch(load_batch_manifest("manifest.json"), jobs=4)
 """
 
 import csv
+import hashlib
 import json
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search, DATA_DIR, KeywordMatcher, _file_signature
 
 
 # ============ CONFIGURATION ============
@@ -38,7 +43,21 @@ class DesignSystemGenerator:
     """Generates design system recommendations from aggregated searches."""
 
     def __init__(self):
-        self.reasoning_data = self._load_reasoning()
+        # (ui-reasoning.csv signature, rules, lookup index), replaced when the file changes
+        self._reasoning = None
+
+    def _current_reasoning(self) -> tuple:
+        signature = _file_signature(DATA_DIR / REASONING_FILE)
+        current = self._reasoning
+        if current is None or current[0] != signature:
+            rules = self._load_reasoning()
+            current = self._reasoning = (signature, rules, self._build_reasoning_index(rules))
+        return current
+
+    @property
+    def reasoning_data(self) -> list:
+        """Reasoning rules, loaded on first use and reloaded when ui-reasoning.csv changes."""
+        return self._current_reasoning()[1]
 
     def _load_reasoning(self) -> list:
         """Load reasoning rules from CSV."""
@@ -48,6 +67,44 @@ class DesignSystemGenerator:
         with open(filepath, 'r', encoding='utf-8') as f:
             return list(csv.DictReader(f))
 
+    @property
+    def reasoning_index(self) -> dict:
+        """Lookup tables compiled with reasoning_data (see _build_reasoning_index)."""
+        return self._current_reasoning()[2]
+
+    @staticmethod
+    def _build_reasoning_index(rules: list) -> dict:
+        """
+        Compile rules for _find_reasoning_rule. Each map keeps the first rule (in file order)
+        per key, matching the first-match order of the exact / partial / keyword passes.
+        """
+        exact = {}
+        keywords = {}
+        containing = {}
+        decision_rules = []
+        for idx, rule in enumerate(rules):
+            ui_cat = rule.get("UI_Category", "").lower()
+            exact.setdefault(ui_cat, idx)
+            # Every substring of the rule category, so "query inside rule" is one lookup
+            for i in range(len(ui_cat) + 1):
+                for j in range(i, len(ui_cat) + 1):
+                    containing.setdefault(ui_cat[i:j], idx)
+            for kw in ui_cat.replace("/", " ").replace("-", " ").split():
+                keywords.setdefault(kw, idx)
+            try:
+                decision_rules.append(json.loads(rule.get("Decision_Rules", "{}")))
+            except json.JSONDecodeError:
+                decision_rules.append({})
+        return {
+            "exact": exact,
+            "keywords": keywords,
+            "containing": containing,
+            "category_matcher": KeywordMatcher([ui_cat for ui_cat in exact if ui_cat]),
+            "keyword_matcher": KeywordMatcher(keywords),
+            "decision_rules": decision_rules,
+            "resolved": {}
+        }
+
     def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
         """Execute searches across multiple domains."""
         results = {}
@@ -61,35 +118,41 @@ class DesignSystemGenerator:
                 results[domain] = search(query, domain, config["max_results"])
         return results
 
-    def _find_reasoning_rule(self, category: str) -> dict:
-        """Find matching reasoning rule for a category."""
+    def _find_reasoning_index(self, category: str):
+        """Index of the matching reasoning rule for a category, or None."""
+        index = self.reasoning_index
         category_lower = category.lower()
+        if category_lower in index["resolved"]:
+            return index["resolved"][category_lower]
+
+        # Exact match first
+        found = index["exact"].get(category_lower)
+        if found is None:
+            # Partial match: rule category inside the query category (one automaton pass),
+            # or the query category inside a rule category (substring lookup)
+            partial = [index["exact"][ui_cat] for ui_cat in index["category_matcher"].matches(category_lower)]
+            partial += [index["exact"].get(""), index["containing"].get(category_lower)]
+            partial = [idx for idx in partial if idx is not None]
+            if partial:
+                found = min(partial)
+            else:
+                # Keyword match
+                matched = [index["keywords"][kw] for kw in index["keyword_matcher"].matches(category_lower)]
+                found = min(matched) if matched else None
 
-        # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
-
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
+        index["resolved"][category_lower] = found
+        return found
 
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
-
-        return {}
+    def _find_reasoning_rule(self, category: str) -> dict:
+        """Find matching reasoning rule for a category."""
+        idx = self._find_reasoning_index(category)
+        return self.reasoning_data[idx] if idx is not None else {}
 
     def _apply_reasoning(self, category: str, search_results: dict) -> dict:
         """Apply reasoning rules to search results."""
-        rule = self._find_reasoning_rule(category)
+        idx = self._find_reasoning_index(category)
 
-        if not rule:
+        if idx is None:
             return {
                 "pattern": "Hero + Features + CTA",
                 "style_priority": ["Minimalism", "Flat Design"],
@@ -101,12 +164,9 @@ class DesignSystemGenerator:
                 "severity": "MEDIUM"
             }
 
-        # Parse decision rules JSON
-        decision_rules = {}
-        try:
-            decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
-        except json.JSONDecodeError:
-            pass
+        rule = self.reasoning_data[idx]
+        # Decision_Rules JSON is parsed once per rule when the index is built
+        decision_rules = dict(self.reasoning_index["decision_rules"][idx])
 
         return {
             "pattern": rule.get("Recommended_Pattern", ""),
@@ -239,8 +299,8 @@ class DesignSystemGenerator:
 # ============ OUTPUT FORMATTERS ============
 BOX_WIDTH = 90  # Wider box for more content
 
-def format_ascii_box(design_system: dict) -> str:
-    """Format design system as ASCII box with emojis (MCP-style)."""
+def iter_ascii_box(design_system: dict):
+    """Yield the design system as ASCII box lines with emojis (MCP-style)."""
     project = design_system.get("project_name", "PROJECT")
     pattern = design_system.get("pattern", {})
     style = design_system.get("style", {})
@@ -272,80 +332,79 @@ def format_ascii_box(design_system: dict) -> str:
     sections = [s.strip() for s in sections if s.strip()]
 
     # Build output lines
-    lines = []
     w = BOX_WIDTH - 1
 
-    lines.append("+" + "-" * w + "+")
-    lines.append(f"|  TARGET: {project} - RECOMMENDED DESIGN SYSTEM".ljust(BOX_WIDTH) + "|")
-    lines.append("+" + "-" * w + "+")
-    lines.append("|" + " " * BOX_WIDTH + "|")
+    yield "+" + "-" * w + "+"
+    yield f"|  TARGET: {project} - RECOMMENDED DESIGN SYSTEM".ljust(BOX_WIDTH) + "|"
+    yield "+" + "-" * w + "+"
+    yield "|" + " " * BOX_WIDTH + "|"
 
     # Pattern section
-    lines.append(f"|  PATTERN: {pattern.get('name', '')}".ljust(BOX_WIDTH) + "|")
+    yield f"|  PATTERN: {pattern.get('name', '')}".ljust(BOX_WIDTH) + "|"
     if pattern.get('conversion'):
-        lines.append(f"|     Conversion: {pattern.get('conversion', '')}".ljust(BOX_WIDTH) + "|")
+        yield f"|     Conversion: {pattern.get('conversion', '')}".ljust(BOX_WIDTH) + "|"
     if pattern.get('cta_placement'):
-        lines.append(f"|     CTA: {pattern.get('cta_placement', '')}".ljust(BOX_WIDTH) + "|")
-    lines.append("|     Sections:".ljust(BOX_WIDTH) + "|")
+        yield f"|     CTA: {pattern.get('cta_placement', '')}".ljust(BOX_WIDTH) + "|"
+    yield "|     Sections:".ljust(BOX_WIDTH) + "|"
     for i, section in enumerate(sections, 1):
-        lines.append(f"|       {i}. {section}".ljust(BOX_WIDTH) + "|")
-    lines.append("|" + " " * BOX_WIDTH + "|")
+        yield f"|       {i}. {section}".ljust(BOX_WIDTH) + "|"
+    yield "|" + " " * BOX_WIDTH + "|"
 
     # Style section
-    lines.append(f"|  STYLE: {style.get('name', '')}".ljust(BOX_WIDTH) + "|")
+    yield f"|  STYLE: {style.get('name', '')}".ljust(BOX_WIDTH) + "|"
     if style.get("keywords"):
         for line in wrap_text(f"Keywords: {style.get('keywords', '')}", "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
+            yield line.ljust(BOX_WIDTH) + "|"
     if style.get("best_for"):
         for line in wrap_text(f"Best For: {style.get('best_for', '')}", "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
+            yield line.ljust(BOX_WIDTH) + "|"
     if style.get("performance") or style.get("accessibility"):
         perf_a11y = f"Performance: {style.get('performance', '')} | Accessibility: {style.get('accessibility', '')}"
-        lines.append(f"|     {perf_a11y}".ljust(BOX_WIDTH) + "|")
-    lines.append("|" + " " * BOX_WIDTH + "|")
+        yield f"|     {perf_a11y}".ljust(BOX_WIDTH) + "|"
+    yield "|" + " " * BOX_WIDTH + "|"
 
     # Colors section
-    lines.append("|  COLORS:".ljust(BOX_WIDTH) + "|")
-    lines.append(f"|     Primary:    {colors.get('primary', '')}".ljust(BOX_WIDTH) + "|")
-    lines.append(f"|     Secondary:  {colors.get('secondary', '')}".ljust(BOX_WIDTH) + "|")
-    lines.append(f"|     CTA:        {colors.get('cta', '')}".ljust(BOX_WIDTH) + "|")
-    lines.append(f"|     Background: {colors.get('background', '')}".ljust(BOX_WIDTH) + "|")
-    lines.append(f"|     Text:       {colors.get('text', '')}".ljust(BOX_WIDTH) + "|")
+    yield "|  COLORS:".ljust(BOX_WIDTH) + "|"
+    yield f"|     Primary:    {colors.get('primary', '')}".ljust(BOX_WIDTH) + "|"
+    yield f"|     Secondary:  {colors.get('secondary', '')}".ljust(BOX_WIDTH) + "|"
+    yield f"|     CTA:        {colors.get('cta', '')}".ljust(BOX_WIDTH) + "|"
+    yield f"|     Background: {colors.get('background', '')}".ljust(BOX_WIDTH) + "|"
+    yield f"|     Text:       {colors.get('text', '')}".ljust(BOX_WIDTH) + "|"
     if colors.get("notes"):
         for line in wrap_text(f"Notes: {colors.get('notes', '')}", "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
-    lines.append("|" + " " * BOX_WIDTH + "|")
+            yield line.ljust(BOX_WIDTH) + "|"
+    yield "|" + " " * BOX_WIDTH + "|"
 
     # Typography section
-    lines.append(f"|  TYPOGRAPHY: {typography.get('heading', '')} / {typography.get('body', '')}".ljust(BOX_WIDTH) + "|")
+    yield f"|  TYPOGRAPHY: {typography.get('heading', '')} / {typography.get('body', '')}".ljust(BOX_WIDTH) + "|"
     if typography.get("mood"):
         for line in wrap_text(f"Mood: {typography.get('mood', '')}", "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
+            yield line.ljust(BOX_WIDTH) + "|"
     if typography.get("best_for"):
         for line in wrap_text(f"Best For: {typography.get('best_for', '')}", "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
+            yield line.ljust(BOX_WIDTH) + "|"
     if typography.get("google_fonts_url"):
-        lines.append(f"|     Google Fonts: {typography.get('google_fonts_url', '')}".ljust(BOX_WIDTH) + "|")
+        yield f"|     Google Fonts: {typography.get('google_fonts_url', '')}".ljust(BOX_WIDTH) + "|"
     if typography.get("css_import"):
-        lines.append(f"|     CSS Import: {typography.get('css_import', '')[:70]}...".ljust(BOX_WIDTH) + "|")
-    lines.append("|" + " " * BOX_WIDTH + "|")
+        yield f"|     CSS Import: {typography.get('css_import', '')[:70]}...".ljust(BOX_WIDTH) + "|"
+    yield "|" + " " * BOX_WIDTH + "|"
 
     # Key Effects section
     if effects:
-        lines.append("|  KEY EFFECTS:".ljust(BOX_WIDTH) + "|")
+        yield "|  KEY EFFECTS:".ljust(BOX_WIDTH) + "|"
         for line in wrap_text(effects, "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
-        lines.append("|" + " " * BOX_WIDTH + "|")
+            yield line.ljust(BOX_WIDTH) + "|"
+        yield "|" + " " * BOX_WIDTH + "|"
 
     # Anti-patterns section
     if anti_patterns:
-        lines.append("|  AVOID (Anti-patterns):".ljust(BOX_WIDTH) + "|")
+        yield "|  AVOID (Anti-patterns):".ljust(BOX_WIDTH) + "|"
         for line in wrap_text(anti_patterns, "|     ", BOX_WIDTH):
-            lines.append(line.ljust(BOX_WIDTH) + "|")
-        lines.append("|" + " " * BOX_WIDTH + "|")
+            yield line.ljust(BOX_WIDTH) + "|"
+        yield "|" + " " * BOX_WIDTH + "|"
 
     # Pre-Delivery Checklist section
-    lines.append("|  PRE-DELIVERY CHECKLIST:".ljust(BOX_WIDTH) + "|")
+    yield "|  PRE-DELIVERY CHECKLIST:".ljust(BOX_WIDTH) + "|"
     checklist_items = [
         "[ ] No emojis as icons (use SVG: Heroicons/Lucide)",
         "[ ] cursor-pointer on all clickable elements",
@@ -356,16 +415,19 @@ def format_ascii_box(design_system: dict) -> str:
         "[ ] Responsive: 375px, 768px, 1024px, 1440px"
     ]
     for item in checklist_items:
-        lines.append(f"|     {item}".ljust(BOX_WIDTH) + "|")
-    lines.append("|" + " " * BOX_WIDTH + "|")
+        yield f"|     {item}".ljust(BOX_WIDTH) + "|"
+    yield "|" + " " * BOX_WIDTH + "|"
 
-    lines.append("+" + "-" * w + "+")
+    yield "+" + "-" * w + "+"
 
-    return "\n".join(lines)
 
+def format_ascii_box(design_system: dict) -> str:
+    """Format design system as ASCII box with emojis (MCP-style)."""
+    return "\n".join(iter_ascii_box(design_system))
 
-def format_markdown(design_system: dict) -> str:
-    """Format design system as markdown."""
+
+def iter_markdown(design_system: dict):
+    """Yield the design system as markdown lines."""
     project = design_system.get("project_name", "PROJECT")
     pattern = design_system.get("pattern", {})
     style = design_system.get("style", {})
@@ -374,93 +436,117 @@ def format_markdown(design_system: dict) -> str:
     effects = design_system.get("key_effects", "")
     anti_patterns = design_system.get("anti_patterns", "")
 
-    lines = []
-    lines.append(f"## Design System: {project}")
-    lines.append("")
+    yield f"## Design System: {project}"
+    yield ""
 
     # Pattern section
-    lines.append("### Pattern")
-    lines.append(f"- **Name:** {pattern.get('name', '')}")
+    yield "### Pattern"
+    yield f"- **Name:** {pattern.get('name', '')}"
     if pattern.get('conversion'):
-        lines.append(f"- **Conversion Focus:** {pattern.get('conversion', '')}")
+        yield f"- **Conversion Focus:** {pattern.get('conversion', '')}"
     if pattern.get('cta_placement'):
-        lines.append(f"- **CTA Placement:** {pattern.get('cta_placement', '')}")
+        yield f"- **CTA Placement:** {pattern.get('cta_placement', '')}"
     if pattern.get('color_strategy'):
-        lines.append(f"- **Color Strategy:** {pattern.get('color_strategy', '')}")
-    lines.append(f"- **Sections:** {pattern.get('sections', '')}")
-    lines.append("")
+        yield f"- **Color Strategy:** {pattern.get('color_strategy', '')}"
+    yield f"- **Sections:** {pattern.get('sections', '')}"
+    yield ""
 
     # Style section
-    lines.append("### Style")
-    lines.append(f"- **Name:** {style.get('name', '')}")
+    yield "### Style"
+    yield f"- **Name:** {style.get('name', '')}"
     if style.get('keywords'):
-        lines.append(f"- **Keywords:** {style.get('keywords', '')}")
+        yield f"- **Keywords:** {style.get('keywords', '')}"
     if style.get('best_for'):
-        lines.append(f"- **Best For:** {style.get('best_for', '')}")
+        yield f"- **Best For:** {style.get('best_for', '')}"
     if style.get('performance') or style.get('accessibility'):
-        lines.append(f"- **Performance:** {style.get('performance', '')} | **Accessibility:** {style.get('accessibility', '')}")
-    lines.append("")
+        yield f"- **Performance:** {style.get('performance', '')} | **Accessibility:** {style.get('accessibility', '')}"
+    yield ""
 
     # Colors section
-    lines.append("### Colors")
-    lines.append(f"| Role | Hex |")
-    lines.append(f"|------|-----|")
-    lines.append(f"| Primary | {colors.get('primary', '')} |")
-    lines.append(f"| Secondary | {colors.get('secondary', '')} |")
-    lines.append(f"| CTA | {colors.get('cta', '')} |")
-    lines.append(f"| Background | {colors.get('background', '')} |")
-    lines.append(f"| Text | {colors.get('text', '')} |")
+    yield "### Colors"
+    yield f"| Role | Hex |"
+    yield f"|------|-----|"
+    yield f"| Primary | {colors.get('primary', '')} |"
+    yield f"| Secondary | {colors.get('secondary', '')} |"
+    yield f"| CTA | {colors.get('cta', '')} |"
+    yield f"| Background | {colors.get('background', '')} |"
+    yield f"| Text | {colors.get('text', '')} |"
     if colors.get("notes"):
-        lines.append(f"\n*Notes: {colors.get('notes', '')}*")
-    lines.append("")
+        yield f"\n*Notes: {colors.get('notes', '')}*"
+    yield ""
 
     # Typography section
-    lines.append("### Typography")
-    lines.append(f"- **Heading:** {typography.get('heading', '')}")
-    lines.append(f"- **Body:** {typography.get('body', '')}")
+    yield "### Typography"
+    yield f"- **Heading:** {typography.get('heading', '')}"
+    yield f"- **Body:** {typography.get('body', '')}"
     if typography.get("mood"):
-        lines.append(f"- **Mood:** {typography.get('mood', '')}")
+        yield f"- **Mood:** {typography.get('mood', '')}"
     if typography.get("best_for"):
-        lines.append(f"- **Best For:** {typography.get('best_for', '')}")
+        yield f"- **Best For:** {typography.get('best_for', '')}"
     if typography.get("google_fonts_url"):
-        lines.append(f"- **Google Fonts:** {typography.get('google_fonts_url', '')}")
+        yield f"- **Google Fonts:** {typography.get('google_fonts_url', '')}"
     if typography.get("css_import"):
-        lines.append(f"- **CSS Import:**")
-        lines.append(f"```css")
-        lines.append(f"{typography.get('css_import', '')}")
-        lines.append(f"```")
-    lines.append("")
+        yield f"- **CSS Import:**"
+        yield f"```css"
+        yield f"{typography.get('css_import', '')}"
+        yield f"```"
+    yield ""
 
     # Key Effects section
     if effects:
-        lines.append("### Key Effects")
-        lines.append(f"{effects}")
-        lines.append("")
+        yield "### Key Effects"
+        yield f"{effects}"
+        yield ""
 
     # Anti-patterns section
     if anti_patterns:
-        lines.append("### Avoid (Anti-patterns)")
+        yield "### Avoid (Anti-patterns)"
         newline_bullet = '\n- '
-        lines.append(f"- {anti_patterns.replace(' + ', newline_bullet)}")
-        lines.append("")
+        yield f"- {anti_patterns.replace(' + ', newline_bullet)}"
+        yield ""
 
     # Pre-Delivery Checklist section
-    lines.append("### Pre-Delivery Checklist")
-    lines.append("- [ ] No emojis as icons (use SVG: Heroicons/Lucide)")
-    lines.append("- [ ] cursor-pointer on all clickable elements")
-    lines.append("- [ ] Hover states with smooth transitions (150-300ms)")
-    lines.append("- [ ] Light mode: text contrast 4.5:1 minimum")
-    lines.append("- [ ] Focus states visible for keyboard nav")
-    lines.append("- [ ] prefers-reduced-motion respected")
-    lines.append("- [ ] Responsive: 375px, 768px, 1024px, 1440px")
-    lines.append("")
+    yield "### Pre-Delivery Checklist"
+    yield "- [ ] No emojis as icons (use SVG: Heroicons/Lucide)"
+    yield "- [ ] cursor-pointer on all clickable elements"
+    yield "- [ ] Hover states with smooth transitions (150-300ms)"
+    yield "- [ ] Light mode: text contrast 4.5:1 minimum"
+    yield "- [ ] Focus states visible for keyboard nav"
+    yield "- [ ] prefers-reduced-motion respected"
+    yield "- [ ] Responsive: 375px, 768px, 1024px, 1440px"
+    yield ""
 
-    return "\n".join(lines)
+
+def format_markdown(design_system: dict) -> str:
+    """Format design system as markdown."""
+    return "\n".join(iter_markdown(design_system))
 
 
 # ============ MAIN ENTRY POINT ============
+def stream_design_system(query: str, project_name: str = None, output_format: str = "ascii",
+                         persist: bool = False, page: str = None, output_dir: str = None,
+                         generator: DesignSystemGenerator = None):
+    """
+    Generate (and optionally persist) a design system, returning its formatted lines.
+
+    Same arguments as generate_design_system. Search and persistence run before this
+    returns; the document itself is produced lazily, one line at a time.
+    """
+    generator = generator or DesignSystemGenerator()
+    design_system = generator.generate(query, project_name)
+    
+    # Persist to files if requested
+    if persist:
+        persist_design_system(design_system, page, output_dir, query)
+
+    if output_format == "markdown":
+        return iter_markdown(design_system)
+    return iter_ascii_box(design_system)
+
+
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii", 
-                           persist: bool = False, page: str = None, output_dir: str = None) -> str:
+                           persist: bool = False, page: str = None, output_dir: str = None,
+                           generator: DesignSystemGenerator = None) -> str:
     """
     Main entry point for design system generation.
 
@@ -471,26 +557,211 @@ def generate_design_system(query: str, project_name: str = None, output_format:
         persist: If True, save design system to design-system/ folder
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
+        generator: Optional DesignSystemGenerator to reuse (keeps reasoning rules loaded)
 
     Returns:
         Formatted design system string
     """
-    generator = DesignSystemGenerator()
-    design_system = generator.generate(query, project_name)
-    
-    # Persist to files if requested
-    if persist:
-        persist_design_system(design_system, page, output_dir, query)
+    return "\n".join(stream_design_system(query, project_name, output_format, persist, page, output_dir,
+                                           generator))
 
-    if output_format == "markdown":
-        return format_markdown(design_system)
-    return format_ascii_box(design_system)
+
+def write_lines(lines, stream) -> None:
+    """Write formatter lines to a text stream (e.g. sys.stdout), one at a time."""
+    for line in lines:
+        stream.write(line)
+        stream.write("\n")
 
 
 # ============ PERSISTENCE FUNCTIONS ============
+def _slugify(name: str) -> str:
+    """File-system slug for project and page names ("Reports/CMV" -> "reports-cmv")."""
+    return name.lower().replace(' ', '-').replace('/', '-')
+
+
+def _design_system_dir(design_system: dict, output_dir: str = None) -> Path:
+    """Resolve design-system/<project>/ under output_dir (defaults to cwd)."""
+    base_dir = Path(output_dir) if output_dir else Path.cwd()
+    project_name = design_system.get("project_name", "default")
+    return base_dir / "design-system" / _slugify(project_name)
+
+
+MANIFEST_FILE = ".manifest.json"
+# Stands in for the "Generated" time while hashing, so unchanged inputs hash the same
+_TIMESTAMP_PLACEHOLDER = "\x00generated\x00"
+
+
+def _encode_lines(lines):
+    """Encode formatter lines as UTF-8 chunks, "\n"-joined exactly like format_*()."""
+    separator = b""
+    for line in lines:
+        yield separator + line.encode("utf-8")
+        separator = b"\n"
+
+
+def _document(design_system_dir: Path, path: Path, render, inputs: dict) -> dict:
+    """
+    A file to persist. `render(timestamp)` yields its lines; it runs once, when the
+    file is persisted, so no full document is kept in memory.
+    """
+    return {"dir": design_system_dir, "path": path, "render": render, "inputs": inputs}
+
+
+def _render_master(design_system: dict, design_system_dir: Path, query: str = None) -> dict:
+    """MASTER.md, rendered when persisted."""
+    return _document(
+        design_system_dir, design_system_dir / "MASTER.md",
+        lambda timestamp: iter_master_md(design_system, timestamp),
+        {"query": query, "project_name": design_system.get("project_name"),
+         "category": design_system.get("category")}
+    )
+
+
+def _render_page(design_system: dict, design_system_dir: Path, page: str, page_query: str = None) -> dict:
+    """A page override file, rendered when persisted."""
+    return _document(
+        design_system_dir, design_system_dir / "pages" / f"{_slugify(page)}.md",
+        lambda timestamp: iter_page_override_md(design_system, page, page_query, timestamp),
+        {"query": page_query, "project_name": design_system.get("project_name"), "page": page}
+    )
+
+
+def _file_sha256(path: Path) -> str:
+    """Hash of a file on disk, or None if it can't be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _atomic_write(path: Path, chunks, discard=None) -> str:
+    """
+    Stream byte chunks to a temp file in the same folder, then rename it over path,
+    so readers never see a partial file. Returns the SHA-256 of the bytes written,
+    or None if `discard()`, asked once everything is streamed, drops the temp file.
+    """
+    import tempfile
+    digest = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                digest.update(chunk)
+                f.write(chunk)
+        if discard is not None and discard():
+            os.unlink(tmp_path)
+            return None
+        # mkstemp creates 0600; keep the permissions a plain open() would have given
+        os.chmod(tmp_path, (os.stat(path).st_mode & 0o777) if path.exists() else 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return digest.hexdigest()
+
+
+def _load_manifest(design_system_dir: Path) -> dict:
+    """Generated-file manifest for a project folder (empty if missing or unreadable)."""
+    try:
+        with open(design_system_dir / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"files": {}}
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("files"), dict):
+        return {"files": {}}
+    return manifest
+
+
+class _Manifests:
+    """Project-folder manifests, loaded on first use; shared by the batch worker threads."""
+
+    def __init__(self):
+        self._manifests = {}
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    def _entries(self, design_system_dir: Path) -> dict:
+        if design_system_dir not in self._manifests:
+            self._manifests[design_system_dir] = _load_manifest(design_system_dir)
+        return self._manifests[design_system_dir]["files"]
+
+    @staticmethod
+    def _key(item: dict) -> str:
+        return item["path"].relative_to(item["dir"]).as_posix()
+
+    def get(self, item: dict) -> dict:
+        with self._lock:
+            return self._entries(item["dir"]).get(self._key(item))
+
+    def put(self, item: dict, entry: dict) -> None:
+        with self._lock:
+            self._entries(item["dir"])[self._key(item)] = entry
+            self._dirty.add(item["dir"])
+
+    def save(self) -> None:
+        for design_system_dir in sorted(self._dirty):
+            manifest = json.dumps(self._manifests[design_system_dir], indent=2, sort_keys=True, ensure_ascii=False)
+            _atomic_write(design_system_dir / MANIFEST_FILE, [(manifest + "\n").encode("utf-8")])
+        self._dirty.clear()
+
+
+def _persist_document(item: dict, manifests: _Manifests, timestamp: str) -> bool:
+    """
+    Render a document once, streaming it into a temp file beside its path while
+    hashing it with the timestamp as a placeholder (only the header line carries
+    the real one). The temp file is dropped if that hash matches the manifest entry
+    and the bytes on disk are still the ones recorded there; otherwise it replaces
+    the file. Returns whether the file was written.
+    """
+    path = item["path"]
+    entry = manifests.get(item)
+    placeholder, stamp = _TIMESTAMP_PLACEHOLDER.encode("utf-8"), timestamp.encode("utf-8")
+    content = hashlib.sha256()
+
+    def stamped():
+        for chunk in _encode_lines(item["render"](_TIMESTAMP_PLACEHOLDER)):
+            content.update(chunk)
+            yield chunk.replace(placeholder, stamp) if placeholder in chunk else chunk
+
+    def unchanged():
+        return bool(entry) and entry.get("content_hash") == content.hexdigest() \
+            and _file_sha256(path) == entry.get("file_hash")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    file_hash = _atomic_write(path, stamped(), discard=unchanged)
+    if file_hash is None:
+        return False
+    manifests.put(item, {"inputs": item["inputs"], "content_hash": content.hexdigest(),
+                         "file_hash": file_hash, "generated": timestamp})
+    return True
+
+
+def _write_files(files: list) -> dict:
+    """
+    Persist documents (see _persist_document) and record them in their manifests.
+
+    Returns:
+        dict with "written" and "unchanged" path lists
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    manifests = _Manifests()
+    written, unchanged = [], []
+    for item in files:
+        (written if _persist_document(item, manifests, timestamp) else unchanged).append(str(item["path"]))
+    manifests.save()
+    return {"written": written, "unchanged": unchanged}
+
+
 def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
+
+    Files are tracked in design-system/<project>/.manifest.json; a file whose content
+    has not changed since the last run is left untouched, others are replaced atomically.
     
     Args:
         design_system: The generated design system dictionary
@@ -499,48 +770,149 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
         page_query: Optional query string for intelligent page override generation
     
     Returns:
-        dict with created file paths and status
+        dict with created file paths (written + unchanged) and status
     """
-    base_dir = Path(output_dir) if output_dir else Path.cwd()
-    
-    # Use project name for project-specific folder
-    project_name = design_system.get("project_name", "default")
-    project_slug = project_name.lower().replace(' ', '-')
-    
-    design_system_dir = base_dir / "design-system" / project_slug
-    pages_dir = design_system_dir / "pages"
-    
-    created_files = []
+    design_system_dir = _design_system_dir(design_system, output_dir)
     
     # Create directories
-    design_system_dir.mkdir(parents=True, exist_ok=True)
-    pages_dir.mkdir(parents=True, exist_ok=True)
-    
-    master_file = design_system_dir / "MASTER.md"
-    
-    # Generate and write MASTER.md
-    master_content = format_master_md(design_system)
-    with open(master_file, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    created_files.append(str(master_file))
+    (design_system_dir / "pages").mkdir(parents=True, exist_ok=True)
     
-    # If page is specified, create page override file with intelligent content
+    # MASTER.md plus, if page is specified, a page override file with intelligent content
+    files = [_render_master(design_system, design_system_dir, page_query)]
     if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-        created_files.append(str(page_file))
+        files.append(_render_page(design_system, design_system_dir, page, page_query))
+    result = _write_files(files)
     
     return {
         "status": "success",
         "design_system_dir": str(design_system_dir),
-        "created_files": created_files
+        "created_files": [str(item["path"]) for item in files],
+        "written_files": result["written"],
+        "unchanged_files": result["unchanged"]
     }
 
 
-def format_master_md(design_system: dict) -> str:
-    """Format design system as MASTER.md with hierarchical override logic."""
+# ============ BATCH GENERATION ============
+def load_batch_manifest(path: str) -> dict:
+    """
+    Load a batch manifest (JSON).
+
+    Format:
+        {
+          "output_dir": "optional/base/dir",
+          "projects": [
+            {"query": "restaurant order dashboard", "project_name": "Pedi AI",
+             "pages": ["orders", {"name": "reports/cmv", "query": "cost report table"}]}
+          ]
+        }
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if not isinstance(manifest.get("projects"), list):
+        raise ValueError(f"Batch manifest {path} must contain a 'projects' list")
+    return manifest
+
+
+def _normalize_pages(project: dict) -> list:
+    """Expand manifest page entries into (name, query) pairs."""
+    pages = []
+    for entry in project.get("pages", []):
+        if isinstance(entry, str):
+            pages.append((entry, project["query"]))
+        else:
+            pages.append((entry["name"], entry.get("query") or project["query"]))
+    return pages
+
+
+def generate_batch(manifest: dict, output_dir: str = None, jobs: int = None) -> dict:
+    """
+    Generate MASTER.md plus page overrides for every project/page in a manifest.
+
+    All projects share one DesignSystemGenerator and the process-wide search
+    caches in core, so each CSV is parsed and indexed once for the whole batch.
+    Each page is rendered and streamed to disk by a thread pool worker, skipping
+    files whose content is unchanged since the last run; the manifests are saved
+    once the pool is done.
+
+    Args:
+        manifest: Parsed manifest (see load_batch_manifest)
+        output_dir: Base directory; overrides manifest["output_dir"], defaults to cwd
+        jobs: Worker threads (default: min(8, cpu count))
+
+    Returns:
+        dict with created (written + unchanged) files, per-page timings and cache statistics
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from time import perf_counter
+    from core import cache_info
+
+    started = perf_counter()
+    output_dir = output_dir or manifest.get("output_dir")
+    jobs = jobs or min(8, os.cpu_count() or 1)
+    generator = DesignSystemGenerator()
+    manifests = _Manifests()
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # Timings cover the whole unit: generation, rendering and writing
+    def render_master(project: dict) -> dict:
+        t0 = perf_counter()
+        design_system = generator.generate(project["query"], project.get("project_name"))
+        design_system_dir = _design_system_dir(design_system, output_dir)
+        file = _render_master(design_system, design_system_dir, project["query"])
+        written = _persist_document(file, manifests, timestamp)
+        return {"design_system": design_system, "dir": design_system_dir, "file": file, "written": written,
+                "timing": {"project": design_system["project_name"], "page": "MASTER",
+                           "seconds": perf_counter() - t0}}
+
+    def render_page(master: dict, page: str, page_query: str) -> dict:
+        t0 = perf_counter()
+        file = _render_page(master["design_system"], master["dir"], page, page_query)
+        written = _persist_document(file, manifests, timestamp)
+        return {"file": file, "written": written,
+                "timing": {"project": master["design_system"]["project_name"], "page": page,
+                           "seconds": perf_counter() - t0}}
+
+    projects = manifest["projects"]
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        masters = list(pool.map(render_master, projects))
+        page_futures = [
+            [pool.submit(render_page, master, page, page_query) for page, page_query in _normalize_pages(project)]
+            for project, master in zip(projects, masters)
+        ]
+        # Keep manifest order: each MASTER.md followed by its pages
+        rendered = []
+        for master, futures in zip(masters, page_futures):
+            rendered.append(master)
+            rendered.extend(future.result() for future in futures)
+
+    manifests.save()
+
+    return {
+        "status": "success",
+        "created_files": [str(item["file"]["path"]) for item in rendered],
+        "written_files": [str(item["file"]["path"]) for item in rendered if item["written"]],
+        "unchanged_files": [str(item["file"]["path"]) for item in rendered if not item["written"]],
+        "timings": [item["timing"] for item in rendered],
+        "total_seconds": perf_counter() - started,
+        "cache": cache_info()
+    }
+
+
+def format_batch_report(report: dict) -> str:
+    """Format generate_batch output as a per-page timing table."""
+    lines = [f"{'Project':<24} {'Page':<24} {'ms':>8}", "-" * 58]
+    for timing in report["timings"]:
+        lines.append(f"{timing['project'][:24]:<24} {timing['page'][:24]:<24} {timing['seconds'] * 1000:>8.1f}")
+    lines.append("-" * 58)
+    search_stats = report["cache"]["search"]
+    lines.append(f"{len(report['created_files'])} files ({len(report['written_files'])} written, "
+                 f"{len(report['unchanged_files'])} unchanged) in {report['total_seconds'] * 1000:.1f} ms "
+                 f"(search cache: {search_stats['hits']} hits / {search_stats['misses']} misses)")
+    return "\n".join(lines)
+
+
+def iter_master_md(design_system: dict, timestamp: str = None):
+    """Yield MASTER.md lines with hierarchical override logic."""
     project = design_system.get("project_name", "PROJECT")
     pattern = design_system.get("pattern", {})
     style = design_system.get("style", {})
@@ -549,366 +921,368 @@ def format_master_md(design_system: dict) -> str:
     effects = design_system.get("key_effects", "")
     anti_patterns = design_system.get("anti_patterns", "")
     
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    lines = []
+    timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Logic header
-    lines.append("# Design System Master File")
-    lines.append("")
-    lines.append("> **LOGIC:** When building a specific page, first check `design-system/pages/[page-name].md`.")
-    lines.append("> If that file exists, its rules **override** this Master file.")
-    lines.append("> If not, strictly follow the rules below.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    lines.append(f"**Project:** {project}")
-    lines.append(f"**Generated:** {timestamp}")
-    lines.append(f"**Category:** {design_system.get('category', 'General')}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    yield "# Design System Master File"
+    yield ""
+    yield "> **LOGIC:** When building a specific page, first check `design-system/pages/[page-name].md`."
+    yield "> If that file exists, its rules **override** this Master file."
+    yield "> If not, strictly follow the rules below."
+    yield ""
+    yield "---"
+    yield ""
+    yield f"**Project:** {project}"
+    yield f"**Generated:** {timestamp}"
+    yield f"**Category:** {design_system.get('category', 'General')}"
+    yield ""
+    yield "---"
+    yield ""
     
     # Global Rules section
-    lines.append("## Global Rules")
-    lines.append("")
+    yield "## Global Rules"
+    yield ""
     
     # Color Palette
-    lines.append("### Color Palette")
-    lines.append("")
-    lines.append("| Role | Hex | CSS Variable |")
-    lines.append("|------|-----|--------------|")
-    lines.append(f"| Primary | `{colors.get('primary', '#2563EB')}` | `--color-primary` |")
-    lines.append(f"| Secondary | `{colors.get('secondary', '#3B82F6')}` | `--color-secondary` |")
-    lines.append(f"| CTA/Accent | `{colors.get('cta', '#F97316')}` | `--color-cta` |")
-    lines.append(f"| Background | `{colors.get('background', '#F8FAFC')}` | `--color-background` |")
-    lines.append(f"| Text | `{colors.get('text', '#1E293B')}` | `--color-text` |")
-    lines.append("")
+    yield "### Color Palette"
+    yield ""
+    yield "| Role | Hex | CSS Variable |"
+    yield "|------|-----|--------------|"
+    yield f"| Primary | `{colors.get('primary', '#2563EB')}` | `--color-primary` |"
+    yield f"| Secondary | `{colors.get('secondary', '#3B82F6')}` | `--color-secondary` |"
+    yield f"| CTA/Accent | `{colors.get('cta', '#F97316')}` | `--color-cta` |"
+    yield f"| Background | `{colors.get('background', '#F8FAFC')}` | `--color-background` |"
+    yield f"| Text | `{colors.get('text', '#1E293B')}` | `--color-text` |"
+    yield ""
     if colors.get("notes"):
-        lines.append(f"**Color Notes:** {colors.get('notes', '')}")
-        lines.append("")
+        yield f"**Color Notes:** {colors.get('notes', '')}"
+        yield ""
     
     # Typography
-    lines.append("### Typography")
-    lines.append("")
-    lines.append(f"- **Heading Font:** {typography.get('heading', 'Inter')}")
-    lines.append(f"- **Body Font:** {typography.get('body', 'Inter')}")
+    yield "### Typography"
+    yield ""
+    yield f"- **Heading Font:** {typography.get('heading', 'Inter')}"
+    yield f"- **Body Font:** {typography.get('body', 'Inter')}"
     if typography.get("mood"):
-        lines.append(f"- **Mood:** {typography.get('mood', '')}")
+        yield f"- **Mood:** {typography.get('mood', '')}"
     if typography.get("google_fonts_url"):
-        lines.append(f"- **Google Fonts:** [{typography.get('heading', '')} + {typography.get('body', '')}]({typography.get('google_fonts_url', '')})")
-    lines.append("")
+        yield f"- **Google Fonts:** [{typography.get('heading', '')} + {typography.get('body', '')}]({typography.get('google_fonts_url', '')})"
+    yield ""
     if typography.get("css_import"):
-        lines.append("**CSS Import:**")
-        lines.append("```css")
-        lines.append(typography.get("css_import", ""))
-        lines.append("```")
-        lines.append("")
+        yield "**CSS Import:**"
+        yield "```css"
+        yield typography.get("css_import", "")
+        yield "```"
+        yield ""
     
     # Spacing Variables
-    lines.append("### Spacing Variables")
-    lines.append("")
-    lines.append("| Token | Value | Usage |")
-    lines.append("|-------|-------|-------|")
-    lines.append("| `--space-xs` | `4px` / `0.25rem` | Tight gaps |")
-    lines.append("| `--space-sm` | `8px` / `0.5rem` | Icon gaps, inline spacing |")
-    lines.append("| `--space-md` | `16px` / `1rem` | Standard padding |")
-    lines.append("| `--space-lg` | `24px` / `1.5rem` | Section padding |")
-    lines.append("| `--space-xl` | `32px` / `2rem` | Large gaps |")
-    lines.append("| `--space-2xl` | `48px` / `3rem` | Section margins |")
-    lines.append("| `--space-3xl` | `64px` / `4rem` | Hero padding |")
-    lines.append("")
+    yield "### Spacing Variables"
+    yield ""
+    yield "| Token | Value | Usage |"
+    yield "|-------|-------|-------|"
+    yield "| `--space-xs` | `4px` / `0.25rem` | Tight gaps |"
+    yield "| `--space-sm` | `8px` / `0.5rem` | Icon gaps, inline spacing |"
+    yield "| `--space-md` | `16px` / `1rem` | Standard padding |"
+    yield "| `--space-lg` | `24px` / `1.5rem` | Section padding |"
+    yield "| `--space-xl` | `32px` / `2rem` | Large gaps |"
+    yield "| `--space-2xl` | `48px` / `3rem` | Section margins |"
+    yield "| `--space-3xl` | `64px` / `4rem` | Hero padding |"
+    yield ""
     
     # Shadow Depths
-    lines.append("### Shadow Depths")
-    lines.append("")
-    lines.append("| Level | Value | Usage |")
-    lines.append("|-------|-------|-------|")
-    lines.append("| `--shadow-sm` | `0 1px 2px rgba(0,0,0,0.05)` | Subtle lift |")
-    lines.append("| `--shadow-md` | `0 4px 6px rgba(0,0,0,0.1)` | Cards, buttons |")
-    lines.append("| `--shadow-lg` | `0 10px 15px rgba(0,0,0,0.1)` | Modals, dropdowns |")
-    lines.append("| `--shadow-xl` | `0 20px 25px rgba(0,0,0,0.15)` | Hero images, featured cards |")
-    lines.append("")
+    yield "### Shadow Depths"
+    yield ""
+    yield "| Level | Value | Usage |"
+    yield "|-------|-------|-------|"
+    yield "| `--shadow-sm` | `0 1px 2px rgba(0,0,0,0.05)` | Subtle lift |"
+    yield "| `--shadow-md` | `0 4px 6px rgba(0,0,0,0.1)` | Cards, buttons |"
+    yield "| `--shadow-lg` | `0 10px 15px rgba(0,0,0,0.1)` | Modals, dropdowns |"
+    yield "| `--shadow-xl` | `0 20px 25px rgba(0,0,0,0.15)` | Hero images, featured cards |"
+    yield ""
     
     # Component Specs section
-    lines.append("---")
-    lines.append("")
-    lines.append("## Component Specs")
-    lines.append("")
+    yield "---"
+    yield ""
+    yield "## Component Specs"
+    yield ""
     
     # Buttons
-    lines.append("### Buttons")
-    lines.append("")
-    lines.append("```css")
-    lines.append("/* Primary Button */")
-    lines.append(".btn-primary {")
-    lines.append(f"  background: {colors.get('cta', '#F97316')};")
-    lines.append("  color: white;")
-    lines.append("  padding: 12px 24px;")
-    lines.append("  border-radius: 8px;")
-    lines.append("  font-weight: 600;")
-    lines.append("  transition: all 200ms ease;")
-    lines.append("  cursor: pointer;")
-    lines.append("}")
-    lines.append("")
-    lines.append(".btn-primary:hover {")
-    lines.append("  opacity: 0.9;")
-    lines.append("  transform: translateY(-1px);")
-    lines.append("}")
-    lines.append("")
-    lines.append("/* Secondary Button */")
-    lines.append(".btn-secondary {")
-    lines.append(f"  background: transparent;")
-    lines.append(f"  color: {colors.get('primary', '#2563EB')};")
-    lines.append(f"  border: 2px solid {colors.get('primary', '#2563EB')};")
-    lines.append("  padding: 12px 24px;")
-    lines.append("  border-radius: 8px;")
-    lines.append("  font-weight: 600;")
-    lines.append("  transition: all 200ms ease;")
-    lines.append("  cursor: pointer;")
-    lines.append("}")
-    lines.append("```")
-    lines.append("")
+    yield "### Buttons"
+    yield ""
+    yield "```css"
+    yield "/* Primary Button */"
+    yield ".btn-primary {"
+    yield f"  background: {colors.get('cta', '#F97316')};"
+    yield "  color: white;"
+    yield "  padding: 12px 24px;"
+    yield "  border-radius: 8px;"
+    yield "  font-weight: 600;"
+    yield "  transition: all 200ms ease;"
+    yield "  cursor: pointer;"
+    yield "}"
+    yield ""
+    yield ".btn-primary:hover {"
+    yield "  opacity: 0.9;"
+    yield "  transform: translateY(-1px);"
+    yield "}"
+    yield ""
+    yield "/* Secondary Button */"
+    yield ".btn-secondary {"
+    yield f"  background: transparent;"
+    yield f"  color: {colors.get('primary', '#2563EB')};"
+    yield f"  border: 2px solid {colors.get('primary', '#2563EB')};"
+    yield "  padding: 12px 24px;"
+    yield "  border-radius: 8px;"
+    yield "  font-weight: 600;"
+    yield "  transition: all 200ms ease;"
+    yield "  cursor: pointer;"
+    yield "}"
+    yield "```"
+    yield ""
     
     # Cards
-    lines.append("### Cards")
-    lines.append("")
-    lines.append("```css")
-    lines.append(".card {")
-    lines.append(f"  background: {colors.get('background', '#FFFFFF')};")
-    lines.append("  border-radius: 12px;")
-    lines.append("  padding: 24px;")
-    lines.append("  box-shadow: var(--shadow-md);")
-    lines.append("  transition: all 200ms ease;")
-    lines.append("  cursor: pointer;")
-    lines.append("}")
-    lines.append("")
-    lines.append(".card:hover {")
-    lines.append("  box-shadow: var(--shadow-lg);")
-    lines.append("  transform: translateY(-2px);")
-    lines.append("}")
-    lines.append("```")
-    lines.append("")
+    yield "### Cards"
+    yield ""
+    yield "```css"
+    yield ".card {"
+    yield f"  background: {colors.get('background', '#FFFFFF')};"
+    yield "  border-radius: 12px;"
+    yield "  padding: 24px;"
+    yield "  box-shadow: var(--shadow-md);"
+    yield "  transition: all 200ms ease;"
+    yield "  cursor: pointer;"
+    yield "}"
+    yield ""
+    yield ".card:hover {"
+    yield "  box-shadow: var(--shadow-lg);"
+    yield "  transform: translateY(-2px);"
+    yield "}"
+    yield "```"
+    yield ""
     
     # Inputs
-    lines.append("### Inputs")
-    lines.append("")
-    lines.append("```css")
-    lines.append(".input {")
-    lines.append("  padding: 12px 16px;")
-    lines.append("  border: 1px solid #E2E8F0;")
-    lines.append("  border-radius: 8px;")
-    lines.append("  font-size: 16px;")
-    lines.append("  transition: border-color 200ms ease;")
-    lines.append("}")
-    lines.append("")
-    lines.append(".input:focus {")
-    lines.append(f"  border-color: {colors.get('primary', '#2563EB')};")
-    lines.append("  outline: none;")
-    lines.append(f"  box-shadow: 0 0 0 3px {colors.get('primary', '#2563EB')}20;")
-    lines.append("}")
-    lines.append("```")
-    lines.append("")
+    yield "### Inputs"
+    yield ""
+    yield "```css"
+    yield ".input {"
+    yield "  padding: 12px 16px;"
+    yield "  border: 1px solid #E2E8F0;"
+    yield "  border-radius: 8px;"
+    yield "  font-size: 16px;"
+    yield "  transition: border-color 200ms ease;"
+    yield "}"
+    yield ""
+    yield ".input:focus {"
+    yield f"  border-color: {colors.get('primary', '#2563EB')};"
+    yield "  outline: none;"
+    yield f"  box-shadow: 0 0 0 3px {colors.get('primary', '#2563EB')}20;"
+    yield "}"
+    yield "```"
+    yield ""
     
     # Modals
-    lines.append("### Modals")
-    lines.append("")
-    lines.append("```css")
-    lines.append(".modal-overlay {")
-    lines.append("  background: rgba(0, 0, 0, 0.5);")
-    lines.append("  backdrop-filter: blur(4px);")
-    lines.append("}")
-    lines.append("")
-    lines.append(".modal {")
-    lines.append("  background: white;")
-    lines.append("  border-radius: 16px;")
-    lines.append("  padding: 32px;")
-    lines.append("  box-shadow: var(--shadow-xl);")
-    lines.append("  max-width: 500px;")
-    lines.append("  width: 90%;")
-    lines.append("}")
-    lines.append("```")
-    lines.append("")
+    yield "### Modals"
+    yield ""
+    yield "```css"
+    yield ".modal-overlay {"
+    yield "  background: rgba(0, 0, 0, 0.5);"
+    yield "  backdrop-filter: blur(4px);"
+    yield "}"
+    yield ""
+    yield ".modal {"
+    yield "  background: white;"
+    yield "  border-radius: 16px;"
+    yield "  padding: 32px;"
+    yield "  box-shadow: var(--shadow-xl);"
+    yield "  max-width: 500px;"
+    yield "  width: 90%;"
+    yield "}"
+    yield "```"
+    yield ""
     
     # Style section
-    lines.append("---")
-    lines.append("")
-    lines.append("## Style Guidelines")
-    lines.append("")
-    lines.append(f"**Style:** {style.get('name', 'Minimalism')}")
-    lines.append("")
+    yield "---"
+    yield ""
+    yield "## Style Guidelines"
+    yield ""
+    yield f"**Style:** {style.get('name', 'Minimalism')}"
+    yield ""
     if style.get("keywords"):
-        lines.append(f"**Keywords:** {style.get('keywords', '')}")
-        lines.append("")
+        yield f"**Keywords:** {style.get('keywords', '')}"
+        yield ""
     if style.get("best_for"):
-        lines.append(f"**Best For:** {style.get('best_for', '')}")
-        lines.append("")
+        yield f"**Best For:** {style.get('best_for', '')}"
+        yield ""
     if effects:
-        lines.append(f"**Key Effects:** {effects}")
-        lines.append("")
+        yield f"**Key Effects:** {effects}"
+        yield ""
     
     # Layout Pattern
-    lines.append("### Page Pattern")
-    lines.append("")
-    lines.append(f"**Pattern Name:** {pattern.get('name', '')}")
-    lines.append("")
+    yield "### Page Pattern"
+    yield ""
+    yield f"**Pattern Name:** {pattern.get('name', '')}"
+    yield ""
     if pattern.get('conversion'):
-        lines.append(f"- **Conversion Strategy:** {pattern.get('conversion', '')}")
+        yield f"- **Conversion Strategy:** {pattern.get('conversion', '')}"
     if pattern.get('cta_placement'):
-        lines.append(f"- **CTA Placement:** {pattern.get('cta_placement', '')}")
-    lines.append(f"- **Section Order:** {pattern.get('sections', '')}")
-    lines.append("")
+        yield f"- **CTA Placement:** {pattern.get('cta_placement', '')}"
+    yield f"- **Section Order:** {pattern.get('sections', '')}"
+    yield ""
     
     # Anti-Patterns section
-    lines.append("---")
-    lines.append("")
-    lines.append("## Anti-Patterns (Do NOT Use)")
-    lines.append("")
+    yield "---"
+    yield ""
+    yield "## Anti-Patterns (Do NOT Use)"
+    yield ""
     if anti_patterns:
         anti_list = [a.strip() for a in anti_patterns.split("+")]
         for anti in anti_list:
             if anti:
-                lines.append(f"- ❌ {anti}")
-    lines.append("")
-    lines.append("### Additional Forbidden Patterns")
-    lines.append("")
-    lines.append("- ❌ **Emojis as icons** — Use SVG icons (Heroicons, Lucide, Simple Icons)")
-    lines.append("- ❌ **Missing cursor:pointer** — All clickable elements must have cursor:pointer")
-    lines.append("- ❌ **Layout-shifting hovers** — Avoid scale transforms that shift layout")
-    lines.append("- ❌ **Low contrast text** — Maintain 4.5:1 minimum contrast ratio")
-    lines.append("- ❌ **Instant state changes** — Always use transitions (150-300ms)")
-    lines.append("- ❌ **Invisible focus states** — Focus states must be visible for a11y")
-    lines.append("")
+                yield f"- ❌ {anti}"
+    yield ""
+    yield "### Additional Forbidden Patterns"
+    yield ""
+    yield "- ❌ **Emojis as icons** — Use SVG icons (Heroicons, Lucide, Simple Icons)"
+    yield "- ❌ **Missing cursor:pointer** — All clickable elements must have cursor:pointer"
+    yield "- ❌ **Layout-shifting hovers** — Avoid scale transforms that shift layout"
+    yield "- ❌ **Low contrast text** — Maintain 4.5:1 minimum contrast ratio"
+    yield "- ❌ **Instant state changes** — Always use transitions (150-300ms)"
+    yield "- ❌ **Invisible focus states** — Focus states must be visible for a11y"
+    yield ""
     
     # Pre-Delivery Checklist
-    lines.append("---")
-    lines.append("")
-    lines.append("## Pre-Delivery Checklist")
-    lines.append("")
-    lines.append("Before delivering any UI code, verify:")
-    lines.append("")
-    lines.append("- [ ] No emojis used as icons (use SVG instead)")
-    lines.append("- [ ] All icons from consistent icon set (Heroicons/Lucide)")
-    lines.append("- [ ] `cursor-pointer` on all clickable elements")
-    lines.append("- [ ] Hover states with smooth transitions (150-300ms)")
-    lines.append("- [ ] Light mode: text contrast 4.5:1 minimum")
-    lines.append("- [ ] Focus states visible for keyboard navigation")
-    lines.append("- [ ] `prefers-reduced-motion` respected")
-    lines.append("- [ ] Responsive: 375px, 768px, 1024px, 1440px")
-    lines.append("- [ ] No content hidden behind fixed navbars")
-    lines.append("- [ ] No horizontal scroll on mobile")
-    lines.append("")
-    
-    return "\n".join(lines)
+    yield "---"
+    yield ""
+    yield "## Pre-Delivery Checklist"
+    yield ""
+    yield "Before delivering any UI code, verify:"
+    yield ""
+    yield "- [ ] No emojis used as icons (use SVG instead)"
+    yield "- [ ] All icons from consistent icon set (Heroicons/Lucide)"
+    yield "- [ ] `cursor-pointer` on all clickable elements"
+    yield "- [ ] Hover states with smooth transitions (150-300ms)"
+    yield "- [ ] Light mode: text contrast 4.5:1 minimum"
+    yield "- [ ] Focus states visible for keyboard navigation"
+    yield "- [ ] `prefers-reduced-motion` respected"
+    yield "- [ ] Responsive: 375px, 768px, 1024px, 1440px"
+    yield "- [ ] No content hidden behind fixed navbars"
+    yield "- [ ] No horizontal scroll on mobile"
+    yield ""
+
+
+def format_master_md(design_system: dict, timestamp: str = None) -> str:
+    """Format design system as MASTER.md with hierarchical override logic."""
+    return "\n".join(iter_master_md(design_system, timestamp))
 
 
-def format_page_override_md(design_system: dict, page_name: str, page_query: str = None) -> str:
-    """Format a page-specific override file with intelligent AI-generated content."""
+def iter_page_override_md(design_system: dict, page_name: str, page_query: str = None, timestamp: str = None):
+    """Yield a page-specific override file's lines with intelligent AI-generated content."""
     project = design_system.get("project_name", "PROJECT")
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     page_title = page_name.replace("-", " ").replace("_", " ").title()
     
     # Detect page type and generate intelligent overrides
     page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system)
     
-    lines = []
-    
-    lines.append(f"# {page_title} Page Overrides")
-    lines.append("")
-    lines.append(f"> **PROJECT:** {project}")
-    lines.append(f"> **Generated:** {timestamp}")
-    lines.append(f"> **Page Type:** {page_overrides.get('page_type', 'General')}")
-    lines.append("")
-    lines.append("> ⚠️ **IMPORTANT:** Rules in this file **override** the Master file (`design-system/MASTER.md`).")
-    lines.append("> Only deviations from the Master are documented here. For all other rules, refer to the Master.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    yield f"# {page_title} Page Overrides"
+    yield ""
+    yield f"> **PROJECT:** {project}"
+    yield f"> **Generated:** {timestamp}"
+    yield f"> **Page Type:** {page_overrides.get('page_type', 'General')}"
+    yield ""
+    yield "> ⚠️ **IMPORTANT:** Rules in this file **override** the Master file (`design-system/MASTER.md`)."
+    yield "> Only deviations from the Master are documented here. For all other rules, refer to the Master."
+    yield ""
+    yield "---"
+    yield ""
     
     # Page-specific rules with actual content
-    lines.append("## Page-Specific Rules")
-    lines.append("")
+    yield "## Page-Specific Rules"
+    yield ""
     
     # Layout Overrides
-    lines.append("### Layout Overrides")
-    lines.append("")
+    yield "### Layout Overrides"
+    yield ""
     layout = page_overrides.get("layout", {})
     if layout:
         for key, value in layout.items():
-            lines.append(f"- **{key}:** {value}")
+            yield f"- **{key}:** {value}"
     else:
-        lines.append("- No overrides — use Master layout")
-    lines.append("")
+        yield "- No overrides — use Master layout"
+    yield ""
     
     # Spacing Overrides
-    lines.append("### Spacing Overrides")
-    lines.append("")
+    yield "### Spacing Overrides"
+    yield ""
     spacing = page_overrides.get("spacing", {})
     if spacing:
         for key, value in spacing.items():
-            lines.append(f"- **{key}:** {value}")
+            yield f"- **{key}:** {value}"
     else:
-        lines.append("- No overrides — use Master spacing")
-    lines.append("")
+        yield "- No overrides — use Master spacing"
+    yield ""
     
     # Typography Overrides
-    lines.append("### Typography Overrides")
-    lines.append("")
+    yield "### Typography Overrides"
+    yield ""
     typography = page_overrides.get("typography", {})
     if typography:
         for key, value in typography.items():
-            lines.append(f"- **{key}:** {value}")
+            yield f"- **{key}:** {value}"
     else:
-        lines.append("- No overrides — use Master typography")
-    lines.append("")
+        yield "- No overrides — use Master typography"
+    yield ""
     
     # Color Overrides
-    lines.append("### Color Overrides")
-    lines.append("")
+    yield "### Color Overrides"
+    yield ""
     colors = page_overrides.get("colors", {})
     if colors:
         for key, value in colors.items():
-            lines.append(f"- **{key}:** {value}")
+            yield f"- **{key}:** {value}"
     else:
-        lines.append("- No overrides — use Master colors")
-    lines.append("")
+        yield "- No overrides — use Master colors"
+    yield ""
     
     # Component Overrides
-    lines.append("### Component Overrides")
-    lines.append("")
+    yield "### Component Overrides"
+    yield ""
     components = page_overrides.get("components", [])
     if components:
         for comp in components:
-            lines.append(f"- {comp}")
+            yield f"- {comp}"
     else:
-        lines.append("- No overrides — use Master component specs")
-    lines.append("")
+        yield "- No overrides — use Master component specs"
+    yield ""
     
     # Page-Specific Components
-    lines.append("---")
-    lines.append("")
-    lines.append("## Page-Specific Components")
-    lines.append("")
+    yield "---"
+    yield ""
+    yield "## Page-Specific Components"
+    yield ""
     unique_components = page_overrides.get("unique_components", [])
     if unique_components:
         for comp in unique_components:
-            lines.append(f"- {comp}")
+            yield f"- {comp}"
     else:
-        lines.append("- No unique components for this page")
-    lines.append("")
+        yield "- No unique components for this page"
+    yield ""
     
     # Recommendations
-    lines.append("---")
-    lines.append("")
-    lines.append("## Recommendations")
-    lines.append("")
+    yield "---"
+    yield ""
+    yield "## Recommendations"
+    yield ""
     recommendations = page_overrides.get("recommendations", [])
     if recommendations:
         for rec in recommendations:
-            lines.append(f"- {rec}")
-    lines.append("")
-    
-    return "\n".join(lines)
+            yield f"- {rec}"
+    yield ""
+
+
+def format_page_override_md(design_system: dict, page_name: str, page_query: str = None, timestamp: str = None) -> str:
+    """Format a page-specific override file with intelligent AI-generated content."""
+    return "\n".join(iter_page_override_md(design_system, page_name, page_query, timestamp))
 
 
 def _generate_intelligent_overrides(page_name: str, page_query: str, design_system: dict) -> dict:
@@ -5,6 +5,11 @@ UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py --batch manifest.json [--jobs 4] [-o <dir>]
+       python search.py --serve [--socket <path>]
+       python search.py "<query>" --client [--domain <domain>]
+       python search.py "<query>" --multi 3
+       python search.py "<query>" --all
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
@@ -12,11 +17,25 @@ Stacks: html-tailwind, react, nextjs
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+
+Batch mode:
+  --batch      Generate MASTER.md + page overrides for every project/page in a
+               JSON manifest, sharing one set of loaded indexes (see
+               design_system.load_batch_manifest for the format)
+
+Daemon mode (see server.py):
+  --serve      Keep every index warm and answer requests on a Unix socket
+  --client     Forward the query to a running daemon (implied when
+               $UIPRO_SEARCH_SOCKET is set); falls back to in-process search
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import os
+import sys
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS
+
+# Search, design-system and daemon modules are imported inside the branch that
+# needs them so a plain domain search stays cheap to start (see bench_startup.py).
 
 
 def format_output(result):
@@ -34,7 +53,12 @@ def format_output(result):
     output.append(f"**Source:** {result['file']} | **Found:** {result['count']} results\n")
 
     for i, row in enumerate(result['results'], 1):
-        output.append(f"### Result {i}")
+        if "result" in row:
+            # Merged multi-corpus hit: show where it came from
+            output.append(f"### Result {i} ({row['file']}, score {row['score']})")
+            row = row["result"]
+        else:
+            output.append(f"### Result {i}")
         for key, value in row.items():
             value_str = str(value)
             if len(value_str) > 300:
@@ -45,12 +69,25 @@ def format_output(result):
     return "\n".join(output)
 
 
+def forward(args, op, payload, local):
+    """Run op on the search daemon in client mode, else (or if it's down) in-process"""
+    if args.client:
+        from server import request
+        try:
+            return request(op, payload, args.socket)
+        except OSError as e:
+            print(f"Search daemon unavailable ({e}); searching in-process", file=sys.stderr)
+    return local()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
+    parser.add_argument("--multi", type=int, default=None, metavar="N", help="Search the top N detected domains and merge results")
+    parser.add_argument("--all", action="store_true", help="Federated search over every domain and stack file")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     # Design system generation
     parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
@@ -60,20 +97,54 @@ if __name__ == "__main__":
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    # Batch generation
+    parser.add_argument("--batch", type=str, default=None, metavar="MANIFEST", help="Generate design systems for all projects/pages in a JSON manifest")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker threads for --batch (default: min(8, CPUs))")
+    # Daemon mode
+    parser.add_argument("--serve", action="store_true", help="Run the search daemon on a Unix domain socket")
+    parser.add_argument("--client", action="store_true", help="Forward the request to a running search daemon")
+    parser.add_argument("--socket", type=str, default=None, help="Daemon socket path (default: $UIPRO_SEARCH_SOCKET or a per-user temp file)")
 
     args = parser.parse_args()
+    args.client = args.client or bool(os.environ.get("UIPRO_SEARCH_SOCKET"))
+    if not (args.batch or args.serve) and not args.query:
+        parser.error("query is required unless --batch or --serve is given")
+    if args.multi is not None and args.multi < 1:
+        parser.error("--multi must be at least 1")
 
+    if args.serve:
+        from server import serve
+        try:
+            serve(args.socket)
+        except RuntimeError as e:
+            sys.exit(f"[ERROR] {e}")
+    # Batch mode takes priority
+    elif args.batch:
+        from design_system import generate_batch, load_batch_manifest, format_batch_report
+        report = generate_batch(load_batch_manifest(args.batch), args.output_dir, args.jobs)
+        if args.json:
+            import json
+            print(json.dumps(report, indent=2, ensure_ascii=False))
+        else:
+            print(format_batch_report(report))
     # Design system takes priority
-    if args.design_system:
-        result = generate_design_system(
-            args.query, 
-            args.project_name, 
-            args.format,
-            persist=args.persist,
-            page=args.page,
-            output_dir=args.output_dir
+    elif args.design_system:
+        from design_system import stream_design_system, write_lines
+        result = forward(
+            args, "design_system",
+            {"query": args.query, "project_name": args.project_name, "output_format": args.format,
+             "persist": args.persist, "page": args.page, "output_dir": args.output_dir or os.getcwd()},
+            lambda: stream_design_system(
+                args.query, 
+                args.project_name, 
+                args.format,
+                persist=args.persist,
+                page=args.page,
+                output_dir=args.output_dir
+            )
         )
-        print(result)
+        # The daemon answers with the whole document; in-process output streams line by line
+        write_lines([result] if isinstance(result, str) else result, sys.stdout)
         
         # Print persistence confirmation
         if args.persist:
@@ -82,7 +153,7 @@ if __name__ == "__main__":
             print(f"✅ Design system persisted to design-system/{project_slug}/")
             print(f"   📄 design-system/{project_slug}/MASTER.md (Global Source of Truth)")
             if args.page:
-                page_filename = args.page.lower().replace(' ', '-')
+                page_filename = args.page.lower().replace(' ', '-').replace('/', '-')
                 print(f"   📄 design-system/{project_slug}/pages/{page_filename}.md (Page Overrides)")
             print("")
             print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
@@ -90,7 +161,38 @@ if __name__ == "__main__":
             print("=" * 60)
     # Stack search
     elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
+        from core import search_stack
+        result = forward(
+            args, "search_stack",
+            {"query": args.query, "stack": args.stack, "max_results": args.max_results},
+            lambda: search_stack(args.query, args.stack, args.max_results)
+        )
+        if args.json:
+            import json
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+        else:
+            print(format_output(result))
+    # Federated search
+    elif args.all:
+        from core import search_all
+        result = forward(
+            args, "search_all",
+            {"query": args.query, "max_results": args.max_results},
+            lambda: search_all(args.query, args.max_results)
+        )
+        if args.json:
+            import json
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+        else:
+            print(format_output(result))
+    # Multi-domain search
+    elif args.multi is not None:
+        from core import search_multi
+        result = forward(
+            args, "search_multi",
+            {"query": args.query, "top_n": args.multi, "max_results": args.max_results},
+            lambda: search_multi(args.query, args.multi, args.max_results)
+        )
         if args.json:
             import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
@@ -98,7 +200,12 @@ if __name__ == "__main__":
             print(format_output(result))
     # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
+        from core import search
+        result = forward(
+            args, "search",
+            {"query": args.query, "domain": args.domain, "max_results": args.max_results},
+            lambda: search(args.query, args.domain, args.max_results)
+        )
         if args.json:
             import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
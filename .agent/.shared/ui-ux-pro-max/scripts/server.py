@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Daemon - keeps every domain/stack index warm in memory
+and answers newline-delimited JSON requests over a Unix domain socket.
+
+Usage:
+    python search.py --serve [--socket /tmp/uipro.sock]
+    python search.py "<query>" --client [--domain color]
+
+Protocol (one JSON object per line, one response line per request):
+    {"op": "search", "args": {"query": "...", "domain": "color", "max_results": 3}}
+    {"op": "search_stack", "args": {"query": "...", "stack": "react"}}
+    {"op": "search_multi", "args": {"query": "...", "top_n": 3}}
+    {"op": "search_all", "args": {"query": "...", "max_results": 5}}
+    {"op": "design_system", "args": {"query": "...", "project_name": "...", "output_format": "ascii"}}
+    {"op": "ping"} | {"op": "stats"} | {"op": "shutdown"}
+    -> {"ok": true, "result": ...} or {"ok": false, "error": "..."}
+"""
+
+import errno
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+
+SOCKET_ENV = "UIPRO_SEARCH_SOCKET"
+CLIENT_TIMEOUT = 30
+
+
+def default_socket_path() -> Path:
+    """Socket path from $UIPRO_SEARCH_SOCKET, else a per-user file in the temp dir."""
+    if os.environ.get(SOCKET_ENV):
+        return Path(os.environ[SOCKET_ENV])
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    return Path(tempfile.gettempdir()) / f"uipro-search-{uid}.sock"
+
+
+# ============ SERVER ============
+def _remove_stale_socket(path: Path) -> None:
+    """
+    Unlink a socket left by a crashed daemon.
+
+    Raises:
+        RuntimeError: a daemon is still accepting connections on path
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError as e:
+            if e.errno == errno.ECONNREFUSED:
+                path.unlink()
+            elif e.errno != errno.ENOENT:
+                raise
+            return
+    raise RuntimeError(f"A search daemon is already listening on {path}")
+
+
+def _warm_up() -> dict:
+    """Load every domain and stack corpus plus the reasoning rules into memory."""
+    from core import CSV_CONFIG, STACK_CONFIG, DATA_DIR, _STACK_COLS, _get_corpus
+    from design_system import DesignSystemGenerator
+
+    # Compile the reasoning rules now; design_system requests reuse this generator
+    generator = DesignSystemGenerator()
+    generator.reasoning_index
+    loaded = 0
+    for config in CSV_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _get_corpus(filepath, config["search_cols"])
+            loaded += 1
+    for config in STACK_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _get_corpus(filepath, _STACK_COLS["search_cols"])
+            loaded += 1
+    return {"files": loaded, "generator": generator}
+
+
+def _dispatch(op: str, args: dict, state: dict):
+    """Run one request against the warm in-process state."""
+    from core import search, search_stack, search_multi, search_all, cache_info
+    from design_system import generate_design_system
+
+    if op == "ping":
+        return "pong"
+    if op == "stats":
+        return {"files": state["files"], "cache": cache_info()}
+    if op == "search":
+        return search(args["query"], args.get("domain"), args.get("max_results", 3))
+    if op == "search_stack":
+        return search_stack(args["query"], args["stack"], args.get("max_results", 3))
+    if op == "search_multi":
+        return search_multi(args["query"], args.get("top_n", 3), args.get("max_results", 3))
+    if op == "search_all":
+        return search_all(args["query"], args.get("max_results", 3), args.get("domains"), args.get("stacks"))
+    if op == "design_system":
+        return generate_design_system(
+            args["query"],
+            args.get("project_name"),
+            args.get("output_format", "ascii"),
+            persist=args.get("persist", False),
+            page=args.get("page"),
+            output_dir=args.get("output_dir"),
+            generator=state["generator"]
+        )
+    raise ValueError(f"Unknown op: {op}")
+
+
+def serve(socket_path: str = None) -> None:
+    """Run the daemon until interrupted or sent {"op": "shutdown"}."""
+    import socketserver
+    import threading
+
+    path = Path(socket_path) if socket_path else default_socket_path()
+    _remove_stale_socket(path)
+    state = _warm_up()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    op = request.get("op")
+                    if op == "shutdown":
+                        response = {"ok": True, "result": "bye"}
+                        threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    else:
+                        response = {"ok": True, "result": _dispatch(op, request.get("args") or {}, state)}
+                except Exception as e:
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                self.wfile.flush()
+
+    class Server(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+    # Created 0600 from the start, so the socket is never connectable by other users
+    old_umask = os.umask(0o177)
+    try:
+        server = Server(str(path), Handler)
+    finally:
+        os.umask(old_umask)
+    with server:
+        print(f"UI Pro Max search daemon: {state['files']} indexes warm, listening on {path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if path.exists():
+                path.unlink()
+
+
+# ============ CLIENT ============
+def request(op: str, args: dict = None, socket_path: str = None, timeout: float = CLIENT_TIMEOUT):
+    """
+    Send one request to a running daemon and return its result.
+
+    Raises:
+        OSError: no daemon is listening on the socket
+        RuntimeError: the daemon reported an error for this request
+    """
+    path = Path(socket_path) if socket_path else default_socket_path()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall(json.dumps({"op": op, "args": args or {}}, ensure_ascii=False).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise OSError(f"Search daemon at {path} closed the connection")
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise RuntimeError(response.get("error", "unknown daemon error"))
+    return response["result"]
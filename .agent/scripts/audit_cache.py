@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Audit Result Cache - Antigravity Kit
+====================================
+
+Shared on-disk cache for the file-based auditors (ux_audit, mobile_audit,
+accessibility_checker, seo_checker, geo_checker). Findings for a file are
+replayed as long as the file's bytes and the auditor script itself are
+unchanged, so re-running checklist.py after editing one component only
+re-audits that component.
+
+Also home to the directory walk and process-pool sharding the auditors
+share (collect_files, audit_files).
+
+Layout:
+    .agent/.cache/audit/<auditor>.json
+    {"version": "<sha256 of the auditor script>",
+     "entries": {"<absolute path>": {"sha256": "<file hash>", "result": ...}}}
+
+Usage (from an auditor):
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+    from audit_cache import open_cache_from_argv, jobs_from_argv
+
+    cache = open_cache_from_argv("seo_checker", __file__)   # None with --no-cache
+    result = cache.fetch(path, check_page)   # or get() / put() separately
+    ...
+    cache.save()
+
+    paths = collect_files(directory, {'.tsx', '.jsx'}, {'node_modules', '.git'})
+    audit_files(paths, analyze_file, record, cache, jobs, shard_worker=_audit_shard)
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "audit"
+
+
+def file_sha256(path) -> Optional[str]:
+    """SHA-256 of a file's bytes, or None if it can't be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class AuditCache:
+    """Per-auditor map of file path -> (content hash, cached result)."""
+
+    def __init__(self, name: str, version: str, cache_dir: Path = None):
+        self.path = Path(cache_dir or CACHE_DIR) / f"{name}.json"
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._digests = {}
+        self._dirty = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == version and isinstance(data.get("entries"), dict):
+                self._entries = data["entries"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    @staticmethod
+    def _key(path) -> str:
+        return str(Path(path).resolve())
+
+    def get(self, path):
+        """Cached result for path if its content is unchanged, else None."""
+        key = self._key(path)
+        digest = file_sha256(path)
+        self._digests[key] = digest
+        entry = self._entries.get(key)
+        if digest is not None and entry and entry.get("sha256") == digest:
+            self.hits += 1
+            return entry["result"]
+        self.misses += 1
+        return None
+
+    def put(self, path, result) -> None:
+        """Store result under the content hash seen by get() (or the current one)."""
+        key = self._key(path)
+        digest = self._digests.get(key) or file_sha256(path)
+        if digest is None:
+            return
+        self._entries[key] = {"sha256": digest, "result": result}
+        self._dirty = True
+
+    def fetch(self, path, compute):
+        """get(path), falling back to compute(path) and caching its result."""
+        result = self.get(path)
+        if result is None:
+            result = compute(path)
+            self.put(path, result)
+        return result
+
+    def save(self) -> None:
+        """
+        Write the cache atomically, dropping entries for files that no longer exist.
+        Silently skipped if the cache directory is read-only or can't be created.
+        """
+        stale = [key for key in self._entries if not os.path.exists(key)]
+        for key in stale:
+            del self._entries[key]
+        if not (self._dirty or stale):
+            return
+        import tempfile
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({"version": self.version, "entries": self._entries}, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            return
+        self._dirty = False
+
+
+def open_cache(name: str, script_path: str, enabled: bool = True) -> Optional[AuditCache]:
+    """
+    Cache for an auditor, versioned by the auditor script's own hash so any
+    change to its rules invalidates old results.
+
+    Returns:
+        AuditCache, or None when disabled
+    """
+    if not enabled:
+        return None
+    return AuditCache(name, file_sha256(script_path) or "unknown")
+
+
+def open_cache_from_argv(name: str, script_path: str, argv: list = None) -> Optional[AuditCache]:
+    """open_cache() for an auditor CLI: unchanged files replay cached results unless --no-cache."""
+    argv = sys.argv if argv is None else argv
+    return open_cache(name, script_path, "--no-cache" not in argv)
+
+
+def jobs_from_argv(usage: str, argv: list = None) -> int:
+    """
+    Worker process count from --jobs N (0 = one per CPU; default 1). Exits with
+    the usage line, not a traceback, if N is missing or not a non-negative integer.
+    """
+    argv = sys.argv if argv is None else argv
+    if "--jobs" not in argv:
+        return 1
+    index = argv.index("--jobs") + 1
+    value = argv[index] if index < len(argv) else ""
+    if not value.isdigit():
+        print(f"[ERROR] --jobs expects a non-negative integer, got {value or 'nothing'!r}", file=sys.stderr)
+        print(usage, file=sys.stderr)
+        sys.exit(2)
+    return int(value)
+
+
+def collect_files(directory: str, extensions: set, skip_dirs: set) -> list:
+    """Files under directory with one of extensions, in a stable (sorted) order."""
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if d not in skip_dirs)
+        for file in sorted(files):
+            if Path(file).suffix in extensions:
+                paths.append(os.path.join(root, file))
+    return paths
+
+
+def audit_files(paths: list, analyze, record, cache: AuditCache = None, jobs: int = 1,
+                shard_worker=None, on_shard=None) -> None:
+    """
+    Audit paths and record(result) for each one in path order, replaying cached
+    results; analyze(path) returns None for files that can't be read.
+
+    With jobs > 1 (0 = one per CPU) and a shard_worker, the cache misses are split
+    into contiguous shards audited in a process pool. shard_worker(paths) must be
+    picklable (a module-level function or a partial of one) and return
+    ({path: result or None}, extra); on_shard(extra) receives each shard's extra.
+    The report is identical to a serial run.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    results = {path: cache.get(path) for path in paths} if cache else {}
+    misses = [path for path in paths if results.get(path) is None]
+    if shard_worker is not None and jobs > 1 and len(misses) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        shard_count = min(len(misses), jobs * 4)
+        shards = [misses[i * len(misses) // shard_count:(i + 1) * len(misses) // shard_count] for i in range(shard_count)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for shard_results, extra in pool.map(shard_worker, shards):
+                results.update(shard_results)
+                if on_shard is not None:
+                    on_shard(extra)
+    else:
+        for path in misses:
+            results[path] = analyze(path)
+
+    if cache:
+        for path in misses:
+            if results[path] is not None:
+                cache.put(path, results[path])
+    for path in paths:
+        if results[path] is not None:
+            record(results[path])
@@ -4,7 +4,7 @@ Accessibility Checker - WCAG compliance audit
 Checks HTML files for accessibility issues.
 
 Usage:
-    python accessibility_checker.py <project_path>
+    python accessibility_checker.py <project_path> [--no-cache]
 
 Checks:
     - Form labels
@@ -26,6 +26,9 @@ try:
 except:
     pass
 
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from audit_cache import open_cache_from_argv
+
 
 def find_html_files(project_path: Path) -> list:
     """Find all HTML/JSX/TSX files."""
@@ -135,15 +138,18 @@ def main():
         sys.exit(0)
     
     # Check each file
+    cache = open_cache_from_argv("accessibility_checker", __file__)
     all_issues = []
     
     for f in files:
-        issues = check_accessibility(f)
+        issues = cache.fetch(f, check_accessibility) if cache else check_accessibility(f)
         if issues:
             all_issues.append({
                 "file": str(f.name),
                 "issues": issues
             })
+    if cache:
+        cache.save()
     
     # Summary
     print("\n" + "="*60)
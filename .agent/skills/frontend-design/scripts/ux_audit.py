@@ -88,615 +88,837 @@ Analyzes code for compliance with:
 
 Total: 80+ checks across all design principles
 """
-
 import sys
 import os
 import re
 import json
+import time
+from functools import partial
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from audit_cache import open_cache_from_argv, jobs_from_argv, collect_files, audit_files
+
+AUDIT_EXTENSIONS = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next'}
+
+# ============ SIGNAL TABLE ============
+# Every pattern the checks look for, compiled once at import. Rules ask for a
+# signal by name; each is evaluated at most once per file and shared by every
+# rule that needs it. Case-insensitive signals are written in lower case and
+# run against a lower-cased copy of the file, which is several times faster
+# than re.IGNORECASE over the original.
+#   name: (pattern, case_insensitive)
+SIGNALS = {
+    # 1. Psychology laws
+    "long_text": (r'<p|<div.*class=.*text|article|<span.*text', True),
+    "form": (r'<form|<input|password|credit|card|payment', True),
+    "complex_elements": (r'<input|<select|<textarea|<option', True),
+    "nav_items": (r'<navlink|<link|<a\s+href|nav-item', True),
+    "nav_labels": (r'<navlink|<link|<a\s+href[^>]*>([^<]+)</a>', True),
+    "small_height_px": (r'height:\s*([0-3]\d)px', False),
+    "small_height_class": (r'h-[1-9]\b|h-10\b', False),
+    "form_fields": (r'<input|<select|<textarea', True),
+    "stepper": (r'step|wizard|stage', True),
+    "primary_cta": (r'primary|bg-primary|button.*primary|variant=["\']primary', True),
+    # 1.5 Emotional design
+    "hero": (r'hero|<h1|banner', True),
+    "gradient": (r'gradient|linear-gradient|radial-gradient|conic-gradient', False),
+    "animation": (r'@keyframes|transition:|animate-', False),
+    "background": (r'background:|bg-', False),
+    "feedback": (r'transition|animate|hover:|focus:|disabled|loading|spinner', True),
+    "state_change": (r'setState|useState|disabled|loading', False),
+    "reflective": (r'about|story|mission|values|why we|our journey|testimonials', True),
+    # 1.6 Trust
+    "security": (r'ssl|secure|encrypt|lock|padlock|https', True),
+    "checkout": (r'checkout|payment', True),
+    "social_proof": (r'review|testimonial|rating|star|trust|trusted by|customer|logo', True),
+    "footer": (r'footer|<footer', True),
+    "authority": (r'certif|award|media|press|featured|as seen in', True),
+    # 1.7 Cognitive load
+    "progressive": (r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', True),
+    "color_values": (r'#[0-9a-fA-F]{3,6}|rgb|hsl', False),
+    "borders": (r'border:|border-', False),
+    "labels": (r'<label|placeholder|aria-label', True),
+    # 1.8 Persuasion
+    "defaults": (r'checked|selected|default|value=["\'].*["\']', False),
+    "radio": (r'type=["\']radio', True),
+    "price": (r'price|pricing|cost|\$\d+', True),
+    "anchor": (r'original|was|strike|del|save \d+%', True),
+    "social": (r'join|subscriber|member|user', True),
+    "specific_numbers": (r'\d+[+kmb]|\d+,\d+', False),
+    "progress": (r'progress|step \d+|complete|%|bar', True),
+    # 2. Typography
+    "font_faces": (r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', True),
+    "google_fonts": (r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', True),
+    "font_family": (r'font-family:\s*([^;]+)', True),
+    "line_length": (r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch', False),
+    "text_elements": (r'<p|<span|<div.*text|<h[1-6]', True),
+    "line_height": (r'leading-|line-height:', False),
+    "line_height_values": (r'(?:leading-|line-height:\s*)([\d.]+)', False),
+    "heading_text": (r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', True),
+    "uppercase": (r'uppercase|text-transform:\s*uppercase', True),
+    "tracking": (r'tracking-|letter-spacing:', False),
+    "display_text": (r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx', False),
+    "tracking_tight": (r'tracking-tight|letter-spacing:\s*-[0-9]', False),
+    "font_weights": (r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', True),
+    "font_size_decl": (r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)', False),
+    "fluid_type": (r'clamp\(|responsive:', False),
+    "headings": (r'<(h[1-6])', True),
+    "font_sizes": (r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)', False),
+    "paragraphs": (r'<p[^>]*>([^<]+)</p>', True),
+    "subheadings": (r'<h[2-6]', True),
+    # 3. Visual effects
+    "glass_background": (r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+', False),
+    "keyframes_transition": (r'@keyframes|transition:', False),
+    "layout_props": (r'width|height|top|left|right|bottom|margin|padding', False),
+    "reduced_motion": (r'prefers-reduced-motion', False),
+    "box_shadows": (r'box-shadow:\s*([^;]+)', False),
+    "rgba_alpha": (r'rgba?\([^)]+,\s*([\d.]+)\)', False),
+    "gradient_any_case": (r'gradient', True),
+    "border_decl": (r'border:', False),
+    "text_shadow": (r'text-shadow:', False),
+    "glow": (r'box-shadow:\s*[^;]*0\s+0\s+', False),
+    "images": (r'<img|background-image:|bg-\[url', False),
+    "overlay": (r'overlay|rgba\(0|gradient.*transparent|::after|::before', False),
+    "will_change": (r'will-change:', False),
+    "will_change_values": (r'will-change:\s*([^;]+)', False),
+    "blur": (r'backdrop-filter|blur\(', False),
+    # 4. Color system
+    "hex_colors": (r'#[0-9a-fA-F]{3,6}', False),
+    "hex6_colors": (r'#[0-9a-fA-F]{6}', False),
+    "hsl": (r'hsl\(', False),
+    "hsl_hues": (r'hsl\((\d+),\s*\d+%,\s*\d+%\)', False),
+    "bg_declarations": (r'(?:background|bg-|bg\[)([^;}\s]+)', False),
+    "text_declarations": (r'(?:color|text-)([^;}\s]+)', False),
+    "pure_black": (r'color:\s*#000000|#000\b', False),
+    "pure_white": (r'background:\s*#ffffff|#fff\b', False),
+    "dark_mode": (r'dark:\s*|dark:', False),
+    "light_low_contrast": (r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]', False),
+    "dark_low_contrast": (r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]', False),
+    "blue": (r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}', False),
+    "food": (r'restaurant|food|cooking|recipe|menu|dish|meal', True),
+    "color_vars": (r'--color-|color-|primary-|secondary-', False),
+    # 5. Animation
+    "durations": (r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)', False),
+    "ease_in_entry": (r'ease-in\s+.*entry|fade-in.*ease-in', False),
+    "ease_out_exit": (r'ease-out\s+.*exit|fade-out.*ease-out', False),
+    "interactive": (r'<button|<a\s+href|onClick|@click', False),
+    "hover_focus": (r'hover:|focus:|:hover|:focus', False),
+    "async": (r'async|await|fetch|axios|loading|isLoading', False),
+    "loading_indicator": (r'skeleton|spinner|progress|loading|<circle.*animate', False),
+    "routing": (r'router|navigate|Link.*to|useHistory', False),
+    "page_transition": (r'AnimatePresence|motion\.|transition.*page|fade.*route', False),
+    "scroll_animation": (r'onScroll|scroll.*trigger|IntersectionObserver', False),
+    "scroll_layout": (r'onScroll.*[^\w](width|height|top|left)', False),
+    # 6. Motion graphics
+    "lottie": (r'lottie|Lottie|@lottie-react', False),
+    "lottie_fallback": (r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop', False),
+    "gsap": (r'gsap|ScrollTrigger|from\(.*gsap', False),
+    "gsap_cleanup": (r'kill\(|revert\(|useEffect.*return.*gsap', False),
+    "svg_animation": (r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset', False),
+    "transform_3d": (r'transform3d|perspective\(|rotate3d|translate3d', False),
+    "perspective": (r'perspective:\s*\d+px|perspective\s*\(', False),
+    "particles": (r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js', False),
+    "scroll_driven": (r'IntersectionObserver.*animate|scroll.*progress|view-timeline', False),
+    "throttle": (r'throttle|debounce|requestAnimationFrame', False),
+    "functional_animation": (r'hover:|focus:|disabled|loading|error|success', False),
+    # 7. Accessibility
+    "img_without_alt": (r'<img(?![^>]*alt=)[^>]*>', False),
+}
+
+# (folded pattern, IGNORECASE fallback or None, case_insensitive)
+_COMPILED = {
+    name: (re.compile(pattern), re.compile(pattern, re.IGNORECASE) if ci else None, ci)
+    for name, (pattern, ci) in SIGNALS.items()
+}
+# The only characters re.IGNORECASE matches to an ASCII letter that str.lower()
+# does not map onto it; files containing them use the IGNORECASE patterns instead
+_FOLD_UNSAFE = ('İ', 'ı', 'ſ')
+SHADOW_Y_OFFSET = re.compile(r'\d+px\s+[1-9]\d*px')
+
+GENERIC_FONTS = {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial', 'georgia', 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}
+WEIGHT_NAMES = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500', 'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
+MODULAR_RATIOS = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
+LAYOUT_PROPERTIES = ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']
+PURPLE_TOKENS = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
+                 '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
+                 '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
+                 'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
+IMPORTANT_NAV_WORDS = ['contact', 'login', 'sign', 'get started', 'cta', 'button']
+
+
+class FileContext:
+    """One file's content plus lazily evaluated, memoized signals and findings."""
+
+    def __init__(self, content: str, filename: str):
+        self.content = content
+        self.lower = content.lower()
+        self.filename = filename
+        self.issues = []
+        self.warnings = []
+        self.passed = 0
+        self._fold_exact = not any(ch in content for ch in _FOLD_UNSAFE)
+        self._found = {}
+        self._matches = {}
+
+    def _pattern(self, name: str):
+        folded, ignorecase, ci = _COMPILED[name]
+        if not ci:
+            return folded, self.content
+        if self._fold_exact:
+            return folded, self.lower
+        return ignorecase, self.content
+
+    def has(self, name: str) -> bool:
+        """True if the signal's pattern occurs anywhere in the file."""
+        if name in self._matches:
+            return bool(self._matches[name])
+        if name not in self._found:
+            pattern, text = self._pattern(name)
+            self._found[name] = pattern.search(text) is not None
+        return self._found[name]
+
+    def findall(self, name: str) -> list:
+        """re.findall() result for the signal."""
+        if name not in self._matches:
+            pattern, text = self._pattern(name)
+            self._matches[name] = pattern.findall(text)
+        return self._matches[name]
+
+    def count(self, name: str) -> int:
+        return len(self.findall(name))
+
+    def issue(self, tag: str, message: str) -> None:
+        self.issues.append(f"[{tag}] {self.filename}: {message}")
+
+    def warn(self, tag: str, message: str) -> None:
+        self.warnings.append(f"[{tag}] {self.filename}: {message}")
+
+
+# ============ RULES ============
+# Evaluated in registration order, which is also the order findings are reported in.
+RULES = []
+
+
+def rule(rule_id: str):
+    """Register a check: a function taking a FileContext."""
+    def register(check):
+        RULES.append((rule_id, check))
+        return check
+    return register
+
+
+# --- 1. PSYCHOLOGY LAWS ---
+@rule("psychology.hicks_law")
+def _hicks_law(ctx):
+    nav_items = ctx.count("nav_items")
+    if nav_items > 7:
+        ctx.issue("Hick's Law", f"{nav_items} nav items (Max 7)")
+
+
+@rule("psychology.fitts_law")
+def _fitts_law(ctx):
+    if ctx.has("small_height_px") or ctx.has("small_height_class"):
+        ctx.warn("Fitts' Law", "Small targets (< 44px)")
+
+
+@rule("psychology.millers_law")
+def _millers_law(ctx):
+    form_fields = ctx.count("form_fields")
+    if form_fields > 7 and not ctx.has("stepper"):
+        ctx.warn("Miller's Law", f"Complex form ({form_fields} fields)")
+
+
+@rule("psychology.von_restorff")
+def _von_restorff(ctx):
+    if 'button' in ctx.lower and not ctx.has("primary_cta"):
+        ctx.warn("Von Restorff", "No primary CTA")
+
+
+@rule("psychology.serial_position")
+def _serial_position(ctx):
+    # Important items at beginning/end: is the last nav item a key action (contact, login, etc.)?
+    if ctx.count("nav_items") > 3:
+        nav_content = ctx.findall("nav_labels")
+        if nav_content and len(nav_content) > 2:
+            last_item = nav_content[-1].lower()
+            if not any(x in last_item for x in IMPORTANT_NAV_WORDS):
+                ctx.warn("Serial Position", "Last nav item may not be important. Place key actions at start/end.")
+
+
+# --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
+@rule("emotional.visceral")
+def _visceral(ctx):
+    # First impressions: aesthetics, gradients, animations
+    if ctx.has("hero"):
+        has_visual_interest = ctx.has("gradient") or ctx.has("animation")
+        if not has_visual_interest and not ctx.has("background"):
+            ctx.warn("Visceral", "Hero section lacks visual appeal. Consider gradients or subtle animations.")
+
+
+@rule("emotional.behavioral")
+def _behavioral(ctx):
+    # Instant feedback and usability
+    if 'onClick' in ctx.content or '@click' in ctx.content or 'onclick' in ctx.content:
+        if not ctx.has("feedback") and not ctx.has("state_change"):
+            ctx.warn("Behavioral", "Interactive elements lack immediate feedback. Add hover/focus/disabled states.")
+
+
+@rule("emotional.reflective")
+def _reflective(ctx):
+    # Brand story, values, identity
+    if ctx.has("long_text") and not ctx.has("reflective"):
+        ctx.warn("Reflective", "Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.")
+
+
+# --- 1.6 TRUST BUILDING ---
+@rule("trust.security_signals")
+def _security_signals(ctx):
+    if ctx.has("form"):
+        if not ctx.has("security") and not ctx.has("checkout"):
+            ctx.warn("Trust", "Form without security indicators. Add 'SSL Secure' or lock icon.")
+
+
+@rule("trust.social_proof")
+def _social_proof(ctx):
+    if ctx.has("social_proof"):
+        ctx.passed += 1
+    elif ctx.has("long_text"):
+        ctx.warn("Trust", "No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.")
+
+
+@rule("trust.authority")
+def _authority(ctx):
+    if ctx.has("footer") and not ctx.has("authority"):
+        ctx.warn("Trust", "Footer lacks authority signals. Add certifications, awards, or media mentions.")
+
+
+# --- 1.7 COGNITIVE LOAD MANAGEMENT ---
+@rule("cognitive.progressive_disclosure")
+def _progressive_disclosure(ctx):
+    if ctx.count("complex_elements") > 5 and not ctx.has("progressive"):
+        ctx.warn("Cognitive Load", "Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle.")
+
+
+@rule("cognitive.visual_noise")
+def _visual_noise(ctx):
+    if ctx.count("color_values") > 15 and ctx.count("borders") > 10:
+        ctx.warn("Cognitive Load", "High visual noise detected. Many colors and borders increase cognitive load.")
+
+
+@rule("cognitive.familiar_patterns")
+def _familiar_patterns(ctx):
+    if ctx.has("form") and not ctx.has("labels"):
+        ctx.issue("Cognitive Load", "Form inputs without labels. Use <label> for accessibility and clarity.")
+
+
+# --- 1.8 PERSUASIVE DESIGN (Ethical) ---
+@rule("persuasion.smart_defaults")
+def _smart_defaults(ctx):
+    if ctx.has("form") and ctx.has("radio") and not ctx.has("defaults"):
+        ctx.warn("Persuasion", "Radio buttons without default selection. Pre-select recommended option.")
+
+
+@rule("persuasion.anchoring")
+def _anchoring(ctx):
+    # Show the original price next to a discount
+    if ctx.has("price") and not ctx.has("anchor"):
+        ctx.warn("Persuasion", "Prices without anchoring. Show original price to frame discount value.")
+
+
+@rule("persuasion.social_numbers")
+def _social_numbers(ctx):
+    if ctx.has("social") and not ctx.has("specific_numbers"):
+        ctx.warn("Persuasion", "Social proof without specific numbers. Use 'Join 10,000+' format.")
+
+
+@rule("persuasion.progress")
+def _progress(ctx):
+    if ctx.has("form") and ctx.count("complex_elements") > 5 and not ctx.has("progress"):
+        ctx.warn("Persuasion", "Long form without progress indicator. Add progress bar or 'Step X of Y'.")
+
+
+# --- 2. TYPOGRAPHY SYSTEM ---
+@rule("typography.font_pairing")
+def _font_pairing(ctx):
+    # @font-face, Google Fonts and font-family declarations
+    font_families = set()
+    for font in ctx.findall("font_faces"):
+        font_families.add(font.strip().lower())
+    for font in ctx.findall("google_fonts"):
+        for f in font.replace('+', ' ').split('|'):
+            font_families.add(f.split(':')[0].strip().lower())
+    for family in ctx.findall("font_family"):
+        # First font of the stack
+        first_font = family.split(',')[0].strip().strip('"\'')
+        if first_font.lower() not in GENERIC_FONTS:
+            font_families.add(first_font.lower())
+
+    if len(font_families) > 3:
+        ctx.issue("Typography", f"{len(font_families)} font families detected. Limit to 2-3 for cohesion.")
+
+
+@rule("typography.line_length")
+def _line_length(ctx):
+    if ctx.has("long_text") and not ctx.has("line_length"):
+        ctx.warn("Typography", "No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].")
+
+
+@rule("typography.line_height")
+def _line_height(ctx):
+    if ctx.has("text_elements") and not ctx.has("line_height"):
+        ctx.warn("Typography", "Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3")
+
+    # Headings should be tighter than body text
+    if ctx.has("heading_text"):
+        for lh in ctx.findall("line_height_values"):
+            if float(lh) > 1.5:
+                ctx.warn("Typography", f"Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3).")
+
+
+@rule("typography.letter_spacing")
+def _letter_spacing(ctx):
+    if ctx.has("uppercase") and not ctx.has("tracking"):
+        ctx.warn("Typography", "Uppercase text without tracking. ALL CAPS needs +5-10% spacing.")
+
+    # Large display text should have negative tracking
+    if ctx.has("display_text") and not ctx.has("tracking_tight"):
+        ctx.warn("Typography", "Large display text without tracking-tight. Big text needs -1% to -4% spacing.")
+
+
+@rule("typography.weight_contrast")
+def _weight_contrast(ctx):
+    weight_values = []
+    for w in ctx.findall("font_weights"):
+        val = w[0] or w[1]
+        if val:
+            val = WEIGHT_NAMES.get(val.lower(), val)
+            try:
+                weight_values.append(int(val))
+            except ValueError:
+                pass
+
+    # Adjacent weights (400/500, 500/600, etc.)
+    for i in range(len(weight_values) - 1):
+        if abs(weight_values[i] - weight_values[i+1]) == 100:
+            ctx.warn("Typography", f"Adjacent font weights ({weight_values[i]}/{weight_values[i+1]}). Skip at least 2 levels for contrast.")
+
+    unique_weights = set(weight_values)
+    if len(unique_weights) > 4:
+        ctx.warn("Typography", f"{len(unique_weights)} font weights. Limit to 3-4 per page.")
+
+
+@rule("typography.fluid_sizing")
+def _fluid_sizing(ctx):
+    if ctx.has("font_size_decl") and not ctx.has("fluid_type"):
+        ctx.warn("Typography", "Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)")
+
+
+@rule("typography.hierarchy")
+def _hierarchy(ctx):
+    headings = ctx.findall("headings")
+    if headings:
+        # Skipped levels (h1 -> h3)
+        for i in range(len(headings) - 1):
+            curr = int(headings[i][1])
+            next_h = int(headings[i+1][1])
+            if next_h > curr + 1:
+                ctx.warn("Typography", f"Skipped heading level (h{curr} -> h{next_h}). Maintain sequential hierarchy.")
+
+        if 'h1' not in [h.lower() for h in headings] and ctx.has("long_text"):
+            ctx.warn("Typography", "No h1 found. Each page should have one primary heading.")
+
+
+@rule("typography.modular_scale")
+def _modular_scale(ctx):
+    size_values = []
+    for size, unit in ctx.findall("font_sizes"):
+        if unit == 'rem' or unit == 'em':
+            size_values.append(float(size))
+        elif unit == 'px':
+            size_values.append(float(size) / 16)  # Normalize to rem
+
+    if len(size_values) > 2:
+        sorted_sizes = sorted(set(size_values))
+        ratios = [sorted_sizes[i] / sorted_sizes[i-1] for i in range(1, len(sorted_sizes)) if sorted_sizes[i-1] > 0]
+        for ratio in ratios[:3]:  # Check first 3 ratios
+            if not any(abs(ratio - cr) < 0.05 for cr in MODULAR_RATIOS):
+                ctx.warn("Typography", f"Font sizes may not follow modular scale (ratio: {ratio:.2f}). Consider consistent ratio like 1.25 (Major Third).")
+                break
+
+
+@rule("typography.readability")
+def _readability(ctx):
+    paragraphs = ctx.findall("paragraphs")
+    for p in paragraphs:
+        word_count = len(p.split())
+        if word_count > 100:  # ~5-6 lines
+            ctx.warn("Typography", f"Long paragraph detected ({word_count} words). Break into 3-4 line chunks for readability.")
+
+    if len(paragraphs) > 5 and not ctx.has("subheadings"):
+        ctx.warn("Typography", "Long content without subheadings. Add h2/h3 to break up text.")
+
+
+# --- 3. VISUAL EFFECTS ---
+@rule("visual.glassmorphism")
+def _glassmorphism(ctx):
+    if 'backdrop-filter' in ctx.content or 'blur(' in ctx.content:
+        if not ctx.has("glass_background"):
+            ctx.warn("Visual", "Blur used without semi-transparent background (Glassmorphism fail)")
+
+
+@rule("visual.gpu_acceleration")
+def _gpu_acceleration(ctx):
+    if ctx.has("keyframes_transition"):
+        expensive_props = ctx.findall("layout_props")
+        if expensive_props:
+            ctx.warn("Performance", f"Animating expensive properties ({', '.join(set(expensive_props))}). Use transform/opacity where possible.")
+        if not ctx.has("reduced_motion"):
+            ctx.warn("Accessibility", "Animations found without prefers-reduced-motion check")
+
+
+@rule("visual.natural_shadows")
+def _natural_shadows(ctx):
+    for shadow in ctx.findall("box_shadows"):
+        # Natural shadows have Y > X offset or multiple layers
+        if ',' not in shadow and not SHADOW_Y_OFFSET.search(shadow):
+            ctx.warn("Visual", "Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.")
+
+
+@rule("visual.neomorphism")
+def _neomorphism(ctx):
+    # Dual shadows with opposite offsets; inset means a pressed state
+    for shadow in ctx.findall("box_shadows"):
+        if ',' in shadow and '-' in shadow and 'inset' in shadow:
+            ctx.warn("Visual", "Neomorphism inset detected. Ensure adequate contrast for accessibility.")
+
+
+@rule("visual.shadow_hierarchy")
+def _shadow_hierarchy(ctx):
+    shadow_count = ctx.count("box_shadows")
+    if shadow_count > 0:
+        shadow_opacities = [float(o) for o in ctx.findall("rgba_alpha") if float(o) < 0.5]
+        if shadow_count >= 3 and len(shadow_opacities) > 0 and len(set(shadow_opacities)) < 2:
+            ctx.warn("Visual", "All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.")
+
+
+@rule("visual.gradients")
+def _gradients(ctx):
+    if ctx.has("gradient"):
+        gradient_count = ctx.count("gradient_any_case")
+        if gradient_count > 5:
+            ctx.warn("Visual", f"Many gradients detected ({gradient_count}). Ensure this serves purpose, not decoration.")
+    elif ctx.has("hero") and not ctx.has("background"):
+        ctx.warn("Visual", "Hero section without visual interest. Consider gradient for depth.")
+
+
+@rule("visual.borders")
+def _borders(ctx):
+    if ctx.has("borders"):
+        border_count = ctx.count("border_decl")
+        if border_count > 8:
+            ctx.warn("Visual", f"Many border declarations ({border_count}). Simplify for cleaner look.")
+
+
+@rule("visual.glow")
+def _glow(ctx):
+    # Multiple text-shadow layers indicate glow
+    for ts in ctx.findall("text_shadow"):
+        if ',' in ts:
+            ctx.warn("Visual", "Text glow effect detected. Ensure readability is maintained.")
+
+    # Box-shadow glow: zero-offset layers
+    if ctx.count("glow") > 2:
+        ctx.warn("Visual", "Multiple glow effects detected. Use sparingly for emphasis only.")
+
+
+@rule("visual.overlays")
+def _overlays(ctx):
+    if ctx.has("images") and ctx.has("long_text") and not ctx.has("overlay"):
+        ctx.warn("Visual", "Text over image without overlay. Add gradient overlay for readability.")
+
+
+@rule("visual.will_change")
+def _will_change(ctx):
+    if ctx.has("will_change"):
+        for prop in ctx.findall("will_change_values"):
+            prop = prop.strip().lower()
+            if prop in LAYOUT_PROPERTIES:
+                ctx.issue("Performance", f"will-change on '{prop}' (layout property). Use only for transform/opacity.")
+
+    will_change_count = ctx.count("will_change")
+    if will_change_count > 3:
+        ctx.warn("Performance", f"Many will-change declarations ({will_change_count}). Use sparingly, only for heavy animations.")
+
+
+@rule("visual.effect_selection")
+def _effect_selection(ctx):
+    effect_count = (
+        (1 if ctx.has("gradient") else 0) +
+        ctx.count("box_shadows") +
+        ctx.count("blur") +
+        ctx.count("text_shadow")
+    )
+    if effect_count > 10:
+        ctx.warn("Visual", f"Many visual effects ({effect_count}). Ensure effects serve purpose, not decoration.")
+
+    # Static/flat design (no depth)
+    if ctx.has("long_text") and effect_count == 0:
+        ctx.warn("Visual", "Flat design with no depth. Consider shadows or subtle gradients for hierarchy.")
+
+
+# --- 4. COLOR SYSTEM ---
+@rule("color.purple_ban")
+def _purple_ban(ctx):
+    for purple in PURPLE_TOKENS:
+        if purple.lower() in ctx.lower:
+            ctx.issue("Color", f"PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.")
+            break
+
+
+@rule("color.60_30_10")
+def _sixty_thirty_ten(ctx):
+    total_colors = ctx.count("hex_colors") + ctx.count("hsl")
+    if total_colors > 3 and ctx.has("bg_declarations") and ctx.has("text_declarations"):
+        unique_hexes = set(ctx.findall("hex6_colors"))
+        if len(unique_hexes) > 5:
+            ctx.warn("Color", f"{len(unique_hexes)} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).")
+
+
+@rule("color.scheme")
+def _color_scheme(ctx):
+    # Monochromatic: same hue, different lightness
+    hsl_matches = ctx.findall("hsl_hues")
+    if len(hsl_matches) >= 3:
+        hues = [int(h) for h in hsl_matches]
+        hue_range = max(hues) - min(hues)
+        if hue_range < 10:
+            ctx.warn("Color", f"Monochromatic palette detected (hue variance: {hue_range}deg). Ensure adequate contrast.")
+
+
+@rule("color.dark_mode")
+def _dark_mode(ctx):
+    # Pure black / pure white are forbidden
+    if ctx.has("pure_black"):
+        ctx.warn("Color", "Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.")
+    if ctx.has("pure_white") and ctx.has("dark_mode"):
+        ctx.warn("Color", "Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain.")
+
+
+@rule("color.contrast")
+def _contrast(ctx):
+    if ctx.has("light_low_contrast") or ctx.has("dark_low_contrast"):
+        ctx.warn("Color", "Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).")
+
+
+@rule("color.psychology")
+def _color_psychology(ctx):
+    # Blue suppresses appetite
+    if ctx.has("blue") and ctx.has("food"):
+        ctx.warn("Color", "Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).")
+
+
+@rule("color.hsl_palette")
+def _hsl_palette(ctx):
+    if ctx.has("color_vars") and not ctx.has("hsl"):
+        ctx.warn("Color", "Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness).")
+
+
+# --- 5. ANIMATION GUIDE ---
+@rule("animation.duration")
+def _duration(ctx):
+    for duration, unit in ctx.findall("durations"):
+        duration_ms = float(duration) * (1000 if unit == 's' else 1)
+        if duration_ms < 50:
+            ctx.warn("Animation", f"Very fast animation ({duration}{unit}). Minimum 50ms for visibility.")
+        elif duration_ms > 1000 and 'transition' in ctx.lower:
+            ctx.warn("Animation", f"Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.")
+
+
+@rule("animation.easing")
+def _easing(ctx):
+    if ctx.has("ease_in_entry"):
+        ctx.warn("Animation", "Entry animation with ease-in. Entry should use ease-out for snappy feel.")
+    if ctx.has("ease_out_exit"):
+        ctx.warn("Animation", "Exit animation with ease-out. Exit should use ease-in for natural feel.")
+
+
+@rule("animation.micro_interactions")
+def _micro_interactions(ctx):
+    if ctx.count("interactive") > 2 and not ctx.has("hover_focus"):
+        ctx.warn("Animation", "Interactive elements without hover/focus states. Add micro-interactions for feedback.")
+
+
+@rule("animation.loading_states")
+def _loading_states(ctx):
+    if ctx.has("async") and not ctx.has("loading_indicator"):
+        ctx.warn("Animation", "Async operations without loading indicator. Add skeleton or spinner for perceived performance.")
+
+
+@rule("animation.page_transitions")
+def _page_transitions(ctx):
+    if ctx.has("routing") and not ctx.has("page_transition"):
+        ctx.warn("Animation", "Routing detected without page transitions. Consider fade/slide for context continuity.")
+
+
+@rule("animation.scroll_performance")
+def _scroll_performance(ctx):
+    if ctx.has("scroll_animation") and ctx.has("scroll_layout"):
+        ctx.issue("Animation", "Scroll handler animating layout properties. Use transform/opacity for 60fps.")
+
+
+# --- 6. MOTION GRAPHICS ---
+@rule("motion.lottie")
+def _lottie(ctx):
+    if ctx.has("lottie") and not ctx.has("lottie_fallback"):
+        ctx.warn("Motion", "Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.")
+
+
+@rule("motion.gsap_cleanup")
+def _gsap_cleanup(ctx):
+    if ctx.has("gsap") and not ctx.has("gsap_cleanup"):
+        ctx.issue("Motion", "GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.")
+
+
+@rule("motion.svg_animation")
+def _svg_animation(ctx):
+    if ctx.count("svg_animation") > 3:
+        ctx.warn("Motion", "Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance.")
+
+
+@rule("motion.3d_transforms")
+def _transforms_3d(ctx):
+    if ctx.has("transform_3d"):
+        if not ctx.has("perspective"):
+            ctx.warn("Motion", "3D transform without perspective parent. Add perspective: 1000px for realistic depth.")
+        ctx.warn("Motion", "3D transforms detected. Test on mobile; can impact performance on low-end devices.")
+
+
+@rule("motion.particles")
+def _particles(ctx):
+    if ctx.has("particles"):
+        ctx.warn("Motion", "Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.")
+
+
+@rule("motion.scroll_driven")
+def _scroll_driven(ctx):
+    if ctx.has("scroll_driven") and not ctx.has("throttle"):
+        ctx.issue("Motion", "Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.")
+
+
+@rule("motion.purpose")
+def _motion_purpose(ctx):
+    # Animation should serve a purpose, not just decorate
+    total_animations = (
+        ctx.count("animation") +
+        (1 if ctx.has("lottie") else 0) +
+        (1 if ctx.has("gsap") else 0)
+    )
+    if total_animations > 5 and ctx.count("functional_animation") < total_animations / 2:
+        ctx.warn("Motion", f"Many animations ({total_animations}). Ensure majority serve functional purpose (feedback, guidance), not decoration.")
+
+
+# --- 7. ACCESSIBILITY ---
+@rule("accessibility.img_alt")
+def _img_alt(ctx):
+    if ctx.has("img_without_alt"):
+        ctx.issue("Accessibility", "Missing img alt text")
+
+
 class UXAuditor:
-    def __init__(self):
+    def __init__(self, profile: bool = False, cache=None):
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
+        # rule id -> seconds; a signal's cost lands on the first rule that needs it
+        self.profile = profile
+        self.rule_timings = {}
+        # Optional audit_cache.AuditCache: unchanged files replay their findings
+        self.cache = cache
     
     def audit_file(self, filepath: str) -> None:
+        result = self.cache.get(filepath) if self.cache else None
+        if result is None:
+            result = self.analyze_file(filepath)
+            if result is None:
+                return
+            if self.cache:
+                self.cache.put(filepath, result)
+        self._record(result)
+
+    def analyze_file(self, filepath: str):
+        """Run every rule on one file; None if it can't be read."""
         try:
             with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
                 content = f.read()
-        except: return
+        except: return None
         
-        self.files_checked += 1
-        filename = os.path.basename(filepath)
-
-        # Pre-calculate common flags
-        has_long_text = bool(re.search(r'<p|<div.*class=.*text|article|<span.*text', content, re.IGNORECASE))
-        has_form = bool(re.search(r'<form|<input|password|credit|card|payment', content, re.IGNORECASE))
-        complex_elements = len(re.findall(r'<input|<select|<textarea|<option', content, re.IGNORECASE))
-
-        # --- 1. PSYCHOLOGY LAWS ---
-        # Hick's Law
-        nav_items = len(re.findall(r'<NavLink|<Link|<a\s+href|nav-item', content, re.IGNORECASE))
-        if nav_items > 7:
-            self.issues.append(f"[Hick's Law] {filename}: {nav_items} nav items (Max 7)")
-        
-        # Fitts' Law
-        if re.search(r'height:\s*([0-3]\d)px', content) or re.search(r'h-[1-9]\b|h-10\b', content):
-            self.warnings.append(f"[Fitts' Law] {filename}: Small targets (< 44px)")
-        
-        # Miller's Law
-        form_fields = len(re.findall(r'<input|<select|<textarea', content, re.IGNORECASE))
-        if form_fields > 7 and not re.search(r'step|wizard|stage', content, re.IGNORECASE):
-            self.warnings.append(f"[Miller's Law] {filename}: Complex form ({form_fields} fields)")
-            
-        # Von Restorff
-        if 'button' in content.lower() and not re.search(r'primary|bg-primary|Button.*primary|variant=["\']primary', content, re.IGNORECASE):
-            self.warnings.append(f"[Von Restorff] {filename}: No primary CTA")
-
-        # Serial Position Effect - Important items at beginning/end
-        if nav_items > 3:
-            # Check if last nav item is important (contact, login, etc.)
-            nav_content = re.findall(r'<NavLink|<Link|<a\s+href[^>]*>([^<]+)</a>', content, re.IGNORECASE)
-            if nav_content and len(nav_content) > 2:
-                last_item = nav_content[-1].lower() if nav_content else ''
-                if not any(x in last_item for x in ['contact', 'login', 'sign', 'get started', 'cta', 'button']):
-                    self.warnings.append(f"[Serial Position] {filename}: Last nav item may not be important. Place key actions at start/end.")
-
-        # --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
-
-        # Visceral: First impressions (aesthetics, gradients, animations)
-        has_hero = bool(re.search(r'hero|<h1|banner', content, re.IGNORECASE))
-        if has_hero:
-            # Check for visual appeal elements
-            has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient', content))
-            has_animation = bool(re.search(r'@keyframes|transition:|animate-', content))
-            has_visual_interest = has_gradient or has_animation
-
-            if not has_visual_interest and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visceral] {filename}: Hero section lacks visual appeal. Consider gradients or subtle animations.")
-
-        # Behavioral: Instant feedback and usability
-        if 'onClick' in content or '@click' in content or 'onclick' in content:
-            has_feedback = re.search(r'transition|animate|hover:|focus:|disabled|loading|spinner', content, re.IGNORECASE)
-            has_state_change = re.search(r'setState|useState|disabled|loading', content)
-
-            if not has_feedback and not has_state_change:
-                self.warnings.append(f"[Behavioral] {filename}: Interactive elements lack immediate feedback. Add hover/focus/disabled states.")
-
-        # Reflective: Brand story, values, identity
-        has_reflective = bool(re.search(r'about|story|mission|values|why we|our journey|testimonials', content, re.IGNORECASE))
-        if has_long_text and not has_reflective:
-            self.warnings.append(f"[Reflective] {filename}: Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.")
-
-        # --- 1.6 TRUST BUILDING (Enhanced) ---
-
-        # Security signals
-        if has_form:
-            security_signals = re.findall(r'ssl|secure|encrypt|lock|padlock|https', content, re.IGNORECASE)
-            if len(security_signals) == 0 and not re.search(r'checkout|payment', content, re.IGNORECASE):
-                self.warnings.append(f"[Trust] {filename}: Form without security indicators. Add 'SSL Secure' or lock icon.")
-
-        # Social proof elements
-        social_proof = re.findall(r'review|testimonial|rating|star|trust|trusted by|customer|logo', content, re.IGNORECASE)
-        if len(social_proof) > 0:
-            self.passed_count += 1
+        ctx = FileContext(content, os.path.basename(filepath))
+        if self.profile:
+            for rule_id, check in RULES:
+                start = time.perf_counter()
+                check(ctx)
+                self.rule_timings[rule_id] = self.rule_timings.get(rule_id, 0.0) + time.perf_counter() - start
         else:
-            if has_long_text:
-                self.warnings.append(f"[Trust] {filename}: No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.")
-
-        # Authority indicators
-        has_footer = bool(re.search(r'footer|<footer', content, re.IGNORECASE))
-        if has_footer:
-            authority = re.findall(r'certif|award|media|press|featured|as seen in', content, re.IGNORECASE)
-            if len(authority) == 0:
-                self.warnings.append(f"[Trust] {filename}: Footer lacks authority signals. Add certifications, awards, or media mentions.")
-
-        # --- 1.7 COGNITIVE LOAD MANAGEMENT ---
-
-        # Progressive disclosure
-        if complex_elements > 5:
-            has_progressive = re.search(r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', content, re.IGNORECASE)
-            if not has_progressive:
-                self.warnings.append(f"[Cognitive Load] {filename}: Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle.")
-
-        # Visual noise check
-        has_many_colors = len(re.findall(r'#[0-9a-fA-F]{3,6}|rgb|hsl', content)) > 15
-        has_many_borders = len(re.findall(r'border:|border-', content)) > 10
-        if has_many_colors and has_many_borders:
-            self.warnings.append(f"[Cognitive Load] {filename}: High visual noise detected. Many colors and borders increase cognitive load.")
-
-        # Familiar patterns
-        if has_form:
-            has_standard_labels = bool(re.search(r'<label|placeholder|aria-label', content, re.IGNORECASE))
-            if not has_standard_labels:
-                self.issues.append(f"[Cognitive Load] {filename}: Form inputs without labels. Use <label> for accessibility and clarity.")
-
-        # --- 1.8 PERSUASIVE DESIGN (Ethical) ---
-
-        # Smart defaults
-        if has_form:
-            has_defaults = bool(re.search(r'checked|selected|default|value=["\'].*["\']', content))
-            radio_inputs = len(re.findall(r'type=["\']radio', content, re.IGNORECASE))
-            if radio_inputs > 0 and not has_defaults:
-                self.warnings.append(f"[Persuasion] {filename}: Radio buttons without default selection. Pre-select recommended option.")
-
-        # Anchoring (showing original price)
-        if re.search(r'price|pricing|cost|\$\d+', content, re.IGNORECASE):
-            has_anchor = bool(re.search(r'original|was|strike|del|save \d+%', content, re.IGNORECASE))
-            if not has_anchor:
-                self.warnings.append(f"[Persuasion] {filename}: Prices without anchoring. Show original price to frame discount value.")
-
-        # Social proof live indicators
-        has_social = bool(re.search(r'join|subscriber|member|user', content, re.IGNORECASE))
-        if has_social:
-            has_count = bool(re.findall(r'\d+[+kmb]|\d+,\d+', content))
-            if not has_count:
-                self.warnings.append(f"[Persuasion] {filename}: Social proof without specific numbers. Use 'Join 10,000+' format.")
-
-        # Progress indicators
-        if has_form:
-            has_progress = bool(re.search(r'progress|step \d+|complete|%|bar', content, re.IGNORECASE))
-            if complex_elements > 5 and not has_progress:
-                self.warnings.append(f"[Persuasion] {filename}: Long form without progress indicator. Add progress bar or 'Step X of Y'.")
-
-        # --- 2. TYPOGRAPHY SYSTEM (Complete Coverage) ---
-
-        # 2.1 Font Pairing - Too many font families
-        font_families = set()
-        # Check for @font-face, Google Fonts, font-family declarations
-        font_faces = re.findall(r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', content, re.IGNORECASE)
-        google_fonts = re.findall(r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', content, re.IGNORECASE)
-        font_family_css = re.findall(r'font-family:\s*([^;]+)', content, re.IGNORECASE)
-
-        for font in font_faces: font_families.add(font.strip().lower())
-        for font in google_fonts:
-            for f in font.replace('+', ' ').split('|'):
-                font_families.add(f.split(':')[0].strip().lower())
-        for family in font_family_css:
-            # Extract first font from stack
-            first_font = family.split(',')[0].strip().strip('"\'')
-
-            if first_font.lower() not in {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial', 'georgia', 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}:
-                font_families.add(first_font.lower())
-
-        if len(font_families) > 3:
-            self.issues.append(f"[Typography] {filename}: {len(font_families)} font families detected. Limit to 2-3 for cohesion.")
-
-        # 2.2 Line Length - Character-based width
-        if has_long_text and not re.search(r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch', content):
-            self.warnings.append(f"[Typography] {filename}: No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].")
-
-        # 2.3 Line Height - Proper leading ratios
-        # Check for text without proper line-height
-        text_elements = len(re.findall(r'<p|<span|<div.*text|<h[1-6]', content, re.IGNORECASE))
-        if text_elements > 0 and not re.search(r'leading-|line-height:', content):
-            self.warnings.append(f"[Typography] {filename}: Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3")
-
-        # Check for heading-specific line height issues
-        if re.search(r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', content, re.IGNORECASE):
-            # Extract line-height values
-            line_heights = re.findall(r'(?:leading-|line-height:\s*)([\d.]+)', content)
-            for lh in line_heights:
-                if float(lh) > 1.5:
-                    self.warnings.append(f"[Typography] {filename}: Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3).")
-
-        # 2.4 Letter Spacing (Tracking)
-        # Uppercase without tracking
-        if re.search(r'uppercase|text-transform:\s*uppercase', content, re.IGNORECASE):
-            if not re.search(r'tracking-|letter-spacing:', content):
-                self.warnings.append(f"[Typography] {filename}: Uppercase text without tracking. ALL CAPS needs +5-10% spacing.")
-
-        # Large text (display/hero) should have negative tracking
-        if re.search(r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx', content):
-            if not re.search(r'tracking-tight|letter-spacing:\s*-[0-9]', content):
-                self.warnings.append(f"[Typography] {filename}: Large display text without tracking-tight. Big text needs -1% to -4% spacing.")
-
-        # 2.5 Weight and Emphasis - Contrast levels
-        # Check for adjacent weight levels (poor contrast)
-        weights = re.findall(r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', content, re.IGNORECASE)
-        weight_values = []
-        for w in weights:
-            val = w[0] or w[1]
-            if val:
-                # Map named weights to numbers
-                weight_map = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500', 'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
-                val = weight_map.get(val.lower(), val)
-                try:
-                    weight_values.append(int(val))
-                except: pass
-
-        # Check for adjacent weights (400/500, 500/600, etc.)
-        for i in range(len(weight_values) - 1):
-            diff = abs(weight_values[i] - weight_values[i+1])
-            if diff == 100:
-                self.warnings.append(f"[Typography] {filename}: Adjacent font weights ({weight_values[i]}/{weight_values[i+1]}). Skip at least 2 levels for contrast.")
-
-        # Too many weight levels
-        unique_weights = set(weight_values)
-        if len(unique_weights) > 4:
-            self.warnings.append(f"[Typography] {filename}: {len(unique_weights)} font weights. Limit to 3-4 per page.")
-
-        # 2.6 Responsive Typography - Fluid sizing with clamp()
-        has_font_sizes = bool(re.search(r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)', content))
-        if has_font_sizes and not re.search(r'clamp\(|responsive:', content):
-            self.warnings.append(f"[Typography] {filename}: Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)")
-
-        # 2.7 Hierarchy - Heading structure
-        headings = re.findall(r'<(h[1-6])', content, re.IGNORECASE)
-        if headings:
-            # Check for skipped levels (h1 -> h3)
-            for i in range(len(headings) - 1):
-                curr = int(headings[i][1])
-                next_h = int(headings[i+1][1])
-                if next_h > curr + 1:
-                    self.warnings.append(f"[Typography] {filename}: Skipped heading level (h{curr} -> h{next_h}). Maintain sequential hierarchy.")
-
-            # Check if h1 exists for main content
-            if 'h1' not in [h.lower() for h in headings] and has_long_text:
-                self.warnings.append(f"[Typography] {filename}: No h1 found. Each page should have one primary heading.")
-
-        # 2.8 Modular Scale - Consistent sizing
-        # Extract font-size values
-        font_sizes = re.findall(r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)', content)
-        size_values = []
-        for size, unit in font_sizes:
-            if unit == 'rem' or unit == 'em':
-                size_values.append(float(size))
-            elif unit == 'px':
-                size_values.append(float(size) / 16)  # Normalize to rem
-
-        if len(size_values) > 2:
-            # Check if sizes follow a modular scale roughly
-            sorted_sizes = sorted(set(size_values))
-            ratios = []
-            for i in range(1, len(sorted_sizes)):
-                if sorted_sizes[i-1] > 0:
-                    ratios.append(sorted_sizes[i] / sorted_sizes[i-1])
-
-            # Common scale ratios: 1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618
-            common_ratios = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
-            for ratio in ratios[:3]:  # Check first 3 ratios
-                if not any(abs(ratio - cr) < 0.05 for cr in common_ratios):
-                    self.warnings.append(f"[Typography] {filename}: Font sizes may not follow modular scale (ratio: {ratio:.2f}). Consider consistent ratio like 1.25 (Major Third).")
-                    break
-
-        # 2.9 Readability - Content chunking
-        # Check for very long paragraphs (>5 lines estimated)
-        paragraphs = re.findall(r'<p[^>]*>([^<]+)</p>', content, re.IGNORECASE)
-        for p in paragraphs:
-            word_count = len(p.split())
-            if word_count > 100:  # ~5-6 lines
-                self.warnings.append(f"[Typography] {filename}: Long paragraph detected ({word_count} words). Break into 3-4 line chunks for readability.")
-
-        # Check for missing subheadings in long content
-        if len(paragraphs) > 5:
-            subheadings = len(re.findall(r'<h[2-6]', content, re.IGNORECASE))
-            if subheadings == 0:
-                self.warnings.append(f"[Typography] {filename}: Long content without subheadings. Add h2/h3 to break up text.")
-
-        # --- 3. VISUAL EFFECTS (visual-effects.md) ---
-        
-        # Glassmorphism Check
-        if 'backdrop-filter' in content or 'blur(' in content:
-            if not re.search(r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+', content):
-                self.warnings.append(f"[Visual] {filename}: Blur used without semi-transparent background (Glassmorphism fail)")
-        
-        # GPU Acceleration / Performance
-        if re.search(r'@keyframes|transition:', content):
-            expensive_props = re.findall(r'width|height|top|left|right|bottom|margin|padding', content)
-            if expensive_props:
-                self.warnings.append(f"[Performance] {filename}: Animating expensive properties ({', '.join(set(expensive_props))}). Use transform/opacity where possible.")
-            
-            # Reduced Motion
-            if not re.search(r'prefers-reduced-motion', content):
-                self.warnings.append(f"[Accessibility] {filename}: Animations found without prefers-reduced-motion check")
-
-        # Natural Shadows
-        shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in shadows:
-            # Check if natural (Y > X) or multiple layers
-            if ',' not in shadow and not re.search(r'\d+px\s+[1-9]\d*px', shadow): # Simple heuristic for Y-offset
-                 self.warnings.append(f"[Visual] {filename}: Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.")
-
-        # --- 3.1 NEOMORPHISM CHECK ---
-        # Check for neomorphism patterns (dual shadows with opposite directions)
-        neo_shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in neo_shadows:
-            # Neomorphism has two shadows: positive offset + negative offset
-            if ',' in shadow and '-' in shadow:
-                # Check for inset pattern (pressed state)
-                if 'inset' in shadow:
-                    self.warnings.append(f"[Visual] {filename}: Neomorphism inset detected. Ensure adequate contrast for accessibility.")
-
-        # --- 3.2 SHADOW HIERARCHY ---
-        # Count shadow levels to check for elevation consistency
-        shadow_count = len(shadows)
-        if shadow_count > 0:
-            # Check for shadow opacity levels (should indicate hierarchy)
-            opacities = re.findall(r'rgba?\([^)]+,\s*([\d.]+)\)', content)
-            shadow_opacities = [float(o) for o in opacities if float(o) < 0.5]
-            if shadow_count >= 3 and len(shadow_opacities) > 0:
-                # Check if there's variety in shadow opacities for different elevations
-                unique_opacities = len(set(shadow_opacities))
-                if unique_opacities < 2:
-                    self.warnings.append(f"[Visual] {filename}: All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.")
-
-        # --- 3.3 GRADIENT CHECKS ---
-        # Check for gradient usage
-        has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient|conic-gradient', content))
-        if has_gradient:
-            # Warn about mesh/aurora gradients (can be overused)
-            gradient_count = len(re.findall(r'gradient', content, re.IGNORECASE))
-            if gradient_count > 5:
-                self.warnings.append(f"[Visual] {filename}: Many gradients detected ({gradient_count}). Ensure this serves purpose, not decoration.")
-        else:
-            # Check if hero section exists without gradient
-            if has_hero and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visual] {filename}: Hero section without visual interest. Consider gradient for depth.")
-
-        # --- 3.4 BORDER EFFECTS ---
-        # Check for gradient borders or animated borders
-        has_border = bool(re.search(r'border:|border-', content))
-        if has_border:
-            # Check for overly complex borders
-            border_count = len(re.findall(r'border:', content))
-            if border_count > 8:
-                self.warnings.append(f"[Visual] {filename}: Many border declarations ({border_count}). Simplify for cleaner look.")
-
-        # --- 3.5 GLOW EFFECTS ---
-        # Check for text-shadow or multiple box-shadow layers (glow effects)
-        text_shadows = re.findall(r'text-shadow:', content)
-        for ts in text_shadows:
-            # Multiple text-shadow layers indicate glow
-            if ',' in ts:
-                self.warnings.append(f"[Visual] {filename}: Text glow effect detected. Ensure readability is maintained.")
-
-        # Check for box-shadow glow (multiple layers with 0 offset)
-        glow_shadows = re.findall(r'box-shadow:\s*[^;]*0\s+0\s+', content)
-        if len(glow_shadows) > 2:
-            self.warnings.append(f"[Visual] {filename}: Multiple glow effects detected. Use sparingly for emphasis only.")
-
-        # --- 3.6 OVERLAY TECHNIQUES ---
-        # Check for image overlays (for readability)
-        has_images = bool(re.search(r'<img|background-image:|bg-\[url', content))
-        if has_images and has_long_text:
-            has_overlay = bool(re.search(r'overlay|rgba\(0|gradient.*transparent|::after|::before', content))
-            if not has_overlay:
-                self.warnings.append(f"[Visual] {filename}: Text over image without overlay. Add gradient overlay for readability.")
-
-        # --- 3.7 PERFORMANCE: will-change ---
-        # Check for will-change usage
-        if re.search(r'will-change:', content):
-            will_change_props = re.findall(r'will-change:\s*([^;]+)', content)
-            for prop in will_change_props:
-                prop = prop.strip().lower()
-                if prop in ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']:
-                    self.issues.append(f"[Performance] {filename}: will-change on '{prop}' (layout property). Use only for transform/opacity.")
-
-        # Check for excessive will-change usage
-        will_change_count = len(re.findall(r'will-change:', content))
-        if will_change_count > 3:
-            self.warnings.append(f"[Performance] {filename}: Many will-change declarations ({will_change_count}). Use sparingly, only for heavy animations.")
-
-        # --- 3.8 EFFECT SELECTION ---
-        # Check for effect overuse (too many visual effects)
-        effect_count = (
-            (1 if has_gradient else 0) +
-            shadow_count +
-            len(re.findall(r'backdrop-filter|blur\(', content)) +
-            len(re.findall(r'text-shadow:', content))
-        )
-        if effect_count > 10:
-            self.warnings.append(f"[Visual] {filename}: Many visual effects ({effect_count}). Ensure effects serve purpose, not decoration.")
-
-        # Check for static/flat design (no depth)
-        if has_long_text and effect_count == 0:
-            self.warnings.append(f"[Visual] {filename}: Flat design with no depth. Consider shadows or subtle gradients for hierarchy.")
-
-        # --- 4. COLOR SYSTEM (color-system.md) ---
-
-        # 4.1 PURPLE BAN - Critical check from color-system.md
-        purple_hexes = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
-                        '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
-                        '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
-                        'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
-        for purple in purple_hexes:
-            if purple.lower() in content.lower():
-                self.issues.append(f"[Color] {filename}: PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.")
-                break
+            for rule_id, check in RULES:
+                check(ctx)
+        return {"issues": ctx.issues, "warnings": ctx.warnings, "passed": ctx.passed}
 
-        # 4.2 60-30-10 Rule check
-        # Count color usage to estimate ratio
-        color_hex_count = len(re.findall(r'#[0-9a-fA-F]{3,6}', content))
-        hsl_count = len(re.findall(r'hsl\(', content))
-        total_colors = color_hex_count + hsl_count
-        if total_colors > 3:
-            # Check for dominant colors (should be ~60%)
-            bg_declarations = re.findall(r'(?:background|bg-|bg\[)([^;}\s]+)', content)
-            text_declarations = re.findall(r'(?:color|text-)([^;}\s]+)', content)
-            if len(bg_declarations) > 0 and len(text_declarations) > 0:
-                # Just warn if too many distinct colors
-                unique_hexes = set(re.findall(r'#[0-9a-fA-F]{6}', content))
-                if len(unique_hexes) > 5:
-                    self.warnings.append(f"[Color] {filename}: {len(unique_hexes)} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).")
-
-        # 4.3 Color Scheme Pattern Detection
-        # Detect monochromatic (same hue, different lightness)
-        hsl_matches = re.findall(r'hsl\((\d+),\s*\d+%,\s*\d+%\)', content)
-        if len(hsl_matches) >= 3:
-            hues = [int(h) for h in hsl_matches]
-            hue_range = max(hues) - min(hues)
-            if hue_range < 10:
-                self.warnings.append(f"[Color] {filename}: Monochromatic palette detected (hue variance: {hue_range}deg). Ensure adequate contrast.")
-
-        # 4.4 Dark Mode Compliance
-        # Check for pure black (#000000) or pure white (#FFFFFF) text (forbidden)
-        if re.search(r'color:\s*#000000|#000\b', content):
-            self.warnings.append(f"[Color] {filename}: Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.")
-        if re.search(r'background:\s*#ffffff|#fff\b', content) and re.search(r'dark:\s*|dark:', content):
-            self.warnings.append(f"[Color] {filename}: Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain.")
-
-        # 4.5 WCAG Contrast Pattern Check
-        # Look for potential low-contrast combinations
-        light_bg_light_text = bool(re.search(r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]', content))
-        dark_bg_dark_text = bool(re.search(r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]', content))
-        if light_bg_light_text or dark_bg_dark_text:
-            self.warnings.append(f"[Color] {filename}: Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).")
-
-        # 4.6 Color Psychology Context Check
-        # Warn if blue used for food/restaurant context
-        has_blue = bool(re.search(r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}', content))
-        has_food_context = bool(re.search(r'restaurant|food|cooking|recipe|menu|dish|meal', content, re.IGNORECASE))
-        if has_blue and has_food_context:
-            self.warnings.append(f"[Color] {filename}: Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).")
-
-        # 4.7 HSL-Based Palette Detection
-        # Check if using HSL for palette (recommended in color-system.md)
-        has_color_vars = bool(re.search(r'--color-|color-|primary-|secondary-', content))
-        if has_color_vars and not re.search(r'hsl\(', content):
-            self.warnings.append(f"[Color] {filename}: Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness).")
-
-        # --- 5. ANIMATION GUIDE (animation-guide.md) ---
-
-        # 5.1 Duration Appropriateness
-        # Check for excessively long or short animations
-        durations = re.findall(r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)', content)
-        for duration, unit in durations:
-            duration_ms = float(duration) * (1000 if unit == 's' else 1)
-            if duration_ms < 50:
-                self.warnings.append(f"[Animation] {filename}: Very fast animation ({duration}{unit}). Minimum 50ms for visibility.")
-            elif duration_ms > 1000 and 'transition' in content.lower():
-                self.warnings.append(f"[Animation] {filename}: Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.")
-
-        # 5.2 Easing Function Correctness
-        # Check for incorrect easing patterns
-        if re.search(r'ease-in\s+.*entry|fade-in.*ease-in', content):
-            self.warnings.append(f"[Animation] {filename}: Entry animation with ease-in. Entry should use ease-out for snappy feel.")
-        if re.search(r'ease-out\s+.*exit|fade-out.*ease-out', content):
-            self.warnings.append(f"[Animation] {filename}: Exit animation with ease-out. Exit should use ease-in for natural feel.")
-
-        # 5.3 Micro-interaction Feedback Patterns
-        # Check for interactive elements without hover/focus states
-        interactive_elements = len(re.findall(r'<button|<a\s+href|onClick|@click', content))
-        has_hover_focus = bool(re.search(r'hover:|focus:|:hover|:focus', content))
-        if interactive_elements > 2 and not has_hover_focus:
-            self.warnings.append(f"[Animation] {filename}: Interactive elements without hover/focus states. Add micro-interactions for feedback.")
-
-        # 5.4 Loading State Indicators
-        # Check for loading patterns
-        has_async = bool(re.search(r'async|await|fetch|axios|loading|isLoading', content))
-        has_loading_indicator = bool(re.search(r'skeleton|spinner|progress|loading|<circle.*animate', content))
-        if has_async and not has_loading_indicator:
-            self.warnings.append(f"[Animation] {filename}: Async operations without loading indicator. Add skeleton or spinner for perceived performance.")
-
-        # 5.5 Page Transition Patterns
-        # Check for page/view transitions
-        has_routing = bool(re.search(r'router|navigate|Link.*to|useHistory', content))
-        has_page_transition = bool(re.search(r'AnimatePresence|motion\.|transition.*page|fade.*route', content))
-        if has_routing and not has_page_transition:
-            self.warnings.append(f"[Animation] {filename}: Routing detected without page transitions. Consider fade/slide for context continuity.")
-
-        # 5.6 Scroll Animation Performance
-        # Check for scroll-driven animations
-        has_scroll_anim = bool(re.search(r'onScroll|scroll.*trigger|IntersectionObserver', content))
-        if has_scroll_anim:
-            # Check if using expensive properties in scroll handlers
-            if re.search(r'onScroll.*[^\w](width|height|top|left)', content):
-                self.issues.append(f"[Animation] {filename}: Scroll handler animating layout properties. Use transform/opacity for 60fps.")
-
-        # --- 6. MOTION GRAPHICS (motion-graphics.md) ---
-
-        # 6.1 Lottie Animation Checks
-        has_lottie = bool(re.search(r'lottie|Lottie|@lottie-react', content))
-        if has_lottie:
-            # Check for reduced motion fallback
-            has_lottie_fallback = bool(re.search(r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop', content))
-            if not has_lottie_fallback:
-                self.warnings.append(f"[Motion] {filename}: Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.")
-
-        # 6.2 GSAP Memory Leak Risks
-        has_gsap = bool(re.search(r'gsap|ScrollTrigger|from\(.*gsap', content))
-        if has_gsap:
-            # Check for cleanup patterns
-            has_gsap_cleanup = bool(re.search(r'kill\(|revert\(|useEffect.*return.*gsap', content))
-            if not has_gsap_cleanup:
-                self.issues.append(f"[Motion] {filename}: GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.")
-
-        # 6.3 SVG Animation Performance
-        svg_animations = re.findall(r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset', content)
-        if len(svg_animations) > 3:
-            self.warnings.append(f"[Motion] {filename}: Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance.")
-
-        # 6.4 3D Transform Performance
-        has_3d_transform = bool(re.search(r'transform3d|perspective\(|rotate3d|translate3d', content))
-        if has_3d_transform:
-            # Check for perspective on parent
-            has_perspective_parent = bool(re.search(r'perspective:\s*\d+px|perspective\s*\(', content))
-            if not has_perspective_parent:
-                self.warnings.append(f"[Motion] {filename}: 3D transform without perspective parent. Add perspective: 1000px for realistic depth.")
-
-            # Warn about mobile performance
-            self.warnings.append(f"[Motion] {filename}: 3D transforms detected. Test on mobile; can impact performance on low-end devices.")
-
-        # 6.5 Particle Effect Warnings
-        # Check for canvas/WebGL particle systems
-        has_particles = bool(re.search(r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js', content))
-        if has_particles:
-            self.warnings.append(f"[Motion] {filename}: Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.")
-
-        # 6.6 Scroll-Driven Animation Performance
-        has_scroll_driven = bool(re.search(r'IntersectionObserver.*animate|scroll.*progress|view-timeline', content))
-        if has_scroll_driven:
-            # Check for throttling/debouncing
-            has_throttle = bool(re.search(r'throttle|debounce|requestAnimationFrame', content))
-            if not has_throttle:
-                self.issues.append(f"[Motion] {filename}: Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.")
-
-        # 6.7 Motion Decision Tree - Context Check
-        # Check if animation serves purpose (not just decoration)
-        total_animations = (
-            len(re.findall(r'@keyframes|transition:|animate-', content)) +
-            (1 if has_lottie else 0) +
-            (1 if has_gsap else 0)
-        )
-        if total_animations > 5:
-            # Check if animations are functional
-            functional_animations = len(re.findall(r'hover:|focus:|disabled|loading|error|success', content))
-            if functional_animations < total_animations / 2:
-                self.warnings.append(f"[Motion] {filename}: Many animations ({total_animations}). Ensure majority serve functional purpose (feedback, guidance), not decoration.")
-
-        # --- 7. ACCESSIBILITY ---
-        if re.search(r'<img(?![^>]*alt=)[^>]*>', content):
-            self.issues.append(f"[Accessibility] {filename}: Missing img alt text")
-
-    def audit_directory(self, directory: str) -> None:
-        extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+    def _record(self, result: dict) -> None:
+        self.files_checked += 1
+        self.issues.extend(result["issues"])
+        self.warnings.extend(result["warnings"])
+        self.passed_count += result["passed"]
+
+    def audit_directory(self, directory: str, jobs: int = 1) -> None:
+        """Audit every file under directory, sharded over jobs processes (see audit_cache.audit_files)."""
+        paths = collect_files(directory, AUDIT_EXTENSIONS, SKIP_DIRS)
+        audit_files(paths, self.analyze_file, self._record, self.cache, jobs,
+                    shard_worker=partial(_audit_shard, profile=self.profile), on_shard=self._add_timings)
+
+    def _add_timings(self, timings: dict) -> None:
+        for rule_id, seconds in timings.items():
+            self.rule_timings[rule_id] = self.rule_timings.get(rule_id, 0.0) + seconds
 
     def get_report(self):
-        return {
+        report = {
             "files_checked": self.files_checked,
             "issues": self.issues,
             "warnings": self.warnings,
             "passed_checks": self.passed_count,
             "compliant": len(self.issues) == 0
         }
+        if self.profile:
+            report["rule_timings_ms"] = {
+                rule_id: round(seconds * 1000, 3)
+                for rule_id, seconds in sorted(self.rule_timings.items(), key=lambda x: -x[1])
+            }
+        return report
+
+
+def _audit_shard(paths: list, profile: bool = False) -> tuple:
+    """Process-pool worker: ({path: result or None}, rule timings) for a slice of files."""
+    auditor = UXAuditor(profile=profile)
+    return {path: auditor.analyze_file(path) for path in paths}, auditor.rule_timings
+
+USAGE = "Usage: python ux_audit.py <path> [--json] [--profile] [--jobs N] [--no-cache]"
 
 def main():
-    if len(sys.argv) < 2: sys.exit(1)
+    if len(sys.argv) < 2: print(USAGE); sys.exit(1)
     
     path = sys.argv[1]
     is_json = "--json" in sys.argv
+    # --jobs N: audit in N worker processes (0 = one per CPU)
+    jobs = jobs_from_argv(USAGE)
+    
+    cache = open_cache_from_argv("ux_audit", __file__)
     
-    auditor = UXAuditor()
+    auditor = UXAuditor(profile="--profile" in sys.argv, cache=cache)
     if os.path.isfile(path): auditor.audit_file(path)
-    else: auditor.audit_directory(path)
+    else: auditor.audit_directory(path, jobs)
+    if cache: cache.save()
     
     report = auditor.get_report()
     
@@ -713,6 +935,10 @@ def main():
             print(f"[*] WARNINGS ({len(report['warnings'])}):")
             for w in report['warnings'][:15]: print(f"  - {w}")
         print(f"[+] PASSED CHECKS: {report['passed_checks']}")
+        if cache: print(f"[=] CACHE: {cache.hits} reused, {cache.misses} audited")
+        if 'rule_timings_ms' in report:
+            print("[~] SLOWEST RULES:")
+            for rule_id, ms in list(report['rule_timings_ms'].items())[:10]: print(f"  - {rule_id}: {ms:.1f} ms")
         status = "PASS" if report['compliant'] else "FAIL"
         print(f"STATUS: {status}")
 
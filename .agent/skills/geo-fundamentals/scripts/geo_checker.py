@@ -14,7 +14,7 @@ WHAT IT CHECKS:
     - NOT markdown files (those are developer docs, not public content)
 
 Usage:
-    python geo_checker.py <project_path>
+    python geo_checker.py <project_path> [--no-cache]
 """
 import sys
 import re
@@ -28,6 +28,9 @@ try:
 except AttributeError:
     pass
 
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from audit_cache import open_cache_from_argv
+
 
 # Directories to skip (not public content)
 SKIP_DIRS = {
@@ -243,10 +246,13 @@ def main():
     print(f"Found {len(pages)} public pages to analyze\n")
     
     # Check each page
+    cache = open_cache_from_argv("geo_checker", __file__)
     results = []
     for page in pages:
-        result = check_page(page)
+        result = cache.fetch(page, check_page) if cache else check_page(page)
         results.append(result)
+    if cache:
+        cache.save()
     
     # Print results
     for result in results:
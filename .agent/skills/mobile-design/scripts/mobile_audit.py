@@ -71,14 +71,38 @@ import re
 import json
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from audit_cache import open_cache_from_argv, jobs_from_argv, collect_files, audit_files
+
+AUDIT_EXTENSIONS = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', '.idea'}
+
 class MobileAuditor:
-    def __init__(self):
+    def __init__(self, cache=None):
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
+        # Optional audit_cache.AuditCache: unchanged files replay their findings
+        self.cache = cache
 
     def audit_file(self, filepath: str) -> None:
+        report = self.cache.get(filepath) if self.cache else None
+        if report is None:
+            report = self.analyze_file(filepath)
+            if report is None:
+                return
+            if self.cache:
+                self.cache.put(filepath, report)
+        self.merge(report)
+
+    def analyze_file(self, filepath: str):
+        """One file's findings in get_report() form; None if it can't be read."""
+        scratch = MobileAuditor()
+        scratch._check_file(filepath)
+        return scratch.get_report() if scratch.files_checked else None
+
+    def _check_file(self, filepath: str) -> None:
         try:
             with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
                 content = f.read()
@@ -610,13 +634,17 @@ class MobileAuditor:
             # This is more of a configuration check, not code pattern
             self.passed_count += 1  # Hermes is default in RN 0.70+
 
-    def audit_directory(self, directory: str) -> None:
-        extensions = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', 'build', '.idea'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+    def audit_directory(self, directory: str, jobs: int = 1) -> None:
+        """Audit every file under directory, sharded over jobs processes (see audit_cache.audit_files)."""
+        paths = collect_files(directory, AUDIT_EXTENSIONS, SKIP_DIRS)
+        audit_files(paths, self.analyze_file, self.merge, self.cache, jobs, shard_worker=_audit_shard)
+
+    def merge(self, other: dict) -> None:
+        """Fold another auditor's get_report() into this one."""
+        self.files_checked += other["files_checked"]
+        self.issues.extend(other["issues"])
+        self.warnings.extend(other["warnings"])
+        self.passed_count += other["passed_checks"]
 
     def get_report(self):
         return {
@@ -628,19 +656,34 @@ class MobileAuditor:
         }
 
 
+def _audit_shard(paths: list) -> tuple:
+    """Process-pool worker: ({path: analyze_file() result}, None) for a slice of files."""
+    auditor = MobileAuditor()
+    return {path: auditor.analyze_file(path) for path in paths}, None
+
+
+USAGE = "Usage: python mobile_audit.py <directory> [--json] [--jobs N] [--no-cache]"
+
+
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python mobile_audit.py <directory>")
+        print(USAGE)
         sys.exit(1)
 
     path = sys.argv[1]
     is_json = "--json" in sys.argv
+    # --jobs N: audit in N worker processes (0 = one per CPU)
+    jobs = jobs_from_argv(USAGE)
 
-    auditor = MobileAuditor()
+    cache = open_cache_from_argv("mobile_audit", __file__)
+
+    auditor = MobileAuditor(cache=cache)
     if os.path.isfile(path):
         auditor.audit_file(path)
     else:
-        auditor.audit_directory(path)
+        auditor.audit_directory(path, jobs)
+    if cache:
+        cache.save()
 
     report = auditor.get_report()
 
@@ -658,6 +701,8 @@ def main():
             for w in report['warnings'][:15]:
                 print(f"  - {w}")
         print(f"[+] PASSED CHECKS: {report['passed_checks']}")
+        if cache:
+            print(f"[=] CACHE: {cache.hits} reused, {cache.misses} audited")
         status = "PASS" if report['compliant'] else "FAIL"
         print(f"STATUS: {status}")
 
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+React Performance Checker Benchmark - file discovery and full audit time on a
+synthetic Next.js tree.
+
+Usage: python bench_checker.py [--files 10000] [--runs 3] [--keep DIR] [--json]
+
+Generates a deterministic project (app routes, components, lib/hooks, plus
+node_modules and .next output that must be skipped) and reports, as medians:
+  - legacy:    the old per-check access pattern - six rglob walks that descend
+               into node_modules and re-read every file (with the brace glob
+               fixed, since the original pattern matched nothing at all)
+  - inventory: one pruned FileInventory scan, contents read once and shared
+  - full_run:  PerformanceChecker.run() end to end, output suppressed
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from statistics import median
+
+from react_performance_checker import PerformanceChecker, FileInventory
+
+# Suffix sets used by the six checks, in run() order
+CHECK_SUFFIXES = [
+    ('.ts', '.tsx', '.js', '.jsx'),
+    ('.ts', '.tsx', '.js', '.jsx'),
+    ('.ts', '.tsx'),
+    ('.ts', '.tsx'),
+    ('.tsx',),
+    ('.ts', '.tsx', '.js', '.jsx'),
+]
+
+COMPONENT = """import React from 'react'
+import {{ Button }} from '../ui/index'
+{extra_import}
+interface {name}Props {{ id: string; label: string }}
+
+export function {name}(props: {name}Props) {{
+{body}
+  return <div className="{slug}">{img}<Button>{{props.label}}</Button></div>
+}}
+"""
+
+PAGE = """import {{ {component} }} from '@/components/{group}/{component}'
+
+export default async function Page() {{
+  const user = await getUser()
+  const posts = await getPosts(user.id)
+  return <{component} id={{user.id}} label={{posts.length}} />
+}}
+"""
+
+HOOK = """import {{ useEffect, useState }} from 'react'
+
+export function use{name}() {{
+  const [data, setData] = useState(null)
+  useEffect(() => {{
+    fetch('/api/{slug}').then(r => r.json()).then(setData)
+  }}, [])
+  return data
+}}
+"""
+
+
+def build_tree(root: Path, total: int, seed: int = 7) -> dict:
+    """Write a synthetic project with about `total` files; returns per-area counts."""
+    rng = random.Random(seed)
+    counts = {"app": 0, "components": 0, "lib": 0, "node_modules": 0, ".next": 0}
+    skipped = int(total * 0.35)
+    project = total - skipped
+    names = [f"Widget{i}" for i in range(project)]
+
+    def write(rel: str, text: str, area: str) -> None:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+        counts[area] += 1
+
+    for i in range(project):
+        name, group = names[i], f"group{i % 40}"
+        kind = i % 10
+        if kind < 6:
+            body = "\n".join(f"  const v{j} = props.id + '{j}'" for j in range(rng.randint(5, 40)))
+            if i % 97 == 0:
+                body += "\n" + "  // padding\n" * 900  # a few >10KB components
+            write(f"components/{group}/{name}.tsx", COMPONENT.format(
+                name=name, slug=name.lower(), body=body,
+                img='<img src="/a.png" />' if rng.random() < 0.2 else '',
+                extra_import=f"import {names[i - 1]} from '../group{(i - 1) % 40}/{names[i - 1]}'" if i % 97 == 1 else ''),
+                "components")
+        elif kind < 8:
+            write(f"app/{group}/route{i}/page.tsx", PAGE.format(component=names[i - kind], group=f"group{(i - kind) % 40}"), "app")
+        else:
+            write(f"lib/{group}/use{name}.ts", HOOK.format(name=name, slug=name.lower()), "lib")
+
+    for i in range(skipped):
+        if i % 5 == 0:
+            write(f".next/static/chunks/{i}.js", "self.__chunk=" + "x" * rng.randint(200, 4000), ".next")
+        else:
+            write(f"node_modules/pkg{i % 300}/dist/mod{i}.js", "module.exports = function(){ return %d }\n" % i * rng.randint(1, 30), "node_modules")
+    return counts
+
+
+def _legacy_pass(root: Path) -> int:
+    """The pre-inventory access pattern: every check walks and reads on its own."""
+    reads = 0
+    for suffixes in CHECK_SUFFIXES:
+        for path in root.rglob('*'):
+            if path.suffix not in suffixes or 'node_modules' in str(path):
+                continue
+            try:
+                path.read_text(encoding='utf-8')
+                reads += 1
+            except (OSError, UnicodeDecodeError):
+                continue
+    return reads
+
+
+def _inventory_pass(root: Path) -> int:
+    inventory = FileInventory(root)
+    for suffixes in CHECK_SUFFIXES:
+        for source in inventory.select(*suffixes):
+            source.content
+    return len(inventory.files)
+
+
+def _full_run(root: Path) -> int:
+    checker = PerformanceChecker(str(root))
+    with contextlib.redirect_stdout(io.StringIO()):
+        checker.run()
+    return len(checker.issues) + len(checker.warnings)
+
+
+def _timed(fn, root: Path, runs: int) -> dict:
+    samples, value = [], None
+    for _ in range(runs):
+        start = time.perf_counter()
+        value = fn(root)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": round(median(samples), 1), "result": value}
+
+
+def run(total: int, runs: int, keep: Path = None) -> dict:
+    root = keep or Path(tempfile.mkdtemp(prefix="react-perf-bench-"))
+    try:
+        counts = build_tree(root, total)
+        return {
+            "files": sum(counts.values()),
+            "areas": counts,
+            "runs": runs,
+            "brace_glob_matches": len(list(root.rglob('*.{ts,tsx,js,jsx}'))),
+            "legacy": _timed(_legacy_pass, root, runs),
+            "inventory": _timed(_inventory_pass, root, runs),
+            "full_run": _timed(_full_run, root, runs),
+        }
+    finally:
+        if keep is None:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="React performance checker discovery benchmark")
+    parser.add_argument("--files", type=int, default=10000, help="Synthetic tree size (default: 10000)")
+    parser.add_argument("--runs", type=int, default=3, help="Timing samples per measurement (default: 3)")
+    parser.add_argument("--keep", type=Path, default=None, help="Build the tree here and keep it")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    report = run(args.files, args.runs, args.keep)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Synthetic tree: {report['files']} files {report['areas']}")
+        print(f"Brace glob '*.{{ts,tsx,js,jsx}}' matches: {report['brace_glob_matches']}")
+        print(f"{'legacy (6 walks)':<20} {report['legacy']['median_ms']:>9.1f} ms  ({report['legacy']['result']} reads)")
+        print(f"{'inventory (1 scan)':<20} {report['inventory']['median_ms']:>9.1f} ms  ({report['inventory']['result']} files)")
+        print(f"{'full run':<20} {report['full_run']['median_ms']:>9.1f} ms  ({report['full_run']['result']} findings)")
+        legacy, new = report['legacy']['median_ms'], report['inventory']['median_ms']
+        print(f"Inventory discovery+read is {legacy / new:.1f}x faster than per-check walks" if new else "")
@@ -8,175 +8,367 @@ Based on Vercel Engineering best practices
 import os
 import re
 import json
+import posixpath
+from collections import defaultdict
 from pathlib import Path
 from typing import List, Dict, Tuple
 
+SOURCE_SUFFIXES = ('.ts', '.tsx', '.js', '.jsx')
+# Never descended into: dependencies, VCS data and build output
+SKIP_DIRS = {'node_modules', '.git', '.next', '.turbo', '.vercel', 'dist', 'build', 'out', 'coverage'}
+
+# Components above this size should usually be loaded with dynamic() (Rule 2.4)
+LARGE_MODULE_BYTES = 10000
+# Only these are components dynamic() can split off; .ts/.js hold logic, types and data
+COMPONENT_SUFFIXES = ('.tsx', '.jsx')
+# Packages whose entry point is a barrel re-exporting the whole library (Rule 2.1)
+BARREL_PACKAGES = {
+    'lucide-react', '@mui/material', '@mui/icons-material', '@tabler/icons-react', 'react-icons',
+    '@headlessui/react', 'lodash', 'ramda', 'date-fns', 'rxjs', 'react-use'
+}
+BARREL_PACKAGE_PREFIXES = ('@radix-ui/react-',)
+# Packages too heavy for the initial bundle (Rules 2.3, 2.4)
+HEAVY_PACKAGES = {
+    'monaco-editor', '@monaco-editor/react', '@vercel/analytics', 'chart.js', 'react-chartjs-2',
+    'recharts', 'three', '@react-three/fiber', 'mapbox-gl', 'leaflet', 'pdfjs-dist', 'highlight.js'
+}
+# Where the '@/' and '~/' path aliases usually point
+ALIAS_ROOTS = ('', 'src/')
+
+# import x from '...' / import { a, b as c } from '...' / export * from '...' / import '...'
+STATIC_IMPORT_RE = re.compile(
+    r"^[ \t]*(import|export)\s+(type\s+)?(?:([\w$*{},\s]*?)\s*from\s*)?['\"]([^'\"\n]+)['\"]", re.MULTILINE)
+# export type X / export interface X: erased at compile time
+TYPE_EXPORT_RE = re.compile(r"^[ \t]*export\s+(?:declare\s+)?(?:type|interface)\s+([\w$]+)", re.MULTILINE)
+# First word of every export statement ('type', 'interface', 'const', 'default', '{', ...)
+EXPORT_RE = re.compile(r"^[ \t]*export\s+(?:declare\s+)?([\w$]+|[{*])", re.MULTILINE)
+# import('...'), including inside dynamic(() => import('...')) and React.lazy
+DYNAMIC_IMPORT_RE = re.compile(r"\bimport\(\s*['\"]([^'\"\n]+)['\"]\s*\)")
+
+
+class SourceFile:
+    """One inventoried file; content is read on first access and then kept."""
+
+    __slots__ = ('path', 'rel', 'suffix', 'size', '_content')
+
+    def __init__(self, path: Path, rel: str, size: int):
+        self.path = path
+        self.rel = rel
+        self.suffix = path.suffix
+        self.size = size
+        self._content = False
+
+    @property
+    def content(self):
+        """UTF-8 text, or None if the file can't be read or decoded."""
+        if self._content is False:
+            try:
+                self._content = self.path.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                self._content = None
+        return self._content
+
+
+class FileInventory:
+    """Source files under a project, found by one pruned directory scan."""
+
+    def __init__(self, root: Path, suffixes=SOURCE_SUFFIXES, skip_dirs=SKIP_DIRS):
+        self.root = root
+        self.files = []
+        self._scan(str(root), '', set(suffixes), skip_dirs)
+
+    def _scan(self, directory: str, prefix: str, suffixes: set, skip_dirs: set) -> None:
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        self._scan(entry.path, prefix + entry.name + '/', suffixes, skip_dirs)
+                elif entry.is_file() and os.path.splitext(entry.name)[1] in suffixes:
+                    self.files.append(SourceFile(Path(entry.path), prefix + entry.name, entry.stat().st_size))
+            except OSError:
+                continue
+
+    def select(self, *suffixes: str) -> List[SourceFile]:
+        """Files with one of the given suffixes (all files if none given), in path order."""
+        if not suffixes:
+            return list(self.files)
+        return [f for f in self.files if f.suffix in suffixes]
+
+
+class ImportGraph:
+    """
+    Module -> importers index over every inventoried file, built in one pass.
+
+    Each edge is {"from", "to", "specifier", "kind", "names", "reexport"} where
+    kind is "static", "dynamic" or "type" (erased at compile time). "to" is the
+    importee's project-relative path when it resolves to an inventoried file,
+    otherwise the package name (bare specifiers) or the unresolved path.
+    """
+
+    def __init__(self, inventory: FileInventory):
+        self.modules = {f.rel: f for f in inventory.files}
+        self.edges = []
+        self.imports = defaultdict(list)
+        self.importers = defaultdict(list)
+        self.packages = set()
+        for source in inventory.files:
+            if source.content is not None:
+                self._parse(source)
+
+    def _parse(self, source: SourceFile) -> None:
+        content = source.content
+        for match in STATIC_IMPORT_RE.finditer(content):
+            keyword, type_only, clause, specifier = match.groups()
+            if keyword == 'export' and clause is None:
+                continue  # export '...' is not valid syntax
+            self._add(source.rel, specifier, 'type' if type_only or _type_only_clause(clause) else 'static',
+                      _imported_names(clause), reexport=keyword == 'export')
+        if 'import(' in content:
+            for match in DYNAMIC_IMPORT_RE.finditer(content):
+                self._add(source.rel, match.group(1), 'dynamic', [])
+
+    def _add(self, importer: str, specifier: str, kind: str, names: list, reexport: bool = False) -> None:
+        edge = {
+            'from': importer,
+            'to': self.resolve(importer, specifier),
+            'specifier': specifier,
+            'kind': kind,
+            'names': names,
+            'reexport': reexport
+        }
+        self.edges.append(edge)
+        self.imports[importer].append(edge)
+        self.importers[edge['to']].append(edge)
+
+    def resolve(self, importer: str, specifier: str) -> str:
+        """Project-relative path of the imported file, else a package name / unresolved path."""
+        if specifier.startswith('.'):
+            bases = [posixpath.normpath(posixpath.join(posixpath.dirname(importer), specifier))]
+        elif specifier.startswith(('@/', '~/')):
+            bases = [root + specifier[2:] for root in ALIAS_ROOTS]
+        else:
+            parts = specifier.split('/')
+            package = '/'.join(parts[:2]) if specifier.startswith('@') else parts[0]
+            self.packages.add(package)
+            return package
+        for base in bases:
+            for candidate in (base, *(base + s for s in SOURCE_SUFFIXES), *(base + '/index' + s for s in SOURCE_SUFFIXES)):
+                if candidate in self.modules:
+                    return candidate
+        return bases[0]
+
+    def is_barrel(self, edge: dict) -> bool:
+        """Whether an import goes through a barrel: a re-exporting index file or a barrel package root."""
+        target = edge['to']
+        if target in self.modules:
+            return posixpath.basename(target).startswith('index.') and any(e['reexport'] for e in self.imports[target])
+        if edge['specifier'].endswith('/index'):
+            return True
+        return edge['specifier'] == target and (target in BARREL_PACKAGES or target.startswith(BARREL_PACKAGE_PREFIXES))
+
+    def static_importers(self, module: str) -> List[str]:
+        """Files that import module statically and never load it with import()."""
+        edges = self.importers.get(module, [])
+        dynamic = {e['from'] for e in edges if e['kind'] == 'dynamic'}
+        return sorted({e['from'] for e in edges if e['kind'] == 'static' and e['from'] not in dynamic})
+
+    def to_dict(self) -> dict:
+        """JSON-ready graph: every module (files and packages) and every edge."""
+        modules = {rel: {'size': f.size, 'external': False} for rel, f in self.modules.items()}
+        for edge in self.edges:
+            if edge['to'] not in modules:
+                modules[edge['to']] = {'size': None, 'external': edge['to'] in self.packages}
+        return {'modules': modules, 'edges': self.edges}
+
+
+def _imported_names(clause) -> list:
+    """Local binding names from an import/export clause ('A, { b as c }, * as D')."""
+    if not clause:
+        return []
+    names = []
+    for part in clause.replace('{', ',').replace('}', ',').split(','):
+        words = part.split()
+        if words:
+            names.append(words[-1])
+    return names
+
+
+def _type_only_clause(clause) -> bool:
+    """Whether every name in a '{ type A, type B as C }' clause is an inline type import."""
+    if not clause or not clause.strip().startswith('{'):
+        return False
+    parts = [part.split() for part in clause.strip(' \t\n{}').split(',')]
+    parts = [words for words in parts if words]
+    return bool(parts) and all(words[0] == 'type' and len(words) > 1 for words in parts)
+
+
+def _is_type_module(content: str) -> bool:
+    """Whether a module exports only types and interfaces."""
+    exports = EXPORT_RE.findall(content)
+    return bool(exports) and all(word in ('type', 'interface') for word in exports)
+
+
 class PerformanceChecker:
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
         self.issues = []
         self.warnings = []
         self.passed = []
+        self._inventory = None
+        self._graph = None
+
+    @property
+    def inventory(self) -> FileInventory:
+        """Shared by every check, so the tree is walked (and each file read) once."""
+        if self._inventory is None:
+            self._inventory = FileInventory(self.project_path)
+        return self._inventory
+
+    @property
+    def graph(self) -> ImportGraph:
+        """Import graph over the inventory; answers the bundle (Section 2) checks."""
+        if self._graph is None:
+            self._graph = ImportGraph(self.inventory)
+        return self._graph
 
     def check_waterfalls(self):
         """Check for sequential await patterns (Section 1)"""
         print("\n[*] Checking for waterfalls (sequential awaits)...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
+        for source in self.inventory.select('.ts', '.tsx', '.js', '.jsx'):
+            content = source.content
+            if content is None:
                 continue
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: multiple awaits in sequence without Promise.all
-                sequential_awaits = re.findall(r'await\s+\w+.*?\n\s*await\s+\w+', content)
-
-                if sequential_awaits:
-                    self.issues.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'CRITICAL',
-                        'issue': 'Sequential awaits detected (waterfall)',
-                        'fix': 'Use Promise.all() for parallel fetching',
-                        'section': '1-async-eliminating-waterfalls.md'
-                    })
-            except Exception as e:
-                continue
+            # Pattern: multiple awaits in sequence without Promise.all
+            sequential_awaits = re.findall(r'await\s+\w+.*?\n\s*await\s+\w+', content)
+
+            if sequential_awaits:
+                self.issues.append({
+                    'file': source.rel,
+                    'type': 'CRITICAL',
+                    'issue': 'Sequential awaits detected (waterfall)',
+                    'fix': 'Use Promise.all() for parallel fetching',
+                    'section': '1-async-eliminating-waterfalls.md'
+                })
 
     def check_barrel_imports(self):
         """Check for barrel imports (Section 2)"""
         print("[*] Checking for barrel imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: import from index files or barrel exports
-                barrel_imports = re.findall(r"import.*from\s+['\"](@/.*?)/index['\"]", content)
-                barrel_imports += re.findall(r"import.*from\s+['\"]\.\.?/.*?['\"](?!.*?\.tsx?)", content)
-
-                if barrel_imports:
-                    self.warnings.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'CRITICAL',
-                        'issue': 'Potential barrel imports detected',
-                        'fix': 'Import directly from specific files',
-                        'section': '2-bundle-bundle-size-optimization.md'
-                    })
-            except Exception as e:
-                continue
+        graph = self.graph
+        for source in self.inventory.files:
+            barrels = [e['specifier'] for e in graph.imports.get(source.rel, []) if e['kind'] == 'static' and graph.is_barrel(e)]
+            if barrels:
+                self.warnings.append({
+                    'file': source.rel,
+                    'type': 'CRITICAL',
+                    'issue': f"Potential barrel imports detected ({', '.join(sorted(set(barrels)))})",
+                    'fix': 'Import directly from specific files',
+                    'section': '2-bundle-bundle-size-optimization.md'
+                })
 
     def check_dynamic_imports(self):
-        """Check if large components use dynamic imports (Section 2)"""
+        """Check if large components and heavy packages use dynamic imports (Section 2)"""
         print("[*] Checking for missing dynamic imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
+        graph = self.graph
+        for source in self.inventory.select(*COMPONENT_SUFFIXES):
+            if source.size <= LARGE_MODULE_BYTES or source.content is None:
                 continue
-
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check file size - if > 10KB, should probably use dynamic import
-                if len(content) > 10000:
-                    # Check if it's imported statically somewhere
-                    filename = filepath.stem
-
-                    # Search for static imports of this component
-                    for check_file in self.project_path.rglob('*.{ts,tsx}'):
-                        if check_file == filepath or 'node_modules' in str(check_file):
-                            continue
-
-                        check_content = check_file.read_text(encoding='utf-8')
-                        if f"import {filename}" in check_content or f"import {{ {filename}" in check_content:
-                            if 'dynamic(' not in check_content:
-                                self.warnings.append({
-                                    'file': str(check_file.relative_to(self.project_path)),
-                                    'type': 'CRITICAL',
-                                    'issue': f'Large component {filename} imported statically',
-                                    'fix': 'Use dynamic() for code splitting',
-                                    'section': '2-bundle-bundle-size-optimization.md'
-                                })
-                                break
-            except Exception as e:
+            # Layout shells wrap every page, so splitting them off only delays first paint
+            if source.path.stem.lower().endswith('layout') or _is_type_module(source.content):
                 continue
+            type_names = set(TYPE_EXPORT_RE.findall(source.content))
+            for importer in graph.static_importers(source.rel):
+                names = [name for e in graph.importers[source.rel]
+                         if e['from'] == importer and e['kind'] == 'static' for name in e['names']]
+                if names and type_names.issuperset(names):
+                    continue  # import { Props } of a type only
+                self.warnings.append({
+                    'file': importer,
+                    'type': 'CRITICAL',
+                    'issue': f'Large component {source.path.stem} imported statically',
+                    'fix': 'Use dynamic() for code splitting',
+                    'section': '2-bundle-bundle-size-optimization.md'
+                })
+
+        for package in sorted(HEAVY_PACKAGES):
+            for importer in graph.static_importers(package):
+                self.warnings.append({
+                    'file': importer,
+                    'type': 'CRITICAL',
+                    'issue': f'Heavy module {package} imported statically',
+                    'fix': 'Use dynamic() or load it after hydration',
+                    'section': '2-bundle-bundle-size-optimization.md'
+                })
 
     def check_useEffect_fetching(self):
         """Check for data fetching in useEffect (Section 4)"""
         print("[*] Checking for useEffect data fetching...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
+        for source in self.inventory.select('.ts', '.tsx'):
+            content = source.content
+            if content is None:
                 continue
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: fetch or axios in useEffect
-                if 'useEffect' in content:
-                    if re.search(r'useEffect.*?fetch\(', content, re.DOTALL):
-                        self.warnings.append({
-                            'file': str(filepath.relative_to(self.project_path)),
-                            'type': 'MEDIUM-HIGH',
-                            'issue': 'Data fetching in useEffect',
-                            'fix': 'Consider using SWR or React Query for deduplication',
-                            'section': '4-client-client-side-data-fetching.md'
-                        })
-            except Exception as e:
-                continue
+            # Pattern: fetch or axios in useEffect
+            if 'useEffect' in content:
+                if re.search(r'useEffect.*?fetch\(', content, re.DOTALL):
+                    self.warnings.append({
+                        'file': source.rel,
+                        'type': 'MEDIUM-HIGH',
+                        'issue': 'Data fetching in useEffect',
+                        'fix': 'Consider using SWR or React Query for deduplication',
+                        'section': '4-client-client-side-data-fetching.md'
+                    })
 
     def check_missing_memoization(self):
         """Check for missing React.memo, useMemo, useCallback (Section 5)"""
         print("[*] Checking for missing memoization...")
 
-        for filepath in self.project_path.rglob('*.{tsx}'):
-            if 'node_modules' in str(filepath):
+        for source in self.inventory.select('.tsx'):
+            content = source.content
+            if content is None:
                 continue
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check for component definitions without memo
-                components = re.findall(r'(?:export\s+)?(?:const|function)\s+([A-Z]\w+)', content)
-
-                if components and 'React.memo' not in content and 'memo(' not in content:
-                    # Check if component receives props
-                    if 'props:' in content or 'Props>' in content:
-                        self.warnings.append({
-                            'file': str(filepath.relative_to(self.project_path)),
-                            'type': 'MEDIUM',
-                            'issue': 'Component with props not memoized',
-                            'fix': 'Consider using React.memo if props are stable',
-                            'section': '5-rerender-re-render-optimization.md'
-                        })
-            except Exception as e:
-                continue
+            # Check for component definitions without memo
+            components = re.findall(r'(?:export\s+)?(?:const|function)\s+([A-Z]\w+)', content)
+
+            if components and 'React.memo' not in content and 'memo(' not in content:
+                # Check if component receives props
+                if 'props:' in content or 'Props>' in content:
+                    self.warnings.append({
+                        'file': source.rel,
+                        'type': 'MEDIUM',
+                        'issue': 'Component with props not memoized',
+                        'fix': 'Consider using React.memo if props are stable',
+                        'section': '5-rerender-re-render-optimization.md'
+                    })
 
     def check_image_optimization(self):
         """Check for unoptimized images (Section 6)"""
         print("[*] Checking for image optimization...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
+        for source in self.inventory.select('.ts', '.tsx', '.js', '.jsx'):
+            content = source.content
+            if content is None:
                 continue
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check for <img> tags instead of next/image
-                if '<img' in content and 'next/image' not in content:
-                    self.warnings.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'MEDIUM',
-                        'issue': 'Using <img> instead of next/image',
-                        'fix': 'Use next/image for automatic optimization',
-                        'section': '6-rendering-rendering-performance.md'
-                    })
-            except Exception as e:
-                continue
+            # Check for <img> tags instead of next/image
+            if '<img' in content and 'next/image' not in content:
+                self.warnings.append({
+                    'file': source.rel,
+                    'type': 'MEDIUM',
+                    'issue': 'Using <img> instead of next/image',
+                    'fix': 'Use next/image for automatic optimization',
+                    'section': '6-rendering-rendering-performance.md'
+                })
 
     def generate_report(self):
         """Generate final report"""
@@ -235,7 +427,7 @@ def main():
     import sys
 
     if len(sys.argv) < 2:
-        print("Usage: python react_performance_checker.py <project_path>")
+        print("Usage: python react_performance_checker.py <project_path> [--graph imports.json]")
         sys.exit(1)
 
     project_path = sys.argv[1]
@@ -247,6 +439,12 @@ def main():
     checker = PerformanceChecker(project_path)
     checker.run()
 
+    # --graph FILE: export the import graph for other tools
+    if "--graph" in sys.argv:
+        graph_path = Path(sys.argv[sys.argv.index("--graph") + 1])
+        graph_path.write_text(json.dumps(checker.graph.to_dict(), indent=2), encoding='utf-8')
+        print(f"Import graph written to {graph_path}")
+
 
 if __name__ == '__main__':
     main()
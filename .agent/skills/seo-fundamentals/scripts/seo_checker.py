@@ -15,7 +15,7 @@ WHAT IT CHECKS:
     - Only files that are likely PUBLIC pages
 
 Usage:
-    python seo_checker.py <project_path>
+    python seo_checker.py <project_path> [--no-cache]
 """
 import sys
 import json
@@ -29,6 +29,9 @@ try:
 except:
     pass
 
+sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+from audit_cache import open_cache_from_argv
+
 
 # Directories to skip
 SKIP_DIRS = {
@@ -168,11 +171,14 @@ def main():
     print(f"Found {len(pages)} page files to analyze\n")
     
     # Check each page
+    cache = open_cache_from_argv("seo_checker", __file__)
     all_issues = []
     for f in pages:
-        result = check_page(f)
+        result = cache.fetch(f, check_page) if cache else check_page(f)
         if result["issues"]:
             all_issues.append(result)
+    if cache:
+        cache.save()
     
     # Summary
     print("=" * 60)
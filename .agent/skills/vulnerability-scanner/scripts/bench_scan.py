@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Security Scan Matcher Benchmark - SECRET_PATTERNS / DANGEROUS_PATTERNS matching
+on a synthetic source tree.
+
+Usage: python bench_scan.py [--size-mb 50] [--runs 3] [--keep DIR] [--json]
+
+Generates a deterministic tree of JS/TS/Python files (mostly ordinary code,
+with occasional secrets and dangerous calls), loads it into memory, and times
+the matching alone, as medians:
+  - legacy:  re.findall / re.search with the raw pattern strings for every
+             pattern, per file (secrets) and per line (code patterns)
+  - matcher: PatternMatcher - compiled once, literal-anchor prefilter
+Both must produce identical findings; per-pattern hit and run counters of the
+matcher are included in the report.
+"""
+
+import argparse
+import json
+import random
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from statistics import median
+
+from security_scan import SECRET_PATTERNS, DANGEROUS_PATTERNS, PatternMatcher, read_source
+
+CODE_LINES = [
+    "import {{ useState, useEffect }} from 'react'",
+    "export function handler{n}(req, res) {{",
+    "  const items = await db.items.findMany({{ where: {{ ownerId: req.user.id }} }})",
+    "  if (!items.length) return res.status(404).json({{ error: 'not found' }})",
+    "  return items.map((item) => ({{ ...item, total: item.price * item.qty }}))",
+    "}}",
+    "def process_{n}(payload: dict) -> list:",
+    "    return [row for row in payload.get('rows', []) if row.get('active')]",
+    "    logger.info('processed %s rows', len(payload))",
+    "// TODO: paginate results for large tenants",
+    "const config = {{ retries: 3, timeout: 5000, region: 'eu-west-1' }}",
+    "  <div className=\"card\" onClick={{() => setOpen(!open)}}>{{title}}</div>",
+]
+RISKY_LINES = [
+    "const api_key = \"sk_live_{n:012d}abcdef\"",
+    "headers.Authorization = 'Bearer abc.def-{n}'",
+    "const AWS = 'AKIAABCDEFGHIJ{n:06d}'",
+    "password: \"hunter{n}!\"",
+    "const url = 'postgres://user:pw@db:5432/app{n}'",
+    "eval(userInput{n})",
+    "el.innerHTML = html{n}",
+    "requests.get(url, verify=False)",
+    "data = pickle.loads(blob{n})",
+    "cursor.execute(f\"SELECT * FROM t WHERE id = {{user_id}}\")",
+    "<div dangerouslySetInnerHTML={{{{ __html: body{n} }}}} />",
+]
+
+
+def build_tree(root: Path, size_mb: int, seed: int = 11) -> int:
+    """Write about size_mb of source files; returns the file count."""
+    rng = random.Random(seed)
+    target, written, count = size_mb << 20, 0, 0
+    suffixes = ['.ts', '.tsx', '.js', '.py']
+    while written < target:
+        lines = []
+        for n in range(rng.randint(40, 600)):
+            pool = RISKY_LINES if rng.random() < 0.004 else CODE_LINES
+            lines.append(rng.choice(pool).format(n=n))
+        text = "\n".join(lines) + "\n"
+        path = root / f"pkg{count % 64}" / f"mod{count}{suffixes[count % 4]}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+        written += len(text)
+        count += 1
+    return count
+
+
+def _legacy(sources: list) -> list:
+    findings = []
+    for rel, content in sources:
+        for pattern, secret_type, severity in SECRET_PATTERNS:
+            matches = re.findall(pattern, content, re.IGNORECASE)
+            if matches:
+                findings.append((rel, secret_type, len(matches)))
+        lines = content.split('\n')[:-1]
+        for line_num, line in enumerate(lines, 1):
+            for pattern, name, severity, category in DANGEROUS_PATTERNS:
+                if re.search(pattern, line, re.IGNORECASE):
+                    findings.append((rel, name, line_num))
+    return findings
+
+
+def _matched(sources: list, secrets: PatternMatcher, dangers: PatternMatcher) -> list:
+    findings = []
+    for rel, content in sources:
+        for index, count in secrets.findall(content):
+            findings.append((rel, SECRET_PATTERNS[index][1], count))
+        for line_num, line, index in dangers.search_lines(content.split('\n')[:-1]):
+            findings.append((rel, DANGEROUS_PATTERNS[index][1], line_num))
+    return findings
+
+
+def _timed(fn, runs: int) -> tuple:
+    samples, value = [], None
+    for _ in range(runs):
+        start = time.perf_counter()
+        value = fn()
+        samples.append(time.perf_counter() - start)
+    return median(samples), value
+
+
+def run(size_mb: int, runs: int, keep: Path = None) -> dict:
+    root = keep or Path(tempfile.mkdtemp(prefix="security-scan-bench-"))
+    try:
+        files = build_tree(root, size_mb)
+        sources = [(str(p.relative_to(root)), read_source(p)) for p in sorted(root.rglob('*')) if p.is_file()]
+        total_mb = sum(len(c) for _, c in sources) / (1 << 20)
+
+        legacy_s, legacy_findings = _timed(lambda: _legacy(sources), runs)
+        secrets, dangers = PatternMatcher(SECRET_PATTERNS), PatternMatcher(DANGEROUS_PATTERNS)
+        matcher_s, matcher_findings = _timed(lambda: _matched(sources, secrets, dangers), runs)
+        if matcher_findings != legacy_findings:
+            raise AssertionError("PatternMatcher findings differ from the legacy scan")
+
+        # Counters from a single pass
+        secrets, dangers = PatternMatcher(SECRET_PATTERNS), PatternMatcher(DANGEROUS_PATTERNS)
+        _matched(sources, secrets, dangers)
+        return {
+            "files": files,
+            "size_mb": round(total_mb, 1),
+            "runs": runs,
+            "findings": len(matcher_findings),
+            "legacy": {"median_s": round(legacy_s, 3), "mb_per_s": round(total_mb / legacy_s, 1)},
+            "matcher": {"median_s": round(matcher_s, 3), "mb_per_s": round(total_mb / matcher_s, 1)},
+            "pattern_hits": {**secrets.hits, **dangers.hits},
+            "pattern_runs": {**secrets.runs, **dangers.runs},
+        }
+    finally:
+        if keep is None:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Security scan pattern matcher benchmark")
+    parser.add_argument("--size-mb", type=int, default=50, help="Synthetic tree size in MB (default: 50)")
+    parser.add_argument("--runs", type=int, default=3, help="Timing samples per matcher (default: 3)")
+    parser.add_argument("--keep", type=Path, default=None, help="Build the tree here and keep it")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    report = run(args.size_mb, args.runs, args.keep)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Synthetic tree: {report['files']} files, {report['size_mb']} MB, {report['findings']} findings (identical)")
+        for name in ("legacy", "matcher"):
+            print(f"{name:<8} {report[name]['median_s']:>8.2f} s  {report[name]['mb_per_s']:>7.1f} MB/s")
+        print(f"Speedup: {report['legacy']['median_s'] / report['matcher']['median_s']:.1f}x")
+        print(f"{'pattern':<28} {'hits':>8} {'regex runs':>11}")
+        for name, hits in report["pattern_hits"].items():
+            print(f"{name:<28} {hits:>8} {report['pattern_runs'][name]:>11}")
@@ -3,7 +3,8 @@
 Skill: vulnerability-scanner
 Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
-Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
+Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config] [--jobs N]
+       [--incremental] [--diff [REV]] [--cache-audit]
 Output: JSON with validation findings
 
 This script verifies:
@@ -13,13 +14,17 @@ This script verifies:
 4. Configuration - Security settings validated (OWASP A02)
 """
 import subprocess
+import contextlib
+import hashlib
 import json
+import mmap
 import os
 import sys
 import re
 import argparse
+import time
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 # Fix Windows console encoding for Unicode output
@@ -85,19 +90,170 @@ DANGEROUS_PATTERNS = [
     (r'yaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)', "Unsafe YAML load", "high", "Deserialization risk"),
 ]
 
+# Literals (lowercase) at least one of which every match of the named pattern
+# contains; the full regex only runs where one of them occurs. Patterns with
+# no entry always run.
+PATTERN_ANCHORS = {
+    # SECRET_PATTERNS
+    "API Key": ("api",),
+    "Token": ("token",),
+    "Bearer Token": ("bearer",),
+    "AWS Access Key": ("akia",),
+    "AWS Secret": ("secret",),
+    "Azure Credential": ("azure",),
+    "GCP Credential": ("google",),
+    "Password": ("password",),
+    "Database Connection String": ("://",),
+    "Private Key": ("-----begin",),
+    "SSH Key": ("ssh-rsa",),
+    "JWT Token": ("eyj",),
+    # DANGEROUS_PATTERNS
+    "eval() usage": ("eval",),
+    "exec() usage": ("exec",),
+    "Function constructor": ("function",),
+    "child_process.exec": ("child_process.exec",),
+    "subprocess with shell=True": ("subprocess.call",),
+    "dangerouslySetInnerHTML": ("dangerouslysetinnerhtml",),
+    "innerHTML assignment": (".innerhtml",),
+    "document.write": ("document.write",),
+    "SQL String Concat": ("select", "insert", "update", "delete"),
+    "SQL f-string": ('f"',),
+    "SSL Verify Disabled": ("verify",),
+    "Insecure flag": ("--insecure",),
+    "SSL Disabled": ("disable",),
+    "pickle usage": ("pickle.load",),
+    "Unsafe YAML load": ("yaml.load",),
+}
+# Characters IGNORECASE matches to an ASCII letter that str.lower() does not
+# map to it; text containing any of them skips the anchor prefilter
+FOLD_UNSAFE = ('İ', 'ı', 'ſ')
+
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
+CONFIG_FILENAMES = {'next.config.js', 'webpack.config.js', '.eslintrc.js'}
+
+CONFIG_ISSUES = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+
+# Files at least this large are mapped instead of read into a buffer first
+MMAP_THRESHOLD = 1 << 20
+
+# Secret scan baselines (--incremental) and cached npm audits (--cache-audit)
+CACHE_DIR = Path(__file__).resolve().parents[3] / ".cache" / "security"
+NPM_AUDIT_TIMEOUT = 60
 
 
 # ============================================================================
 #  SCANNING FUNCTIONS
 # ============================================================================
 
-def scan_dependencies(project_path: str) -> Dict[str, Any]:
+class NpmAudit:
+    """
+    `npm audit --json`, started in the background as soon as this is created
+    so other scans can run while it waits on the registry; result() joins it.
+    npm gets NPM_AUDIT_TIMEOUT seconds from launch and writes to a temp file,
+    so a large report never blocks on an unread pipe.
+
+    With use_cache, severity counts are stored per package-lock.json hash and
+    an unchanged lock file skips npm entirely. Use as a context manager (or
+    call close()) so npm is stopped and its output released on every path.
+    """
+
+    def __init__(self, project_path: str, use_cache: bool = False):
+        self.process = None
+        self._output = None
+        self.from_cache = False
+        self._cached = None
+        self._cache_path = None
+        lock = Path(project_path) / "package-lock.json"
+        if use_cache and lock.exists():
+            try:
+                digest = hashlib.sha256(lock.read_bytes()).hexdigest()
+                self._cache_path = CACHE_DIR / f"npm-audit-{digest[:32]}.json"
+                with open(self._cache_path, 'r', encoding='utf-8') as f:
+                    self._cached = json.load(f)
+                self.from_cache = True
+                return
+            except (OSError, ValueError):
+                pass
+        import tempfile
+        self._started = time.monotonic()
+        try:
+            self._output = tempfile.TemporaryFile()
+            self.process = subprocess.Popen(
+                ["npm", "audit", "--json"],
+                cwd=project_path,
+                stdout=self._output,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            self.close()
+
+    def __enter__(self) -> "NpmAudit":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Kill npm if it is still running, reap it and release its output file."""
+        if self.process is not None:
+            if self.process.poll() is None:
+                self.process.kill()
+            self.process.wait()
+            self.process = None
+        if self._output is not None:
+            self._output.close()
+            self._output = None
+
+    def result(self) -> Optional[Dict[str, int]]:
+        """Vulnerability counts by severity; None if npm is missing, timed out or gave no JSON."""
+        if self._cached is not None:
+            return self._cached
+        if self.process is None:
+            return None
+        try:
+            # Only wait if npm is still running; past its budget close() kills it
+            if self.process.poll() is None:
+                remaining = max(0.0, NPM_AUDIT_TIMEOUT - (time.monotonic() - self._started))
+                try:
+                    self.process.wait(timeout=remaining)
+                except subprocess.TimeoutExpired:
+                    return None
+            self._output.seek(0)
+            stdout = self._output.read().decode('utf-8', 'replace')
+        finally:
+            self.close()
+        try:
+            audit_data = json.loads(stdout)
+        except json.JSONDecodeError:
+            return None
+        vulnerabilities = audit_data.get("vulnerabilities", {})
+
+        severity_count = {"critical": 0, "high": 0, "moderate": 0, "low": 0}
+        for vuln in vulnerabilities.values():
+            sev = vuln.get("severity", "low").lower()
+            if sev in severity_count:
+                severity_count[sev] += 1
+
+        self._cached = severity_count
+        if self._cache_path is not None:
+            _write_json(self._cache_path, severity_count)
+        return severity_count
+
+
+def scan_dependencies(project_path: str, audit: "NpmAudit" = None) -> Dict[str, Any]:
     """
     Validate supply chain security (OWASP A03).
     Checks: npm audit, lock file presence, dependency age.
+    Pass a running NpmAudit to join it instead of starting (and waiting on) a new one.
     """
     results = {"tool": "dependency_scanner", "findings": [], "status": "[OK] Secure"}
     
@@ -128,49 +284,29 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
                     "message": f"{manager}: No lock file found. Supply chain integrity at risk."
                 })
     
-    # Run npm audit if applicable
-    if (Path(project_path) / "package.json").exists():
-        try:
-            result = subprocess.run(
-                ["npm", "audit", "--json"],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            try:
-                audit_data = json.loads(result.stdout)
-                vulnerabilities = audit_data.get("vulnerabilities", {})
-                
-                severity_count = {"critical": 0, "high": 0, "moderate": 0, "low": 0}
-                for vuln in vulnerabilities.values():
-                    sev = vuln.get("severity", "low").lower()
-                    if sev in severity_count:
-                        severity_count[sev] += 1
-                
-                if severity_count["critical"] > 0:
-                    results["status"] = "[!!] Critical vulnerabilities"
-                    results["findings"].append({
-                        "type": "npm audit",
-                        "severity": "critical",
-                        "message": f"{severity_count['critical']} critical vulnerabilities in dependencies"
-                    })
-                elif severity_count["high"] > 0:
-                    results["status"] = "[!] High vulnerabilities"
-                    results["findings"].append({
-                        "type": "npm audit",
-                        "severity": "high",
-                        "message": f"{severity_count['high']} high severity vulnerabilities"
-                    })
-                
-                results["npm_audit"] = severity_count
-                
-            except json.JSONDecodeError:
-                pass
-                
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+    # Join npm audit (started by the caller, or now)
+    if audit is None and (Path(project_path) / "package.json").exists():
+        audit = NpmAudit(project_path)
+    severity_count = audit.result() if audit else None
+    if severity_count is not None:
+        if severity_count["critical"] > 0:
+            results["status"] = "[!!] Critical vulnerabilities"
+            results["findings"].append({
+                "type": "npm audit",
+                "severity": "critical",
+                "message": f"{severity_count['critical']} critical vulnerabilities in dependencies"
+            })
+        elif severity_count["high"] > 0:
+            results["status"] = "[!] High vulnerabilities"
+            results["findings"].append({
+                "type": "npm audit",
+                "severity": "high",
+                "message": f"{severity_count['high']} high severity vulnerabilities"
+            })
+
+        results["npm_audit"] = severity_count
+        if audit.from_cache:
+            results["npm_audit_cached"] = True
     
     if not results["findings"]:
         results["status"] = "[OK] Supply chain checks passed"
@@ -178,199 +314,582 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
+class PatternMatcher:
+    """
+    A pattern list compiled once (IGNORECASE), with a literal prefilter: a
+    pattern is only tried on text containing one of its PATTERN_ANCHORS.
+    Results are exactly those of running every pattern; `hits` counts matches
+    per pattern name and `runs` how often each full regex actually ran.
+    """
+
+    def __init__(self, patterns: list):
+        self.names = [p[1] for p in patterns]
+        self.regexes = [re.compile(p[0], re.IGNORECASE) for p in patterns]
+        self.anchors = [PATTERN_ANCHORS.get(name) for name in self.names]
+        self.hits = dict.fromkeys(self.names, 0)
+        self.runs = dict.fromkeys(self.names, 0)
+
+    def merge(self, other: "PatternMatcher") -> None:
+        """Add another matcher's counters (same pattern list) into this one."""
+        for name in self.names:
+            self.hits[name] += other.hits[name]
+            self.runs[name] += other.runs[name]
+
+    def lowered(self, text: str) -> Optional[str]:
+        """text.lower() for the anchor checks, or None if it isn't a safe stand-in for IGNORECASE."""
+        if any(ch in text for ch in FOLD_UNSAFE):
+            return None
+        return text.lower()
+
+    def candidates(self, lowered: Optional[str]) -> List[int]:
+        """Indexes of the patterns whose anchors occur in the (lowered) text."""
+        if lowered is None:
+            return list(range(len(self.names)))
+        return [i for i, anchors in enumerate(self.anchors)
+                if anchors is None or any(a in lowered for a in anchors)]
+
+    def findall(self, text: str) -> List[tuple]:
+        """(pattern index, match count) for every pattern matching text, in pattern order."""
+        found = []
+        for i in self.candidates(self.lowered(text)):
+            self.runs[self.names[i]] += 1
+            count = len(self.regexes[i].findall(text))
+            if count:
+                self.hits[self.names[i]] += count
+                found.append((i, count))
+        return found
+
+    def search_lines(self, lines: List[str]):
+        """Yield (line number, line, pattern index) for every pattern matching each line."""
+        text = '\n'.join(lines)
+        lowered = self.lowered(text)
+        active = self.candidates(lowered)
+        if not active:
+            return
+        low_lines = lowered.split('\n') if lowered is not None else lines
+        for line_num, (line, low) in enumerate(zip(lines, low_lines), 1):
+            for i in active:
+                anchors = self.anchors[i]
+                if lowered is not None and anchors is not None and not any(a in low for a in anchors):
+                    continue
+                self.runs[self.names[i]] += 1
+                if self.regexes[i].search(line):
+                    self.hits[self.names[i]] += 1
+                    yield line_num, line, i
+
+
+def read_source(filepath) -> Optional[str]:
+    """
+    Whole file as text, exactly as open(..., 'r', encoding='utf-8',
+    errors='ignore').read() would return it; None if it can't be read.
+    Large files are decoded straight from a read-only mmap.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    text = str(mm, 'utf-8', 'ignore')
+            else:
+                text = f.read().decode('utf-8', 'ignore')
+    except (OSError, ValueError):
+        return None
+    # Universal newlines, as in text mode
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _write_json(path: Path, data) -> None:
+    """Replace path with data as JSON atomically (temp file + rename); skipped if read-only."""
+    import tempfile
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def git_blob_id(data: bytes) -> str:
+    """The object id git would give these bytes (`git hash-object`)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _git_lines(project_path: str, *args: str) -> Optional[List[str]]:
+    """NUL-separated output of a git command run in project_path; None outside a repo."""
+    try:
+        result = subprocess.run(["git", *args], cwd=project_path, capture_output=True, timeout=60)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return [entry for entry in result.stdout.decode('utf-8', 'surrogateescape').split('\0') if entry]
+
+
+class SecretBaseline:
+    """
+    Secret findings of the last scan, keyed by blob id so unchanged content
+    (wherever it lives) is never rescanned. Tracked files that are clean in
+    the work tree take their id from `git ls-files -s` without being read;
+    everything else (modified, untracked, or no git) is hashed like
+    `git hash-object`, so both sources share one key space.
+    """
+
+    def __init__(self, project_path: str, path: Path = None):
+        root = os.path.abspath(project_path)
+        self.path = path or CACHE_DIR / f"{hashlib.sha1(root.encode('utf-8')).hexdigest()[:16]}.json"
+        # Only a change to the secret patterns themselves invalidates stored results
+        self.version = hashlib.sha256(json.dumps(SECRET_PATTERNS).encode('utf-8')).hexdigest()
+        self.blobs = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == self.version and isinstance(data.get("blobs"), dict):
+                self.blobs = data["blobs"]
+        except (OSError, ValueError, AttributeError):
+            pass
+        self.index = self._clean_index_blobs(project_path)
+
+    @staticmethod
+    def _clean_index_blobs(project_path: str) -> Dict[str, str]:
+        """{path relative to project_path: blob id} for tracked regular files unmodified in the work tree."""
+        staged = _git_lines(project_path, "ls-files", "-s", "-z")
+        if not staged:
+            return {}
+        modified = set(_git_lines(project_path, "ls-files", "-m", "-z") or [])
+        index = {}
+        for entry in staged:
+            info, _, path = entry.partition('\t')
+            mode, oid, stage = info.split()
+            # Symlinks and submodules don't describe the bytes we read; conflicts have no single blob
+            if mode.startswith('100') and stage == '0' and path not in modified:
+                index[path] = oid
+        return index
+
+    def blob_id(self, rel_path: str, filepath: str) -> Optional[str]:
+        oid = self.index.get(Path(rel_path).as_posix())
+        if oid:
+            return oid
+        try:
+            with open(filepath, 'rb') as f:
+                return git_blob_id(f.read())
+        except OSError:
+            return None
+
+    def save(self, fresh: Dict[str, list], seen: set) -> None:
+        """Keep the results for every blob seen in this scan, atomically."""
+        blobs = {oid: self.blobs[oid] for oid in seen if oid in self.blobs}
+        blobs.update(fresh)
+        _write_json(self.path, {"version": self.version, "blobs": blobs})
+        self.blobs = blobs
+
+
+class FileScanner:
+    """Per-file scanner driven by scan_files(); subclasses implement wants/scan/merge/finish."""
+    name = ""
+
+    def spawn(self) -> "FileScanner":
+        """A fresh scanner with the same configuration, for a worker process."""
+        return type(self)()
+
+    def replay(self, filepath: str, rel_path: str) -> bool:
+        """Account for a file from stored results instead of scanning it; True if done."""
+        return False
+
+
+class SecretScanner(FileScanner):
     """
     Validate no hardcoded secrets (OWASP A04).
     Checks: API keys, tokens, passwords, cloud credentials.
+
+    With a SecretBaseline, files whose blob was scanned before replay their
+    stored findings and are not read at all when git knows their blob id.
     """
-    results = {
-        "tool": "secret_scanner",
-        "findings": [],
-        "status": "[OK] No secrets detected",
-        "scanned_files": 0,
-        "by_severity": {"critical": 0, "high": 0, "medium": 0}
-    }
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
-            except Exception:
-                pass
-    
-    if results["by_severity"]["critical"] > 0:
-        results["status"] = "[!!] CRITICAL: Secrets exposed!"
-    elif results["by_severity"]["high"] > 0:
-        results["status"] = "[!] HIGH: Secrets found"
-    elif sum(results["by_severity"].values()) > 0:
-        results["status"] = "[?] Potential secrets detected"
-    
-    # Limit findings for output
-    results["findings"] = results["findings"][:15]
-    
-    return results
+    name = "secrets"
 
+    def __init__(self, baseline: SecretBaseline = None):
+        self.baseline = baseline
+        self.fresh = {}
+        self.seen = set()
+        self.reused = 0
+        self._blob_ids = {}
+        self.results = {
+            "tool": "secret_scanner",
+            "findings": [],
+            "status": "[OK] No secrets detected",
+            "scanned_files": 0,
+            "by_severity": {"critical": 0, "high": 0, "medium": 0}
+        }
+        self.matcher = PatternMatcher(SECRET_PATTERNS)
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+    def wants(self, filename: str, ext: str) -> bool:
+        return ext in CODE_EXTENSIONS or ext in CONFIG_EXTENSIONS
+
+    def spawn(self) -> "SecretScanner":
+        return SecretScanner(self.baseline)
+
+    def replay(self, filepath: str, rel_path: str) -> bool:
+        if self.baseline is None:
+            return False
+        oid = self.baseline.blob_id(rel_path, filepath)
+        if oid is None:
+            return False
+        self.seen.add(oid)
+        stored = self.baseline.blobs.get(oid)
+        if stored is None:
+            self._blob_ids[rel_path] = oid
+            return False
+        self.results["scanned_files"] += 1
+        self.reused += 1
+        for secret_type, severity, count in stored:
+            self._record(rel_path, secret_type, severity, count)
+            self.matcher.hits[secret_type] += count
+        return True
+
+    def scan(self, rel_path: str, content: Optional[str]) -> None:
+        self.results["scanned_files"] += 1
+        if content is None:
+            return
+        found = []
+        for index, count in self.matcher.findall(content):
+            _, secret_type, severity = SECRET_PATTERNS[index]
+            self._record(rel_path, secret_type, severity, count)
+            found.append([secret_type, severity, count])
+        oid = self._blob_ids.pop(rel_path, None)
+        if oid is not None:
+            self.fresh[oid] = found
+
+    def _record(self, rel_path: str, secret_type: str, severity: str, count: int) -> None:
+        self.results["findings"].append({
+            "file": rel_path,
+            "type": secret_type,
+            "severity": severity,
+            "count": count
+        })
+        self.results["by_severity"][severity] += count
+
+    def merge(self, other: "SecretScanner") -> None:
+        """Append a scanner that ran on the files after this one's (parallel shards)."""
+        self.results["findings"].extend(other.results["findings"])
+        self.results["scanned_files"] += other.results["scanned_files"]
+        for severity, count in other.results["by_severity"].items():
+            self.results["by_severity"][severity] += count
+        self.matcher.merge(other.matcher)
+        self.fresh.update(other.fresh)
+        self.seen |= other.seen
+        self.reused += other.reused
+
+    def finish(self, project_path: str) -> Dict[str, Any]:
+        results = self.results
+        if results["by_severity"]["critical"] > 0:
+            results["status"] = "[!!] CRITICAL: Secrets exposed!"
+        elif results["by_severity"]["high"] > 0:
+            results["status"] = "[!] HIGH: Secrets found"
+        elif sum(results["by_severity"].values()) > 0:
+            results["status"] = "[?] Potential secrets detected"
+
+        results["pattern_hits"] = self.matcher.hits
+        if self.baseline is not None:
+            self.baseline.save(self.fresh, self.seen)
+            results["incremental"] = {"reused": self.reused, "scanned": results["scanned_files"] - self.reused}
+
+        # Limit findings for output
+        results["findings"] = results["findings"][:15]
+        return results
+
+
+class PatternScanner(FileScanner):
     """
     Validate dangerous code patterns (OWASP A05).
     Checks: Injection risks, XSS, unsafe deserialization.
     """
-    results = {
-        "tool": "pattern_scanner",
-        "findings": [],
-        "status": "[OK] No dangerous patterns",
-        "scanned_files": 0,
-        "by_category": {}
-    }
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
-            except Exception:
-                pass
-    
-    critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
-    high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
-    
-    if critical_count > 0:
-        results["status"] = f"[!!] CRITICAL: {critical_count} dangerous patterns"
-    elif high_count > 0:
-        results["status"] = f"[!] HIGH: {high_count} risky patterns"
-    elif results["findings"]:
-        results["status"] = "[?] Some patterns need review"
-    
-    # Limit findings
-    results["findings"] = results["findings"][:20]
-    
-    return results
+    name = "code_patterns"
 
+    def __init__(self):
+        self.results = {
+            "tool": "pattern_scanner",
+            "findings": [],
+            "status": "[OK] No dangerous patterns",
+            "scanned_files": 0,
+            "by_category": {}
+        }
+        self.matcher = PatternMatcher(DANGEROUS_PATTERNS)
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+    def wants(self, filename: str, ext: str) -> bool:
+        return ext in CODE_EXTENSIONS
+
+    def scan(self, rel_path: str, content: Optional[str]) -> None:
+        self.results["scanned_files"] += 1
+        if content is None:
+            return
+        lines = content.split('\n')
+        if lines[-1] == '':
+            lines.pop()
+        for line_num, line, index in self.matcher.search_lines(lines):
+            _, name, severity, category = DANGEROUS_PATTERNS[index]
+            self.results["findings"].append({
+                "file": rel_path,
+                "line": line_num,
+                "pattern": name,
+                "severity": severity,
+                "category": category,
+                "snippet": line.strip()[:80]
+            })
+            self.results["by_category"][category] = self.results["by_category"].get(category, 0) + 1
+
+    def merge(self, other: "PatternScanner") -> None:
+        """Append a scanner that ran on the files after this one's (parallel shards)."""
+        self.results["findings"].extend(other.results["findings"])
+        self.results["scanned_files"] += other.results["scanned_files"]
+        for category, count in other.results["by_category"].items():
+            self.results["by_category"][category] = self.results["by_category"].get(category, 0) + count
+        self.matcher.merge(other.matcher)
+
+    def finish(self, project_path: str) -> Dict[str, Any]:
+        results = self.results
+        critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
+        high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
+
+        if critical_count > 0:
+            results["status"] = f"[!!] CRITICAL: {critical_count} dangerous patterns"
+        elif high_count > 0:
+            results["status"] = f"[!] HIGH: {high_count} risky patterns"
+        elif results["findings"]:
+            results["status"] = "[?] Some patterns need review"
+
+        results["pattern_hits"] = self.matcher.hits
+
+        # Limit findings
+        results["findings"] = results["findings"][:20]
+        return results
+
+
+class ConfigScanner(FileScanner):
     """
     Validate security configuration (OWASP A02).
     Checks: Security headers, CORS, debug modes.
     """
-    results = {
-        "tool": "config_scanner",
-        "findings": [],
-        "status": "[OK] Configuration secure",
-        "checks": {}
-    }
-    
-    # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-    ]
-    
+    name = "configuration"
+
+    def __init__(self):
+        self.results = {
+            "tool": "config_scanner",
+            "findings": [],
+            "status": "[OK] Configuration secure",
+            "checks": {}
+        }
+
+    def wants(self, filename: str, ext: str) -> bool:
+        return ext in CONFIG_EXTENSIONS or filename in CONFIG_FILENAMES
+
+    def scan(self, rel_path: str, content: Optional[str]) -> None:
+        if content is None:
+            return
+        for pattern, issue, severity in CONFIG_ISSUES:
+            if re.search(pattern, content, re.IGNORECASE):
+                self.results["findings"].append({
+                    "file": rel_path,
+                    "issue": issue,
+                    "severity": severity
+                })
+
+    def merge(self, other: "ConfigScanner") -> None:
+        """Append a scanner that ran on the files after this one's (parallel shards)."""
+        self.results["findings"].extend(other.results["findings"])
+
+    def finish(self, project_path: str) -> Dict[str, Any]:
+        results = self.results
+        # Check for security header configurations
+        header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
+        for hf in header_files:
+            hf_path = Path(project_path) / hf
+            if hf_path.exists():
+                results["checks"]["security_headers_config"] = True
+                break
+        else:
+            results["checks"]["security_headers_config"] = False
+            results["findings"].append({
+                "issue": "No security headers configuration found",
+                "severity": "medium",
+                "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
+            })
+
+        if any(f["severity"] == "critical" for f in results["findings"]):
+            results["status"] = "[!!] CRITICAL: Configuration issues"
+        elif any(f["severity"] == "high" for f in results["findings"]):
+            results["status"] = "[!] HIGH: Configuration review needed"
+        elif results["findings"]:
+            results["status"] = "[?] Minor configuration issues"
+        return results
+
+
+def collect_files(project_path: str, scanners: list) -> List[tuple]:
+    """
+    Walk the project once. Returns (path, relative path, indexes of the
+    scanners that want it) for every file at least one scanner wants.
+    """
+    items = []
     for root, dirs, files in os.walk(project_path):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
+
         for file in files:
             ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-                
-            filepath = Path(root) / file
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
-    
-    # Check for security header configurations
-    header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
-    for hf in header_files:
-        hf_path = Path(project_path) / hf
-        if hf_path.exists():
-            results["checks"]["security_headers_config"] = True
-            break
+            interested = [i for i, scanner in enumerate(scanners) if scanner.wants(file, ext)]
+            if interested:
+                filepath = Path(root) / file
+                items.append((str(filepath), str(filepath.relative_to(project_path)), interested))
+    return items
+
+
+def _scan_items(items: List[tuple], scanners: list) -> list:
+    """Read each file once (if any scanner still needs it) and hand it to every scanner that wants it."""
+    for filepath, rel_path, interested in items:
+        pending = [i for i in interested if not scanners[i].replay(filepath, rel_path)]
+        if not pending:
+            continue
+        content = read_source(filepath)
+        for i in pending:
+            scanners[i].scan(rel_path, content)
+    return scanners
+
+
+def _scan_shard(items: List[tuple], scanners: list) -> list:
+    """Process-pool worker: fresh scanners run over a contiguous slice of the file list."""
+    return _scan_items(items, scanners)
+
+
+def scan_files(project_path: str, scanners: list, jobs: int = 1) -> Dict[str, Dict[str, Any]]:
+    """
+    Walk the project once, read each file at most once, and hand it to every
+    scanner that wants it. Returns {scanner.name: finished results}.
+
+    With jobs > 1 the file list is split into contiguous shards scanned in a
+    process pool; each shard's scanners are merged back as soon as it (and
+    every shard before it) finishes, so findings, counts and the top-N
+    truncation are identical to a serial run.
+    """
+    items = collect_files(project_path, scanners)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(items) < 2:
+        _scan_items(items, scanners)
     else:
-        results["checks"]["security_headers_config"] = False
-        results["findings"].append({
-            "issue": "No security headers configuration found",
-            "severity": "medium",
-            "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
-        })
-    
-    if any(f["severity"] == "critical" for f in results["findings"]):
-        results["status"] = "[!!] CRITICAL: Configuration issues"
-    elif any(f["severity"] == "high" for f in results["findings"]):
-        results["status"] = "[!] HIGH: Configuration review needed"
-    elif results["findings"]:
-        results["status"] = "[?] Minor configuration issues"
-    
+        from concurrent.futures import ProcessPoolExecutor
+        shard_count = min(len(items), jobs * 4)
+        shards = [items[i * len(items) // shard_count:(i + 1) * len(items) // shard_count] for i in range(shard_count)]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            fresh = ([scanner.spawn() for scanner in scanners] for _ in range(shard_count))
+            for partial in pool.map(_scan_shard, shards, fresh):
+                for scanner, other in zip(scanners, partial):
+                    scanner.merge(other)
+
+    return {scanner.name: scanner.finish(project_path) for scanner in scanners}
+
+
+def scan_secrets(project_path: str, incremental: bool = False) -> Dict[str, Any]:
+    """Validate no hardcoded secrets (OWASP A04); incremental reuses results for unchanged blobs."""
+    baseline = SecretBaseline(project_path) if incremental else None
+    return scan_files(project_path, [SecretScanner(baseline)])["secrets"]
+
+
+HUNK_HEADER_RE = re.compile(r'^@@ -\d+(?:,(\d+))? \+\d+(?:,(\d+))? @@')
+QUOTED_ESCAPE_RE = re.compile(r'\\([0-7]{3}|.)')
+QUOTED_ESCAPES = {'a': 7, 'b': 8, 't': 9, 'n': 10, 'v': 11, 'f': 12, 'r': 13}
+
+
+def _unquote_path(name: str) -> str:
+    """Undo git's C-style quoting of a diff header path ("b/n\\303\\251 w.py")."""
+    if not (len(name) >= 2 and name[0] == name[-1] == '"'):
+        return name
+    # Octal escapes are raw UTF-8 bytes, so rebuild the bytes before decoding
+    raw, pos, body = bytearray(), 0, name[1:-1]
+    for match in QUOTED_ESCAPE_RE.finditer(body):
+        raw += body[pos:match.start()].encode('utf-8')
+        esc = match.group(1)
+        raw.append(int(esc, 8) if len(esc) == 3 else QUOTED_ESCAPES.get(esc, ord(esc)))
+        pos = match.end()
+    raw += body[pos:].encode('utf-8')
+    return raw.decode('utf-8', 'replace')
+
+
+def _added_lines(diff_lines: List[str]) -> Dict[str, List[str]]:
+    """{new path: added lines} from `git diff -U0` output."""
+    added, path = {}, None
+    old_left = new_left = 0
+    for line in diff_lines:
+        if old_left or new_left:
+            # Inside a hunk: counts, not prefixes, say where it ends
+            if line.startswith('+'):
+                new_left -= 1
+                if path:
+                    added.setdefault(path, []).append(line[1:])
+            elif line.startswith('-'):
+                old_left -= 1
+            continue
+        hunk = HUNK_HEADER_RE.match(line)
+        if hunk:
+            old_left = int(hunk.group(1) or 1)
+            new_left = int(hunk.group(2) or 1)
+        elif line.startswith('+++ '):
+            # git ends names containing spaces with a tab and quotes unusual ones
+            target = _unquote_path(line[4:].rstrip('\t'))
+            path = target[2:] if target.startswith('b/') else None
+    return added
+
+
+def scan_secret_diff(project_path: str, rev: str = None) -> Dict[str, Any]:
+    """
+    Secret scan of added lines only, for pre-commit hooks: staged changes by
+    default, or the changes since `rev`. Findings keep the scan_secrets shape;
+    "file" is relative to the repository root.
+    """
+    args = ["-c", "core.quotepath=off", "diff", "-U0", "--no-color", "--no-ext-diff", "--diff-filter=ACMR", "--src-prefix=a/", "--dst-prefix=b/"]
+    args += [rev] if rev else ["--cached"]
+    try:
+        result = subprocess.run(["git", *args], cwd=project_path, capture_output=True, timeout=60)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        result = None
+    scanner = SecretScanner()
+    if result is None or result.returncode != 0:
+        scanner.results["status"] = "[?] git diff unavailable"
+        return scanner.results
+    text = result.stdout.decode('utf-8', 'ignore')
+    for path, lines in _added_lines(text.split('\n')).items():
+        ext = Path(path).suffix.lower()
+        if scanner.wants(Path(path).name, ext):
+            scanner.scan(path, '\n'.join(lines))
+    results = scanner.finish(project_path)
+    results["diff"] = rev or "staged"
     return results
 
 
+def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+    """Validate dangerous code patterns (OWASP A05)."""
+    return scan_files(project_path, [PatternScanner()])["code_patterns"]
+
+
+def scan_configuration(project_path: str) -> Dict[str, Any]:
+    """Validate security configuration (OWASP A02)."""
+    return scan_files(project_path, [ConfigScanner()])["configuration"]
+
+
 # ============================================================================
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
-    """Execute security validation scans."""
+def run_full_scan(project_path: str, scan_type: str = "all", jobs: int = 1,
+                  incremental: bool = False, diff: str = None, cache_audit: bool = False) -> Dict[str, Any]:
+    """
+    Execute security validation scans (file scans in `jobs` processes; 0 = one per CPU).
+    incremental: reuse secret findings for blobs unchanged since the last scan.
+    diff: scan secrets in `git diff` added lines only ("staged" or a revision).
+    cache_audit: reuse the npm audit result while package-lock.json is unchanged.
+    """
     
     report = {
         "project": project_path,
@@ -385,16 +904,29 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
         }
     }
     
-    scanners = {
-        "deps": ("dependencies", scan_dependencies),
-        "secrets": ("secrets", scan_secrets),
-        "patterns": ("code_patterns", scan_code_patterns),
-        "config": ("configuration", scan_configuration),
-    }
-    
-    for key, (name, scanner) in scanners.items():
-        if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
+    # npm audit runs in the background while the file scanners work; leaving the
+    # block, even on an error, stops it
+    wants_audit = scan_type in ("all", "deps") and (Path(project_path) / "package.json").exists()
+    with NpmAudit(project_path, use_cache=cache_audit) if wants_audit else contextlib.nullcontext() as audit:
+        file_scanners = {
+            "secrets": lambda: SecretScanner(SecretBaseline(project_path) if incremental else None),
+            "patterns": PatternScanner,
+            "config": ConfigScanner,
+        }
+        if diff:
+            del file_scanners["secrets"]
+        
+        # Every file-based scan shares a single walk of the project
+        selected = [make() for key, make in file_scanners.items() if scan_type in ("all", key)]
+        results = scan_files(project_path, selected, jobs) if selected else {}
+        if diff and scan_type in ("all", "secrets"):
+            results["secrets"] = scan_secret_diff(project_path, None if diff == "staged" else diff)
+        if scan_type in ("all", "deps"):
+            results["dependencies"] = scan_dependencies(project_path, audit)
+    
+    for name in ("dependencies", "secrets", "code_patterns", "configuration"):
+        if name in results:
+            result = results[name]
             report["scans"][name] = result
             
             findings_count = len(result.get("findings", []))
@@ -427,6 +959,14 @@ def main():
                         default="all", help="Type of scan to run")
     parser.add_argument("--output", choices=["json", "summary"], default="json",
                         help="Output format")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes for file scanning (0 = one per CPU)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only rescan files whose content changed since the last secret scan")
+    parser.add_argument("--cache-audit", action="store_true",
+                        help="Reuse the last npm audit result while package-lock.json is unchanged")
+    parser.add_argument("--diff", nargs="?", const="staged", default=None, metavar="REV",
+                        help="Scan secrets in git diff hunks only (staged changes, or changes since REV)")
     
     args = parser.parse_args()
     
@@ -434,7 +974,8 @@ def main():
         print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
         sys.exit(1)
     
-    result = run_full_scan(args.project_path, args.scan_type)
+    result = run_full_scan(args.project_path, args.scan_type, args.jobs, args.incremental, args.diff,
+                           args.cache_audit)
     
     if args.output == "summary":
         print(f"\n{'='*60}")